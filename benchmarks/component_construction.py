@@ -0,0 +1,133 @@
+"""Benchmark the construction of pipeline components.
+
+Generates a synthetic pipeline with environment-specific overrides and
+reports how many components are constructed per second.
+
+.. code-block:: console
+    python -m benchmarks.component_construction --components 200 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from kpops.api import generate
+
+ENVIRONMENT = "benchmark"
+
+CONFIG: dict[str, Any] = {
+    "kafka_brokers": "http://broker:9092",
+    "topic_name_config": {
+        "default_error_topic_name": "${pipeline.name}-${component.name}-error",
+        "default_output_topic_name": "${pipeline.name}-${component.name}-output",
+    },
+}
+
+DEFAULTS: dict[str, Any] = {
+    "kubernetes-app": {"namespace": "benchmark"},
+    "streams-bootstrap": {
+        "version": "3.0.0",
+        "values": {
+            "image": "registry/${component.type}",
+            "imageTag": "1.0.0",
+            "kafka": {"schemaRegistryUrl": "http://schema-registry:8081"},
+        },
+    },
+    "producer-app": {
+        "to": {
+            "topics": {
+                "${output_topic_name}": {"type": "output", "partitions_count": 3}
+            }
+        }
+    },
+    "streams-app": {
+        "values": {"kafka": {"config": {"large.message.id.generator": "id"}}},
+        "to": {
+            "topics": {
+                "${output_topic_name}": {"type": "output", "partitions_count": 3},
+                "${error_topic_name}": {"type": "error", "partitions_count": 1},
+            }
+        },
+    },
+}
+
+
+def write_project(root: Path, components: int) -> Path:
+    """Write a synthetic KPOps project.
+
+    :param root: Project directory
+    :param components: Number of components in the pipeline
+    :returns: Path to the pipeline definition
+    """
+    pipeline_dir = root / "pipelines" / "benchmark"
+    pipeline_dir.mkdir(parents=True)
+    (root / "config.yaml").write_text(yaml.safe_dump(CONFIG))
+    (root / "defaults.yaml").write_text(yaml.safe_dump(DEFAULTS))
+    pipeline: list[dict[str, Any]] = [
+        {"type": "producer-app", "name": "producer", "values": {"image": "producer"}}
+    ]
+    pipeline += [
+        {
+            "type": "streams-app",
+            "name": f"streams-{i}",
+            "values": {
+                "replicaCount": 1,
+                "labels": {"app": "${component.name}"},
+            },
+        }
+        for i in range(1, components)
+    ]
+    pipeline_env = [
+        {"type": "streams-app", "name": f"streams-{i}", "values": {"replicaCount": 2}}
+        for i in range(1, components, 2)
+    ]
+    pipeline_path = pipeline_dir / "pipeline.yaml"
+    pipeline_path.write_text(yaml.safe_dump(pipeline))
+    (pipeline_dir / f"pipeline_{ENVIRONMENT}.yaml").write_text(
+        yaml.safe_dump(pipeline_env)
+    )
+    return pipeline_path
+
+
+def run(components: int, repeat: int) -> float:
+    """Generate the synthetic pipeline several times.
+
+    :param components: Number of components in the pipeline
+    :param repeat: Number of measured runs
+    :returns: Best throughput in components per second
+    """
+    with tempfile.TemporaryDirectory() as tmp, contextlib.chdir(tmp):
+        root = Path()
+        pipeline_path = write_project(root, components)
+        throughput = 0.0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            pipeline = generate(pipeline_path, config=root, environment=ENVIRONMENT)
+            elapsed = time.perf_counter() - start
+            assert len(pipeline) == components
+            throughput = max(throughput, components / elapsed)
+    return throughput
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the construction of pipeline components."
+    )
+    parser.add_argument("--components", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    throughput = run(args.components, args.repeat)
+    print(f"{throughput:.1f} components/s ({args.components} components)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Benchmark the parsing of large Kubernetes manifest streams.
+
+Generates a synthetic ``helm template`` output and reports how many manifests
+are parsed per second.
+
+.. code-block:: console
+    python -m benchmarks.manifest_parsing --releases 100 --repeat 5
+    python -m benchmarks.manifest_parsing --pure  # without libyaml
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import time
+from typing import Any
+from unittest import mock
+
+import yaml
+
+from kpops.component_handlers.helm.helm import Helm
+
+TEMPLATES = ("deployment", "service", "configmap", "pod-disruption-budget")
+
+
+def manifest(release: int, template: str) -> dict[str, Any]:
+    """Build a Kubernetes manifest.
+
+    :param release: Index of the Helm release
+    :param template: Name of the template
+    :returns: Kubernetes manifest
+    """
+    name = f"release-{release}-{template}"
+    return {
+        "apiVersion": "v1",
+        "kind": template.title().replace("-", ""),
+        "metadata": {
+            "name": name,
+            "labels": {"app": name, "release": f"release-{release}"},
+            "annotations": {"checksum/config": "0" * 64},
+        },
+        "spec": {
+            "replicas": 1,
+            "template": {
+                "spec": {
+                    "containers": [
+                        {
+                            "name": name,
+                            "image": "registry/app:1.0.0",
+                            "env": [
+                                {"name": f"ENV_{i}", "value": str(i)} for i in range(20)
+                            ],
+                            "args": ["--config", "|\nkey=value\nother=value\n"],
+                        }
+                    ]
+                }
+            },
+        },
+    }
+
+
+def helm_template(releases: int) -> str:
+    """Generate the output of ``helm template`` for several releases.
+
+    :param releases: Number of Helm releases
+    :returns: YAML stream of all manifests
+    """
+    documents = [
+        f"---\n# Source: chart/templates/{template}.yaml\n"
+        + yaml.safe_dump(manifest(release, template))
+        for release in range(releases)
+        for template in TEMPLATES
+    ]
+    return "".join(documents)
+
+
+def run(releases: int, repeat: int) -> float:
+    """Parse the synthetic manifest stream several times.
+
+    :param releases: Number of Helm releases
+    :param repeat: Number of measured runs
+    :returns: Best throughput in manifests per second
+    """
+    stream = helm_template(releases)
+    manifests = releases * len(TEMPLATES)
+    throughput = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parsed = list(Helm.load_manifest(stream))
+        elapsed = time.perf_counter() - start
+        assert len(parsed) == manifests
+        throughput = max(throughput, manifests / elapsed)
+    return throughput
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the parsing of large Kubernetes manifest streams."
+    )
+    parser.add_argument("--releases", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--pure", action="store_true", help="use the pure Python YAML loader"
+    )
+    args = parser.parse_args()
+    with contextlib.ExitStack() as stack:
+        if args.pure:
+            stack.enter_context(
+                mock.patch("kpops.utils.yaml.SafeLoader", yaml.SafeLoader)
+            )
+        throughput = run(args.releases, args.repeat)
+    print(f"{throughput:.1f} manifests/s ({args.releases * len(TEMPLATES)} manifests)")
+
+
+if __name__ == "__main__":
+    main()
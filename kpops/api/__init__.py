@@ -5,14 +5,14 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from kpops.api.options import FilterType
-from kpops.component_handlers import ComponentHandlers
+from kpops.component_handlers import ComponentHandlers, get_handlers
 from kpops.component_handlers.kafka_connect.kafka_connect_handler import (
     KafkaConnectHandler,
 )
 from kpops.component_handlers.schema_handler.schema_handler import SchemaHandler
 from kpops.component_handlers.topic.handler import TopicHandler
 from kpops.component_handlers.topic.kafka_rest import KafkaRest
-from kpops.config import KpopsConfig
+from kpops.config import KpopsConfig, get_config
 from kpops.core.operation import OperationMode
 from kpops.core.registry import Registry
 from kpops.pipeline import (
@@ -81,6 +81,7 @@ def manifest_deploy(
     environment: str | None = None,
     verbose: bool = True,
     operation_mode: OperationMode = OperationMode.MANIFEST,
+    parallel: bool = False,
 ) -> Iterator[tuple[KubernetesManifest, ...]]:
     pipeline = generate(
         pipeline_path=pipeline_path,
@@ -92,7 +93,7 @@ def manifest_deploy(
         verbose=verbose,
         operation_mode=operation_mode,
     )
-    yield from pipeline.manifest_deploy()
+    yield from pipeline.manifest_deploy(parallel, get_config().max_concurrency)
 
 
 def manifest_destroy(
@@ -104,6 +105,7 @@ def manifest_destroy(
     environment: str | None = None,
     verbose: bool = True,
     operation_mode: OperationMode = OperationMode.MANIFEST,
+    parallel: bool = False,
 ) -> Iterator[tuple[KubernetesManifest, ...]]:
     pipeline = generate(
         pipeline_path=pipeline_path,
@@ -115,7 +117,7 @@ def manifest_destroy(
         verbose=verbose,
         operation_mode=operation_mode,
     )
-    yield from pipeline.manifest_destroy()
+    yield from pipeline.manifest_destroy(parallel, get_config().max_concurrency)
 
 
 def manifest_reset(
@@ -127,6 +129,7 @@ def manifest_reset(
     environment: str | None = None,
     verbose: bool = True,
     operation_mode: OperationMode = OperationMode.MANIFEST,
+    parallel: bool = False,
 ) -> Iterator[tuple[KubernetesManifest, ...]]:
     pipeline = generate(
         pipeline_path=pipeline_path,
@@ -138,7 +141,7 @@ def manifest_reset(
         verbose=verbose,
         operation_mode=operation_mode,
     )
-    yield from pipeline.manifest_reset()
+    yield from pipeline.manifest_reset(parallel, get_config().max_concurrency)
 
 
 def manifest_clean(
@@ -150,6 +153,7 @@ def manifest_clean(
     environment: str | None = None,
     verbose: bool = True,
     operation_mode: OperationMode = OperationMode.MANIFEST,
+    parallel: bool = False,
 ) -> Iterator[tuple[KubernetesManifest, ...]]:
     pipeline = generate(
         pipeline_path=pipeline_path,
@@ -161,7 +165,7 @@ def manifest_clean(
         verbose=verbose,
         operation_mode=operation_mode,
     )
-    yield from pipeline.manifest_clean()
+    yield from pipeline.manifest_clean(parallel, get_config().max_concurrency)
 
 
 def deploy(
@@ -196,7 +200,8 @@ def deploy(
         environment=environment,
         verbose=verbose,
     )
-    asyncio.run(pipeline.deploy(dry_run, parallel))
+    asyncio.run(pipeline.deploy(dry_run, parallel, get_config().max_concurrency))
+    get_handlers().connector_handler.log_summary()
 
 
 def destroy(
@@ -231,7 +236,7 @@ def destroy(
         environment=environment,
         verbose=verbose,
     )
-    asyncio.run(pipeline.destroy(dry_run, parallel))
+    asyncio.run(pipeline.destroy(dry_run, parallel, get_config().max_concurrency))
 
 
 def reset(
@@ -266,7 +271,7 @@ def reset(
         environment=environment,
         verbose=verbose,
     )
-    asyncio.run(pipeline.reset(dry_run, parallel))
+    asyncio.run(pipeline.reset(dry_run, parallel, get_config().max_concurrency))
 
 
 def clean(
@@ -301,7 +306,7 @@ def clean(
         environment=environment,
         verbose=verbose,
     )
-    asyncio.run(pipeline.clean(dry_run, parallel))
+    asyncio.run(pipeline.clean(dry_run, parallel, get_config().max_concurrency))
 
 
 def init(
@@ -351,6 +356,6 @@ def _setup_handlers(config: KpopsConfig) -> ComponentHandlers:
     schema_handler = SchemaHandler.load_schema_handler(config)
     connector_handler = KafkaConnectHandler.from_kpops_config(config)
     kafka_rest = KafkaRest(config.kafka_rest)
-    topic_handler = TopicHandler(kafka_rest)
+    topic_handler = TopicHandler(kafka_rest, prefetch=config.kafka_rest.prefetch)
 
     return ComponentHandlers(schema_handler, connector_handler, topic_handler)
@@ -196,6 +196,7 @@ def deploy(
                     environment,
                     verbose,
                     operation_mode,
+                    parallel,
                 )
                 for resource in resources:
                     for rendered_manifest in resource:
@@ -240,6 +241,7 @@ def destroy(
                     environment,
                     verbose,
                     operation_mode,
+                    parallel,
                 )
                 for resource in resources:
                     for rendered_manifest in resource:
@@ -284,6 +286,7 @@ def reset(
                     environment,
                     verbose,
                     operation_mode,
+                    parallel,
                 )
                 for resource in resources:
                     for rendered_manifest in resource:
@@ -328,6 +331,7 @@ def clean(
                     environment,
                     verbose,
                     operation_mode,
+                    parallel,
                 )
                 for resource in resources:
                     for rendered_manifest in resource:
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, final
+
+import structlog
+
+from kpops.component_handlers.helm import HELM
+from kpops.component_handlers.helm.model import Version
+from kpops.utils.files import write_atomic
+
+if TYPE_CHECKING:
+    from kpops.component_handlers.helm.model import HelmTemplateFlags
+
+log = structlog.get_logger(HELM)
+
+
+@final
+class HelmTemplateCache:
+    """On-disk cache for the output of `helm template`.
+
+    Rendered templates are stored under a key derived from everything that
+    influences the output of `helm template`, i.e. the Helm version, release
+    name, chart, namespace, flags and values. Only charts with a pinned version
+    from a repository are cached, as the content of local charts and unpinned
+    charts can change without a change of the key.
+
+    :param directory: Directory in which rendered templates are stored
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    @staticmethod
+    def key(
+        helm_version: Version,
+        release_name: str,
+        chart: str,
+        namespace: str,
+        values: dict[str, Any],
+        flags: HelmTemplateFlags,
+    ) -> str | None:
+        """Compute the cache key for rendering a Helm chart.
+
+        :param helm_version: Version of the Helm binary
+        :param release_name: The release name
+        :param chart: Helm chart to be templated
+        :param namespace: The Kubernetes namespace
+        :param values: Helm values
+        :param flags: Flags for `helm template`
+        :return: Cache key, None if the chart cannot be cached
+        """
+        if not flags.version or Path(chart).exists():
+            return None
+        try:
+            set_files = {
+                key: hashlib.sha256(path.read_bytes()).hexdigest()
+                for key, path in flags.set_file.items()
+            }
+        except OSError:
+            return None
+        content = json.dumps(
+            {
+                "helm_version": [
+                    helm_version.major,
+                    helm_version.minor,
+                    helm_version.patch,
+                ],
+                "release_name": release_name,
+                "chart": chart,
+                "namespace": namespace,
+                "flags": flags.model_dump(mode="json"),
+                "set_files": set_files,
+                "values": values,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Read the rendered templates stored under a key.
+
+        :param key: Cache key
+        :return: Output of `helm template`, None if not cached
+        """
+        try:
+            output = self.__path(key).read_text()
+        except OSError:
+            return None
+        log.debug("Using cached Helm template.", key=key)
+        return output
+
+    def set(self, key: str, output: str) -> None:
+        """Store rendered templates under a key.
+
+        :param key: Cache key
+        :param output: Output of `helm template`
+        """
+        try:
+            write_atomic(self.__path(key), output)
+        except OSError as e:
+            log.warning("Could not cache Helm template.", error=str(e))
+
+    def __path(self, key: str) -> Path:
+        return self.directory / f"{key}.yaml"
+
+
+@final
+class HelmVersionCache:
+    """On-disk cache for the version of the Helm binary.
+
+    Versions are stored under a key derived from the resolved path and the
+    modification time of the binary, so that replacing or upgrading Helm
+    invalidates the cached version.
+
+    :param directory: Directory in which versions are stored
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    @staticmethod
+    def key(binary: Path) -> str | None:
+        """Compute the cache key for a Helm binary.
+
+        :param binary: Path of the Helm binary
+        :return: Cache key, None if the binary cannot be accessed
+        """
+        try:
+            binary = binary.resolve()
+            stat = binary.stat()
+        except OSError:
+            return None
+        content = f"{binary}:{stat.st_mtime_ns}:{stat.st_size}"
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, key: str) -> Version | None:
+        """Read the version stored under a key.
+
+        :param key: Cache key
+        :return: Version of the Helm binary, None if not cached
+        """
+        try:
+            version = Version(**json.loads(self.__path(key).read_text()))
+        except (OSError, ValueError, TypeError):
+            return None
+        log.debug("Using cached Helm version.", version=version)
+        return version
+
+    def set(self, key: str, version: Version) -> None:
+        """Store a version under a key.
+
+        :param key: Cache key
+        :param version: Version of the Helm binary
+        """
+        try:
+            write_atomic(self.__path(key), json.dumps(asdict(version)))
+        except OSError as e:
+            log.warning("Could not cache Helm version.", error=str(e))
+
+    def __path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
@@ -13,7 +13,7 @@ class DryRunHandler:
         self._helm_diff = helm_diff
         self.namespace = namespace
 
-    def print_helm_diff(
+    async def print_helm_diff(
         self, stdout: str, helm_release_name: str, log: structlog.stdlib.BoundLogger
     ) -> None:
         """Print the diff of the last and current release of this component.
@@ -22,9 +22,12 @@ class DryRunHandler:
         :param helm_release_name: The Helm release name
         :param log: The Logger object of the component class
         """
-        current_release = list(
-            self._helm.get_manifest(helm_release_name, self.namespace)
-        )
+        if await self._helm.release_exists(helm_release_name, self.namespace) is False:
+            current_release = []
+        else:
+            current_release = list(
+                await self._helm.get_manifest(helm_release_name, self.namespace)
+            )
         if current_release:
             log.info("Helm release already exists", release=helm_release_name)
         else:
@@ -2,18 +2,16 @@ from __future__ import annotations
 
 import asyncio
 import re
-import subprocess
-import tempfile
-from collections.abc import Hashable
-from functools import cached_property
+import shutil
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Self, final
 
 import structlog
-import yaml
-from cachetools import cached
+from pydantic import TypeAdapter
 
 from kpops.component_handlers.helm import HELM
+from kpops.component_handlers.helm.cache import HelmTemplateCache, HelmVersionCache
 from kpops.component_handlers.helm.exception import (
     HelmError,
     ReleaseNotFoundException,
@@ -21,6 +19,8 @@ from kpops.component_handlers.helm.exception import (
 from kpops.component_handlers.helm.model import (
     HelmChart,
     HelmConfig,
+    HelmRelease,
+    HelmReleaseInventory,
     HelmTemplate,
     HelmTemplateFlags,
     HelmUpgradeInstallFlags,
@@ -28,7 +28,9 @@ from kpops.component_handlers.helm.model import (
     Version,
 )
 from kpops.manifests.kubernetes import KubernetesManifest
+from kpops.utils.concurrency import ConcurrencyLimiter, RunCache
 from kpops.utils.logging import bound_service_context
+from kpops.utils.yaml import safe_dump, safe_load
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
@@ -36,19 +38,13 @@ if TYPE_CHECKING:
 
 log = structlog.get_logger(HELM)
 
-
-def cache_key(
-    _: Helm,
-    repository_name: str,
-    repository_url: str,
-    repo_auth_flags: RepoAuthFlags | None = None,
-) -> Hashable:
-    return repository_name, repository_url
+HELM_RELEASES_ADAPTER = TypeAdapter(list[HelmRelease])
 
 
 @final
 class Helm:
     _instance: Self | None = None
+    _limiter: ConcurrencyLimiter = ConcurrencyLimiter(None)
 
     def __new__(cls, *args: Any, **kwargs: Any) -> Self:
         """Return singleton instance."""
@@ -59,13 +55,57 @@ class Helm:
     def __init__(self, helm_config: HelmConfig) -> None:
         self._context = helm_config.context
         self._debug = helm_config.debug
+        self._template_cache = (
+            HelmTemplateCache(helm_config.template_cache)
+            if helm_config.template_cache
+            else None
+        )
+        self._version_cache = (
+            HelmVersionCache(helm_config.version_cache)
+            if helm_config.version_cache
+            else None
+        )
+        self._release_inventory = helm_config.release_inventory
+        self._repo_update_ttl = helm_config.repo_update_ttl
+        # keep the repositories and release inventories of the singleton across components
+        if "_inventories" not in vars(self):
+            self._repositories: dict[tuple[str, str], RunCache[None]] = {}
+            self._added_repositories: set[tuple[str, str]] = set()
+            self._repository_cache: Path | None = None
+            self._inventories: dict[str, RunCache[HelmReleaseInventory | None]] = {}
+            self._version: Version | None = None
+            self._version_probe = RunCache(self.__detect_version)
+        # keep the limiter of the singleton while Helm processes may be running
+        if self._limiter.limit != helm_config.max_concurrency:
+            self._limiter = ConcurrencyLimiter(helm_config.max_concurrency)
+
+    async def add_repo(
+        self,
+        repository_name: str,
+        repository_url: str,
+        repo_auth_flags: RepoAuthFlags | None = None,
+    ) -> None:
+        """Add and update a Helm repository once per process.
 
-        if self.version.major < 3 or self.version.major > 4:
-            msg = f"The supported Helm version is 3.x.x|4.x.x. The current Helm version is {self.version.major}.{self.version.minor}.{self.version.patch}"
-            raise RuntimeError(msg)
+        Concurrent calls for the same repository share a single `helm repo add`.
 
-    @cached(cache={}, key=cache_key)
-    def add_repo(
+        :param repository_name: Name of the repository
+        :param repository_url: URL of the repository
+        :param repo_auth_flags: Authentication flags of the repository
+        """
+        key = repository_name, repository_url
+        if key in self._added_repositories:
+            return
+        if (repository := self._repositories.get(key)) is None:
+            repository = self._repositories[key] = RunCache(
+                lambda: self.__add_repo(
+                    repository_name, repository_url, repo_auth_flags
+                )
+            )
+        await repository.get()
+        self._added_repositories.add(key)
+
+    async def __add_repo(
         self,
         repository_name: str,
         repository_url: str,
@@ -80,13 +120,14 @@ class Helm:
             repository_name,
             repository_url,
         ]
-        command.extend(repo_auth_flags.to_command(self.version))
+        version = await self.get_version()
+        command.extend(repo_auth_flags.to_command(version))
 
         with bound_service_context(
             repository_name=repository_name, repository_url=repository_url
         ):
             try:
-                self.__execute(command)
+                await self.__async_execute(command)
             except HelmError as e:
                 if re.match(
                     "Error: repository name (.*) already exists, please specify a different name",
@@ -96,10 +137,31 @@ class Helm:
                 else:
                     raise
 
-            if self.version.major >= 4 or self.version.minor >= 7:
-                self.__execute(["helm", "repo", "update", repository_name])
+            if await self.__is_repo_index_fresh(repository_name):
+                log.debug("Repository index is up to date. Skipping update.")
+                return
+            if version.major >= 4 or version.minor >= 7:
+                await self.__async_execute(["helm", "repo", "update", repository_name])
             else:
-                self.__execute(["helm", "repo", "update"])
+                await self.__async_execute(["helm", "repo", "update"])
+
+    async def __is_repo_index_fresh(self, repository_name: str) -> bool:
+        if self._repo_update_ttl is None:
+            return False
+        if self._repository_cache is None:
+            stdout = await self.__async_execute(
+                ["helm", "env", "HELM_REPOSITORY_CACHE"]
+            )
+            self._repository_cache = Path(stdout.strip())
+        age = Helm.__file_age(self._repository_cache / f"{repository_name}-index.yaml")
+        return age is not None and age < self._repo_update_ttl
+
+    @staticmethod
+    def __file_age(path: Path) -> float | None:
+        try:
+            return time.time() - path.stat().st_mtime
+        except FileNotFoundError:
+            return None
 
     async def upgrade_install(
         self,
@@ -113,12 +175,7 @@ class Helm:
         """Prepare and execute the `helm upgrade --install` command."""
         if flags is None:
             flags = HelmUpgradeInstallFlags()
-        with (
-            bound_service_context(release_name=release_name, namespace=namespace),
-            tempfile.NamedTemporaryFile("w", delete=False) as values_file,
-        ):
-            yaml.safe_dump(values, values_file)
-
+        with bound_service_context(release_name=release_name, namespace=namespace):
             command = [
                 "helm",
                 "upgrade",
@@ -128,12 +185,15 @@ class Helm:
                 "--namespace",
                 namespace,
                 "--values",
-                values_file.name,
+                "-",
             ]
-            command.extend(flags.to_command(self.version))
+            command.extend(flags.to_command(await self.get_version()))
             if dry_run:
                 command.append("--dry-run")
-            return await self.__async_execute(command)
+            stdout = await self.__async_execute(command, stdin=safe_dump(values))
+        if not dry_run:
+            await self.__invalidate(release_name, namespace)
+        return stdout
 
     async def uninstall(
         self,
@@ -153,9 +213,13 @@ class Helm:
             command.append("--dry-run")
         with bound_service_context(release_name=release_name, namespace=namespace):
             try:
-                return await self.__async_execute(command)
+                stdout = await self.__async_execute(command)
             except ReleaseNotFoundException:
                 log.warning("Release not found. Could not uninstall app.")
+                return None
+        if not dry_run:
+            await self.__invalidate(release_name, namespace)
+        return stdout
 
     async def get_values(
         self,
@@ -174,13 +238,83 @@ class Helm:
             "yaml",
         ]
         with bound_service_context(release_name=release_name, namespace=namespace):
+            if await self.release_exists(release_name, namespace) is False:
+                log.warning("Release not found. Could not get values.")
+                return None
             try:
                 command_result = await self.__async_execute(command)
-                return yaml.safe_load(command_result)
+                return safe_load(command_result)
             except ReleaseNotFoundException:
                 log.warning("Release not found. Could not get values.")
 
-    def template(
+    async def get_release(
+        self, release_name: str, namespace: str
+    ) -> HelmRelease | None:
+        """Prepare and execute the `helm list` command for a single release.
+
+        :param release_name: The release name
+        :param namespace: The Kubernetes namespace of the release
+        :return: The release, None if it does not exist
+        """
+        inventory = await self.__inventory(namespace)
+        if inventory is not None and release_name not in inventory.invalidated:
+            return inventory.releases.get(release_name)
+        command = [
+            "helm",
+            "list",
+            "--namespace",
+            namespace,
+            "--filter",
+            f"^{re.escape(release_name)}$",
+            "--all",
+            "--output",
+            "json",
+        ]
+        with bound_service_context(release_name=release_name, namespace=namespace):
+            stdout = await self.__async_execute(command)
+        for release in HELM_RELEASES_ADAPTER.validate_json(stdout):
+            if release.name == release_name:
+                return release
+        return None
+
+    async def list_releases(self, namespace: str) -> dict[str, HelmRelease]:
+        """Prepare and execute the `helm list` command for all releases in a namespace.
+
+        :param namespace: The Kubernetes namespace
+        :return: Releases in the namespace by name
+        """
+        command = [
+            "helm",
+            "list",
+            "--namespace",
+            namespace,
+            "--all",
+            "--max",
+            "0",
+            "--output",
+            "json",
+        ]
+        with bound_service_context(namespace=namespace):
+            stdout = await self.__async_execute(command)
+        return {
+            release.name: release
+            for release in HELM_RELEASES_ADAPTER.validate_json(stdout)
+        }
+
+    async def release_exists(self, release_name: str, namespace: str) -> bool | None:
+        """Check whether a release exists using the release inventory.
+
+        :param release_name: The release name
+        :param namespace: The Kubernetes namespace of the release
+        :return: Whether the release exists, None if unknown because the
+            inventory is disabled or the release was modified during the run
+        """
+        inventory = await self.__inventory(namespace)
+        if inventory is None or release_name in inventory.invalidated:
+            return None
+        return release_name in inventory.releases
+
+    async def template(
         self,
         release_name: str,
         chart: str,
@@ -203,13 +337,21 @@ class Helm:
         """
         if flags is None:
             flags = HelmTemplateFlags()
-        with (
-            bound_service_context(
-                release_name=release_name, chart=chart, namespace=namespace
-            ),
-            tempfile.NamedTemporaryFile(mode="w", delete=False) as values_file,
+        version = await self.get_version()
+        template_key = (
+            HelmTemplateCache.key(
+                version, release_name, chart, namespace, values, flags
+            )
+            if self._template_cache
+            else None
+        )
+        if self._template_cache and template_key:
+            output = self._template_cache.get(template_key)
+            if output is not None:
+                return tuple(KubernetesManifest.from_yaml(output))
+        with bound_service_context(
+            release_name=release_name, chart=chart, namespace=namespace
         ):
-            yaml.safe_dump(values, values_file)
             command = [
                 "helm",
                 "template",
@@ -218,14 +360,18 @@ class Helm:
                 "--namespace",
                 namespace,
                 "--values",
-                values_file.name,
+                "-",
             ]
-            command.extend(flags.to_command(self.version))
-            output = self.__execute(command)
-            manifests = KubernetesManifest.from_yaml(output)
-            return tuple(manifests)
-
-    def get_manifest(self, release_name: str, namespace: str) -> Iterable[HelmTemplate]:
+            command.extend(flags.to_command(version))
+            output = await self.__async_execute(command, stdin=safe_dump(values))
+            manifests = tuple(KubernetesManifest.from_yaml(output))
+        if self._template_cache and template_key:
+            self._template_cache.set(template_key, output)
+        return manifests
+
+    async def get_manifest(
+        self, release_name: str, namespace: str
+    ) -> Iterable[HelmTemplate]:
         command = [
             "helm",
             "get",
@@ -237,21 +383,43 @@ class Helm:
 
         with bound_service_context(release_name=release_name, namespace=namespace):
             try:
-                stdout = self.__execute(command=command)
+                stdout = await self.__async_execute(command)
                 return Helm.load_manifest(stdout)
             except ReleaseNotFoundException:
                 return ()
 
-    @cached_property
-    def version(self) -> Version:
+    async def get_version(self) -> Version:
+        """Detect the version of the Helm binary once per process.
+
+        :raises RuntimeError: The version cannot be parsed or is not supported
+        :return: Version of the Helm binary
+        """
+        if self._version is None:
+            version = await self._version_probe.get()
+            if version.major < 3 or version.major > 4:
+                msg = f"The supported Helm version is 3.x.x|4.x.x. The current Helm version is {version.major}.{version.minor}.{version.patch}"
+                raise RuntimeError(msg)
+            self._version = version
+        return self._version
+
+    async def __detect_version(self) -> Version:
+        version_key = None
+        if self._version_cache and (binary := shutil.which("helm")):
+            version_key = HelmVersionCache.key(Path(binary))
+        if self._version_cache and version_key:
+            version = self._version_cache.get(version_key)
+            if version is not None:
+                return version
         command = ["helm", "version", "--short"]
-        short_version = self.__execute(command)
+        short_version = await self.__async_execute(command)
         version_match = re.search(r"^v(\d+(?:\.\d+){0,2})", short_version)
         if version_match is None:
             msg = f"Could not parse the Helm version.\n\nHelm output:\n{short_version}"
             raise RuntimeError(msg)
-        version = map(int, version_match.group(1).split("."))
-        return Version(*version)
+        version = Version(*map(int, version_match.group(1).split(".")))
+        if self._version_cache and version_key:
+            self._version_cache.set(version_key, version)
+        return version
 
     @staticmethod
     def load_manifest(yaml_contents: str) -> Iterator[HelmTemplate]:
@@ -275,29 +443,53 @@ class Helm:
             else:
                 current_yaml_doc.append(line)
 
-    def __execute(self, command: list[str]) -> str:
-        command = self.__set_global_flags(command)
-        log.debug("Executing command.", command=" ".join(command))
-        process = subprocess.run(
-            command,
-            check=False,
-            capture_output=True,
-            text=True,
-        )
-        Helm.parse_helm_command_stderr_output(process.stderr)
-        log.debug("Command output.", stdout=process.stdout)
-        return process.stdout
+    async def __inventory(self, namespace: str) -> HelmReleaseInventory | None:
+        if not self._release_inventory:
+            return None
+        if (inventory := self._inventories.get(namespace)) is None:
+            inventory = self._inventories[namespace] = RunCache(
+                lambda: self.__fetch_inventory(namespace)
+            )
+        return await inventory.get()
+
+    async def __fetch_inventory(self, namespace: str) -> HelmReleaseInventory | None:
+        try:
+            releases = await self.list_releases(namespace)
+        except HelmError as e:
+            log.warning(
+                "Could not list Helm releases. Falling back to lookups per release.",
+                namespace=namespace,
+                error=e.stderr,
+            )
+            return None
+        log.debug("Listed Helm releases.", namespace=namespace, releases=len(releases))
+        return HelmReleaseInventory(releases=releases)
+
+    async def __invalidate(self, release_name: str, namespace: str) -> None:
+        if inventory := await self.__inventory(namespace):
+            inventory.invalidated.add(release_name)
+
+    async def __async_execute(
+        self, command: list[str], stdin: str | None = None
+    ) -> str:
+        """Execute a Helm command.
 
-    async def __async_execute(self, command: list[str]) -> str:
+        :param command: The Helm command
+        :param stdin: Input of the command, e.g. values passed with `--values -`
+        :return: The output of the command
+        """
         command = self.__set_global_flags(command)
-        log.debug("Executing command.", command=" ".join(command))
-        proc = await asyncio.create_subprocess_exec(
-            *command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-
-        stdout, stderr = await proc.communicate()
+        async with self._limiter:
+            log.debug("Executing command.", command=" ".join(command))
+            proc = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=asyncio.subprocess.PIPE if stdin is not None else None,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, stderr = await proc.communicate(
+                stdin.encode() if stdin is not None else None
+            )
         Helm.parse_helm_command_stderr_output(stderr.decode())
         log.debug("Command output.", stdout=stdout)
         return stdout.decode()
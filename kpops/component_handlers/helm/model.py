@@ -1,9 +1,9 @@
 from collections.abc import Iterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import ClassVar
 
-from pydantic import ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, NonNegativeInt, PositiveInt
 from typing_extensions import override
 
 from kpops.component_handlers.helm.exception import ParseError
@@ -85,6 +85,12 @@ class HelmConfig(DescConfigModel):
     :param api_version: Kubernetes API version used for `Capabilities.APIVersions`
     :param timeout: Helm flag --timeout. Duration to wait for any individual Kubernetes operation
     :param force_replace: Helm flag --force-replace. Forces resource updates by replacement
+    :param max_concurrency: Maximum number of concurrent Helm processes. Unlimited if not set
+    :param template_cache: Directory to cache rendered Helm templates in, e.g. for manifest commands. Disabled if not set
+    :param version_cache: Directory to cache the detected Helm version in, keyed by path and modification time of the binary. Disabled if not set
+    :param skip_unchanged: Skip `helm upgrade` for deployed releases whose values and chart version are unchanged
+    :param release_inventory: List the releases of each namespace once per run instead of looking up each release
+    :param repo_update_ttl: Skip `helm repo update` if the index of the repository is younger than this number of seconds. Always update if not set
     """
 
     context: str | None = Field(default=None, examples=["dev-storage"])
@@ -92,6 +98,18 @@ class HelmConfig(DescConfigModel):
     api_version: str | None = Field(default=None, title="API version")
     timeout: str | None = Field(default=None, title="Helm flag --timeout")
     force_replace: bool = Field(default=False, title="Force Upgrade")
+    max_concurrency: PositiveInt | None = Field(default=None, title="Max Concurrency")
+    template_cache: Path | None = Field(
+        default=None, title="Template Cache", examples=[".kpops/helm-templates"]
+    )
+    version_cache: Path | None = Field(
+        default=None, title="Version Cache", examples=[".kpops/helm-version"]
+    )
+    skip_unchanged: bool = Field(default=False, title="Skip Unchanged")
+    release_inventory: bool = Field(default=False, title="Release Inventory")
+    repo_update_ttl: NonNegativeInt | None = Field(
+        default=None, title="Repo Update TTL"
+    )
 
 
 class HelmFlags(RepoAuthFlags):
@@ -149,6 +167,49 @@ class HelmTemplateFlags(HelmFlags):
         return command
 
 
+class HelmRelease(BaseModel):
+    """Release as listed by `helm list --output json`.
+
+    :param name: Name of the release
+    :param namespace: Namespace of the release
+    :param revision: Revision of the release
+    :param status: Status of the release, e.g. deployed or failed
+    :param chart: Chart name and version, e.g. streams-app-3.0.0
+    :param app_version: App version of the chart
+    """
+
+    name: str
+    namespace: str
+    revision: str
+    status: str
+    chart: str
+    app_version: str
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(extra="allow")
+
+    def is_deployed(self, chart: str, version: str) -> bool:
+        """Whether the release is deployed with the given chart version.
+
+        :param chart: Helm chart, e.g. bakdata-streams-bootstrap/streams-app
+        :param version: Version of the Helm chart
+        :return: True if the release is deployed with the chart version
+        """
+        chart_name = chart.rstrip("/").rsplit("/", 1)[-1]
+        return self.status == "deployed" and self.chart == f"{chart_name}-{version}"
+
+
+@dataclass
+class HelmReleaseInventory:
+    """Releases of a namespace, listed once per run.
+
+    :param releases: Releases in the namespace by name
+    :param invalidated: Releases that were modified after the inventory was listed
+    """
+
+    releases: dict[str, HelmRelease]
+    invalidated: set[str] = field(default_factory=set)
+
+
 HELM_SOURCE_PREFIX = "# Source: "
 
 
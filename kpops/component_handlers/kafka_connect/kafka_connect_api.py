@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+from collections import Counter
 from contextlib import suppress
 from typing import TYPE_CHECKING, Any, final
 
 import httpx2
 import structlog
+from pydantic import TypeAdapter
 
 from kpops.component_handlers.kafka_connect import KAFKA_CONNECT
 from kpops.component_handlers.kafka_connect.exception import (
@@ -14,6 +16,7 @@ from kpops.component_handlers.kafka_connect.exception import (
     KafkaConnectError,
 )
 from kpops.component_handlers.kafka_connect.model import (
+    ConnectorInfoStatusResponse,
     ConnectorNewState,
     ConnectorResponse,
     ConnectorStatusResponse,
@@ -21,7 +24,9 @@ from kpops.component_handlers.kafka_connect.model import (
     KafkaConnectConfigErrorResponse,
     KafkaConnectorConfig,
 )
+from kpops.utils.concurrency import ConcurrencyLimiter
 from kpops.utils.logging import bound_service_context
+from kpops.utils.retry import backoff_delays
 
 if TYPE_CHECKING:
     from pydantic import AnyHttpUrl
@@ -31,13 +36,20 @@ if TYPE_CHECKING:
 
 log = structlog.get_logger(KAFKA_CONNECT)
 
+CONNECTORS_ADAPTER = TypeAdapter(dict[str, ConnectorInfoStatusResponse])
+
 
 @final
 class KafkaConnect:
-    """Wraps Kafka Connect REST API."""
+    """Wraps Kafka Connect REST API.
+
+    :param config: Kafka Connect configuration
+    """
 
     def __init__(self, config: KafkaConnectConfig) -> None:
         self._config: KafkaConnectConfig = config
+        self._limiter = ConcurrencyLimiter(config.max_concurrency)
+        self.retries: Counter[str] = Counter()
         self._client = httpx2.AsyncClient(
             base_url=str(config.url),
             headers={"Accept": "application/json", "Content-Type": "application/json"},
@@ -84,6 +96,10 @@ class KafkaConnect:
     ) -> httpx2.Response | None:
         """Send an HTTP request to Kafka Connect, or preview it in dry-run mode.
 
+        Requests rejected with 409 Conflict while Kafka Connect is rebalancing
+        are retried with exponential backoff as configured in
+        ``kafka_connect.retry``. Each retry is counted in ``retries``.
+
         :param method: The HTTP method
         :param endpoint: The endpoint path, relative to the Kafka Connect base URL.
         :param json: Optional JSON payload for the request body.
@@ -94,10 +110,30 @@ class KafkaConnect:
         if dry_run:
             await self._log_request(request)
             return None
-        try:
-            return await self._client.send(request)
-        except httpx2.TransportError as ex:
-            raise KafkaConnectConnectionError(url=str(self.url), cause=ex) from ex
+        delays = backoff_delays(self._config.retry)
+        while True:
+            try:
+                async with self._limiter:
+                    response = await self._client.send(request)
+            except httpx2.TransportError as ex:
+                raise KafkaConnectConnectionError(url=str(self.url), cause=ex) from ex
+            if response.status_code != httpx2.codes.CONFLICT.value:
+                return response
+            if (delay := next(delays, None)) is None:
+                log.warning(
+                    "Rebalancing still in progress. Giving up.",
+                    method=method,
+                    endpoint=endpoint,
+                )
+                return response
+            self.retries[f"{method} {endpoint}"] += 1
+            log.warning(
+                "Rebalancing in progress... Retrying...",
+                method=method,
+                endpoint=endpoint,
+                delay=round(delay, 3),
+            )
+            await asyncio.sleep(delay)
 
     async def create_connector(
         self,
@@ -130,14 +166,6 @@ class KafkaConnect:
             if response.status_code == httpx2.codes.CREATED.value:
                 log.info("Connector created.", connector_name=connector_config.name)
                 return ConnectorResponse.model_validate_json(response.content)
-            if response.status_code == httpx2.codes.CONFLICT.value:
-                log.warning(
-                    "Rebalancing in progress while creating a connector... Retrying..."
-                )
-                await asyncio.sleep(1)
-                return await self.create_connector(
-                    connector_config, initial_state, dry_run=dry_run
-                )
             raise KafkaConnectError(response)
 
     async def get_connector(self, connector_name: str) -> ConnectorResponse:
@@ -154,12 +182,6 @@ class KafkaConnect:
                 return ConnectorResponse.model_validate_json(response.content)
             if response.status_code == httpx2.codes.NOT_FOUND.value:
                 raise ConnectorNotFoundException
-            if response.status_code == httpx2.codes.CONFLICT.value:
-                log.warning(
-                    "Rebalancing in progress while getting a connector... Retrying..."
-                )
-                await asyncio.sleep(1)
-                return await self.get_connector(connector_name)
             raise KafkaConnectError(response)
 
     async def get_connector_status(
@@ -180,6 +202,23 @@ class KafkaConnect:
                 raise ConnectorNotFoundException
             raise KafkaConnectError(response)
 
+    async def get_connectors(self) -> dict[str, ConnectorInfoStatusResponse]:
+        """Get information about and status of all connectors.
+
+        API Reference: https://docs.confluent.io/platform/current/connect/references/restapi.html#get--connectors
+        :raises KafkaConnectError: Kafka Connect error
+        :raises ValidationError: Unexpected response of Kafka Connect
+        :return: Information about and status of the connectors by name.
+        """
+        with bound_service_context(url=str(self.url)):
+            response = await self.request(
+                "GET", "/connectors?expand=info&expand=status"
+            )
+            assert response is not None
+            if response.is_success:
+                return CONNECTORS_ADAPTER.validate_json(response.content)
+            raise KafkaConnectError(response)
+
     async def pause_connector(
         self, connector_name: str, *, dry_run: bool = False
     ) -> None:
@@ -270,14 +309,6 @@ class KafkaConnect:
             if response.status_code == httpx2.codes.CREATED.value:
                 log.info("Connector created.", connector_name=connector_name)
                 return ConnectorResponse.model_validate(data)
-            if response.status_code == httpx2.codes.CONFLICT.value:
-                log.warning(
-                    "Rebalancing in progress while updating a connector... Retrying..."
-                )
-                await asyncio.sleep(1)
-                return await self.update_connector_config(
-                    connector_config, dry_run=dry_run
-                )
             raise KafkaConnectError(response)
 
     async def validate_connector_config(
@@ -331,18 +362,12 @@ class KafkaConnect:
                 "DELETE", f"/connectors/{connector_name}", dry_run=dry_run
             )
             if response is None:
-                return None
+                return
             if response.status_code == httpx2.codes.NO_CONTENT.value:
                 log.info("Connector deleted.", connector_name=connector_name)
-                return None
+                return
             if response.status_code == httpx2.codes.NOT_FOUND.value:
                 raise ConnectorNotFoundException
-            if response.status_code == httpx2.codes.CONFLICT.value:
-                log.warning(
-                    "Rebalancing in progress while deleting a connector... Retrying..."
-                )
-                await asyncio.sleep(1)
-                return await self.delete_connector(connector_name, dry_run=dry_run)
             raise KafkaConnectError(response)
 
     async def reset_offset(self, connector_name: str, *, dry_run: bool = False) -> None:
@@ -1,24 +1,31 @@
 from __future__ import annotations
 
+from collections import Counter
 from typing import TYPE_CHECKING, Self, final
 
 import structlog
+from pydantic import ValidationError
 
 from kpops.component_handlers.kafka_connect.exception import (
     ConnectorNotFoundException,
     ConnectorStateException,
+    KafkaConnectError,
 )
 from kpops.component_handlers.kafka_connect.kafka_connect_api import KafkaConnect
 from kpops.component_handlers.kafka_connect.model import (
     ConnectorCurrentState,
     ConnectorNewState,
+    ConnectorSnapshot,
 )
 from kpops.utils.colorify import magentaify
+from kpops.utils.concurrency import RunCache
 from kpops.utils.dict_differ import render_diff
 
 if TYPE_CHECKING:
     from kpops.component_handlers.kafka_connect.model import (
+        ConnectorInfoStatusResponse,
         ConnectorResponse,
+        ConnectorStatusResponse,
         KafkaConnectorConfig,
     )
     from kpops.config import KpopsConfig
@@ -28,8 +35,23 @@ log = structlog.get_logger("KafkaConnectHandler")
 
 @final
 class KafkaConnectHandler:
-    def __init__(self, kafka_connect: KafkaConnect) -> None:
+    def __init__(self, kafka_connect: KafkaConnect, prefetch: bool = False) -> None:
         self._kafka_connect = kafka_connect
+        self._prefetch = prefetch
+        self._snapshot = RunCache(self.__fetch_snapshot)
+        self.config_updates: Counter[str] = Counter()
+
+    async def snapshot(self) -> ConnectorSnapshot | None:
+        """Return the info and status of all connectors if prefetching is enabled.
+
+        The snapshot is fetched once per run and shared by all concurrent
+        operations.
+
+        :return: Connector snapshot, None if prefetching is disabled or failed
+        """
+        if not self._prefetch:
+            return None
+        return await self._snapshot.get()
 
     async def create_connector(
         self,
@@ -48,8 +70,8 @@ class KafkaConnectHandler:
         """
         connector_name = connector_config.name
         try:
-            connector = await self._kafka_connect.get_connector(connector_name)
-            status = await self._kafka_connect.get_connector_status(connector_name)
+            connector = await self.__get_connector(connector_name)
+            status = await self.__get_connector_status(connector_name)
             await self.__update_existing_connector(
                 connector,
                 connector_config,
@@ -59,10 +81,27 @@ class KafkaConnectHandler:
             )
         except ConnectorNotFoundException:
             await self.__create_new_connector(connector_config, state, dry_run=dry_run)
+        if not dry_run:
+            await self.__invalidate(connector_name)
 
         if dry_run:
             await self.__ensure_valid_config(connector_config)
 
+    def log_summary(self) -> None:
+        """Log how many connector config updates were applied or skipped and how many requests were retried."""
+        if self.config_updates:
+            log.info(
+                "Connector config updates.",
+                applied=self.config_updates["applied"],
+                skipped=self.config_updates["skipped"],
+            )
+        if retries := self._kafka_connect.retries:
+            log.info(
+                "Kafka Connect requests retried.",
+                retries=retries.total(),
+                requests=dict(retries),
+            )
+
     async def __update_existing_connector(
         self,
         connector: ConnectorResponse,
@@ -86,17 +125,20 @@ class KafkaConnectHandler:
             case _:
                 pass
 
-        if dry_run and (
-            diff := render_diff(
-                connector.config.model_dump(), connector_config.model_dump()
+        current_config = connector.config.model_dump()
+        desired_config = connector_config.model_dump()
+        if current_config == desired_config:
+            # an update triggers a rebalance of the Kafka Connect cluster
+            log.info("Connector config unchanged.", connector_name=connector_name)
+            self.config_updates["skipped"] += 1
+        else:
+            if dry_run and (diff := render_diff(current_config, desired_config)):
+                log.info("Updating config", connector_name=connector_name)
+                log.info("\n" + diff)
+            await self._kafka_connect.update_connector_config(
+                connector_config, dry_run=dry_run
             )
-        ):
-            log.info("Updating config", connector_name=connector_name)
-            log.info("\n" + diff)
-
-        await self._kafka_connect.update_connector_config(
-            connector_config, dry_run=dry_run
-        )
+            self.config_updates["applied"] += 1
 
         if (
             current_state is not ConnectorCurrentState.RUNNING
@@ -146,7 +188,7 @@ class KafkaConnectHandler:
         :param dry_run: Whether the connector deletion should be run in dry run mode.
         """
         try:
-            await self._kafka_connect.get_connector(connector_name)
+            await self.__get_connector(connector_name)
             if dry_run:
                 log.info(
                     magentaify(
@@ -154,6 +196,8 @@ class KafkaConnectHandler:
                     )
                 )
             await self._kafka_connect.delete_connector(connector_name, dry_run=dry_run)
+            if not dry_run:
+                await self.__invalidate(connector_name)
         except ConnectorNotFoundException:
             if dry_run:
                 log.warning(
@@ -178,7 +222,7 @@ class KafkaConnectHandler:
         """
         connector_name = connector_config.name
         try:
-            await self._kafka_connect.get_connector(connector_name)
+            await self.__get_connector(connector_name)
             connector_existed = True
         except ConnectorNotFoundException:
             connector_existed = False
@@ -194,6 +238,8 @@ class KafkaConnectHandler:
                     )
                 )
             await self._kafka_connect.stop_connector(connector_name, dry_run=dry_run)
+            if not dry_run:
+                await self.__invalidate(connector_name)
             await self._kafka_connect.reset_offset(connector_name, dry_run=dry_run)
         except ConnectorNotFoundException:
             log.warning(
@@ -212,13 +258,60 @@ class KafkaConnectHandler:
                 await self._kafka_connect.delete_connector(
                     connector_name, dry_run=dry_run
                 )
+                if not dry_run:
+                    await self.__invalidate(connector_name)
             except ConnectorNotFoundException:
                 log.warning(
                     "Connector does not exist. Skipping.", connector_name=connector_name
                 )
 
+    async def __fetch_snapshot(self) -> ConnectorSnapshot | None:
+        try:
+            connectors = await self._kafka_connect.get_connectors()
+        except (KafkaConnectError, ValidationError) as e:
+            log.warning(
+                "Could not prefetch connectors. Falling back to requests per connector.",
+                error=str(e),
+            )
+            return None
+        log.debug("Prefetched connectors.", connectors=len(connectors))
+        return ConnectorSnapshot(connectors=connectors)
+
+    async def __get_snapshot_entry(
+        self, connector_name: str
+    ) -> ConnectorInfoStatusResponse | None:
+        """Look up a connector in the snapshot.
+
+        :param connector_name: The connector name
+        :raises ConnectorNotFoundException: Connector is not in the snapshot
+        :return: Info and status of the connector, None if it must be requested
+        """
+        snapshot = await self.snapshot()
+        if snapshot is None or connector_name in snapshot.invalidated:
+            return None
+        if (entry := snapshot.connectors.get(connector_name)) is None:
+            raise ConnectorNotFoundException
+        return entry
+
+    async def __get_connector(self, connector_name: str) -> ConnectorResponse:
+        if entry := await self.__get_snapshot_entry(connector_name):
+            return entry.info
+        return await self._kafka_connect.get_connector(connector_name)
+
+    async def __get_connector_status(
+        self, connector_name: str
+    ) -> ConnectorStatusResponse:
+        if entry := await self.__get_snapshot_entry(connector_name):
+            return entry.status
+        return await self._kafka_connect.get_connector_status(connector_name)
+
+    async def __invalidate(self, connector_name: str) -> None:
+        if snapshot := await self.snapshot():
+            snapshot.invalidated.add(connector_name)
+
     @classmethod
     def from_kpops_config(cls, config: KpopsConfig) -> Self:
         return cls(
             kafka_connect=KafkaConnect(config.kafka_connect),
+            prefetch=config.kafka_connect.prefetch,
         )
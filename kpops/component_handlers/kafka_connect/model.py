@@ -1,3 +1,4 @@
+from dataclasses import dataclass, field
 from enum import StrEnum, auto
 from typing import Any, ClassVar
 
@@ -103,10 +104,13 @@ class UpperStrEnum(StrEnum):
 
 
 class ConnectorCurrentState(UpperStrEnum):
+    UNASSIGNED = auto()
     RUNNING = auto()
     PAUSED = auto()
     STOPPED = auto()
     FAILED = auto()
+    RESTARTING = auto()
+    DESTROYED = auto()
 
 
 class ConnectorNewState(StrEnum):
@@ -171,6 +175,23 @@ class ConnectorResponse(BaseModel):
     model_config: ClassVar[ConfigDict] = ConfigDict(extra="forbid")
 
 
+class ConnectorInfoStatusResponse(BaseModel):
+    info: ConnectorResponse
+    status: ConnectorStatusResponse
+
+
+@dataclass
+class ConnectorSnapshot:
+    """State of all connectors in the cluster, fetched in bulk once per run.
+
+    :param connectors: Info and status of the connectors in the cluster by name
+    :param invalidated: Connectors that were modified after the snapshot was taken
+    """
+
+    connectors: dict[str, ConnectorInfoStatusResponse]
+    invalidated: set[str] = field(default_factory=set)
+
+
 class KafkaConnectConfigError(BaseModel):
     name: str
     errors: list[str]
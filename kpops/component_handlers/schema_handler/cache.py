@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, final
+
+import structlog
+from schema_registry.client.schema import AvroSchema, JsonSchema
+
+from kpops.utils.files import write_atomic
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from kpops.component_handlers.schema_handler.schema_provider import Schema
+    from kpops.components.base_components.models import ModelName, ModelVersion
+
+log = structlog.get_logger("SchemaHandler")
+
+SCHEMA_TYPES: dict[str, type[Schema]] = {
+    "AVRO": AvroSchema,
+    "JSON": JsonSchema,
+}
+
+
+@final
+class SchemaCache:
+    """On-disk cache for schemas generated by the schema provider.
+
+    The cache key only covers the schema class and the models of the to
+    section, so the cache must be cleared whenever schema classes change.
+
+    :param directory: Directory in which generated schemas are stored
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    @staticmethod
+    def key(schema_class: str, models: dict[ModelName, ModelVersion]) -> str:
+        """Compute the cache key for a schema.
+
+        :param schema_class: The schema class
+        :param models: Models of the to section
+        :return: Cache key
+        """
+        content = json.dumps([schema_class, models], sort_keys=True)
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, key: str) -> Schema | None:
+        """Read the schema stored under a key.
+
+        :param key: Cache key
+        :return: Schema, None if not cached or unreadable
+        """
+        try:
+            content = json.loads(self.__path(key).read_text())
+            schema_type = SCHEMA_TYPES[content["schema_type"]]
+            schema = schema_type(content["schema"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        log.debug("Using cached schema.", key=key)
+        return schema
+
+    def set(self, key: str, schema: Schema) -> None:
+        """Store a schema under a key.
+
+        :param key: Cache key
+        :param schema: Generated schema
+        """
+        content = {"schema_type": schema.schema_type, "schema": schema.raw_schema}
+        try:
+            write_atomic(self.__path(key), json.dumps(content))
+        except OSError as e:
+            log.warning("Could not cache schema.", error=str(e))
+
+    def __path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 from functools import cached_property
 from typing import TYPE_CHECKING, final
@@ -9,6 +11,7 @@ from schema_registry.client import AsyncSchemaRegistryClient
 from schema_registry.client.schema import AvroSchema
 from schema_registry.client.utils import SchemaVersion
 
+from kpops.component_handlers.schema_handler.cache import SchemaCache
 from kpops.component_handlers.schema_handler.schema_provider import (
     Schema,
     SchemaProvider,
@@ -16,14 +19,28 @@ from kpops.component_handlers.schema_handler.schema_provider import (
 from kpops.core.exception import ClassNotFoundError
 from kpops.core.registry import Registry, find_class
 from kpops.utils.colorify import greenify, magentaify
+from kpops.utils.concurrency import ConcurrencyLimiter
 
 if TYPE_CHECKING:
+    from kpops.components.base_components.models import ModelName, ModelVersion
     from kpops.components.base_components.models.to_section import ToSection
     from kpops.config import KpopsConfig
 
 log = structlog.get_logger("SchemaHandler")
 
 
+def schema_fingerprint(schema: Schema) -> str:
+    """Compute a stable fingerprint of a schema.
+
+    :param schema: Avro or JSON schema
+    :return: SHA-256 hex digest of the schema type and its canonical JSON
+    """
+    canonical = json.dumps(
+        [schema.schema_type, schema.schema], sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
 @final
 class SchemaHandler:
     def __init__(self, kpops_config: KpopsConfig) -> None:
@@ -31,6 +48,16 @@ class SchemaHandler:
             str(kpops_config.schema_registry.url),
             timeout=kpops_config.schema_registry.timeout,  # pyright: ignore[reportArgumentType]
         )
+        self._limiter = ConcurrencyLimiter(kpops_config.schema_registry.max_concurrency)
+        # subjects verified during this run, keyed by subject and schema fingerprint
+        self._submitted: set[tuple[str, str]] = set()
+        self._compatible: set[tuple[str, str]] = set()
+        self._schemas: dict[str, Schema] = {}
+        self._schema_cache = (
+            SchemaCache(kpops_config.schema_registry.schema_cache)
+            if kpops_config.schema_registry.schema_cache
+            else None
+        )
 
     @cached_property
     def schema_provider(self) -> SchemaProvider:
@@ -55,60 +82,74 @@ class SchemaHandler:
         return None
 
     async def submit_schemas(self, to_section: ToSection, dry_run: bool = True) -> None:
+        """Submit the key and value schemas of all topics in the to section.
+
+        The subjects are submitted concurrently, bounded by
+        ``schema_registry.max_concurrency``.
+
+        :param to_section: Output topics of a component
+        :param dry_run: Whether to check compatibility instead of submitting
+        """
+        submissions: list[tuple[str, Schema, str]] = []
         for topic_name, config in to_section.topics.items():
             value_schema_class = config.value_schema
             key_schema_class = config.key_schema
             if value_schema_class is not None:
-                schema = self.schema_provider.provide_schema(
-                    value_schema_class, to_section.models
-                )
-                await self.__submit_value_schema(
-                    schema, value_schema_class, dry_run, topic_name
-                )
+                schema = self.__provide_schema(value_schema_class, to_section.models)
+                submissions.append((f"{topic_name}-value", schema, value_schema_class))
             if key_schema_class is not None:
-                schema = self.schema_provider.provide_schema(
-                    key_schema_class, to_section.models
-                )
-                await self.__submit_key_schema(
-                    schema, key_schema_class, dry_run, topic_name
+                schema = self.__provide_schema(key_schema_class, to_section.models)
+                submissions.append((f"{topic_name}-key", schema, key_schema_class))
+        await asyncio.gather(
+            *(
+                self.__submit_schema(
+                    subject=subject,
+                    schema=schema,
+                    schema_class=schema_class,
+                    dry_run=dry_run,
                 )
+                for subject, schema, schema_class in submissions
+            )
+        )
 
     async def delete_schemas(self, to_section: ToSection, dry_run: bool = True) -> None:
+        """Delete the key and value subjects of all topics in the to section.
+
+        The subjects are deleted concurrently, bounded by
+        ``schema_registry.max_concurrency``.
+
+        :param to_section: Output topics of a component
+        :param dry_run: Whether to only log the subjects that would be deleted
+        """
+        subjects: list[str] = []
         for topic_name, config in to_section.topics.items():
             if config.value_schema is not None:
-                await self.__delete_subject(f"{topic_name}-value", dry_run)
+                subjects.append(f"{topic_name}-value")
             if config.key_schema is not None:
-                await self.__delete_subject(f"{topic_name}-key", dry_run)
-
-    async def __submit_key_schema(
-        self,
-        schema: Schema,
-        schema_class: str,
-        dry_run: bool,
-        topic_name: str,
-    ) -> None:
-        subject = f"{topic_name}-key"
-        await self.__submit_schema(
-            subject=subject,
-            schema=schema,
-            schema_class=schema_class,
-            dry_run=dry_run,
+                subjects.append(f"{topic_name}-key")
+        await asyncio.gather(
+            *(self.__delete_subject(subject, dry_run) for subject in subjects)
         )
 
-    async def __submit_value_schema(
-        self,
-        schema: Schema,
-        schema_class: str,
-        dry_run: bool,
-        topic_name: str,
-    ) -> None:
-        subject = f"{topic_name}-value"
-        await self.__submit_schema(
-            subject=subject,
-            schema=schema,
-            schema_class=schema_class,
-            dry_run=dry_run,
-        )
+    def __provide_schema(
+        self, schema_class: str, models: dict[ModelName, ModelVersion]
+    ) -> Schema:
+        """Provide a schema, generating it only once per run.
+
+        :param schema_class: The schema class
+        :param models: Models of the to section
+        :return: Schema from the run cache, the on-disk cache or the schema provider
+        """
+        key = SchemaCache.key(schema_class, models)
+        if (schema := self._schemas.get(key)) is None:
+            if self._schema_cache:
+                schema = self._schema_cache.get(key)
+            if schema is None:
+                schema = self.schema_provider.provide_schema(schema_class, models)
+                if self._schema_cache:
+                    self._schema_cache.set(key, schema)
+            self._schemas[key] = schema
+        return schema
 
     async def __submit_schema(
         self,
@@ -117,9 +158,18 @@ class SchemaHandler:
         schema_class: str,
         dry_run: bool,
     ) -> None:
+        key = (subject, schema_fingerprint(schema))
+        if key in self._submitted or (dry_run and key in self._compatible):
+            log.debug(
+                "Schema was already verified in this run.",
+                subject=subject,
+                model=schema_class,
+            )
+            return
         if dry_run:
             if await self.__subject_exists(subject):
                 await self.__check_compatibility(schema, schema_class, subject)
+                self._compatible.add(key)
             else:
                 log.info(
                     greenify(
@@ -127,9 +177,11 @@ class SchemaHandler:
                     )
                 )
         else:
-            await self.schema_registry_client.register(  # pyright: ignore[reportUnknownMemberType]
-                subject=subject, schema=schema
-            )
+            async with self._limiter:
+                await self.schema_registry_client.register(  # pyright: ignore[reportUnknownMemberType]
+                    subject=subject, schema=schema
+                )
+            self._submitted.add(key)
             log.info(
                 "Schema submitted.",
                 subject=subject,
@@ -137,21 +189,25 @@ class SchemaHandler:
             )
 
     async def __subject_exists(self, subject: str) -> bool:
-        versions: list[SchemaVersion] = await self.schema_registry_client.get_versions(  # pyright: ignore[reportUnknownMemberType]
-            subject
-        )
+        async with self._limiter:
+            versions: list[
+                SchemaVersion
+            ] = await self.schema_registry_client.get_versions(subject)  # pyright: ignore[reportUnknownMemberType]
         return len(versions) > 0
 
     async def __check_compatibility(
         self, schema: Schema, schema_class: str, subject: str
     ) -> None:
-        registered_version = await self.schema_registry_client.check_version(  # pyright: ignore[reportUnknownMemberType]
-            subject, schema
-        )
+        async with self._limiter:
+            registered_version = await self.schema_registry_client.check_version(  # pyright: ignore[reportUnknownMemberType]
+                subject, schema
+            )
         if registered_version is None:
-            if not await self.schema_registry_client.test_compatibility(  # pyright: ignore[reportUnknownMemberType]
-                subject=subject, schema=schema
-            ):
+            async with self._limiter:
+                is_compatible = await self.schema_registry_client.test_compatibility(  # pyright: ignore[reportUnknownMemberType]
+                    subject=subject, schema=schema
+                )
+            if not is_compatible:
                 schema_str = (
                     schema.flat_schema
                     if isinstance(schema, AvroSchema)
@@ -178,9 +234,12 @@ class SchemaHandler:
                 magentaify("Schema Deletion: will delete subject."), subject=subject
             )
         else:
-            version_list: list[
-                SchemaVersion
-            ] = await self.schema_registry_client.delete_subject(subject)  # pyright: ignore[reportUnknownMemberType]
+            async with self._limiter:
+                version_list: list[
+                    SchemaVersion
+                ] = await self.schema_registry_client.delete_subject(subject)  # pyright: ignore[reportUnknownMemberType]
+            self._submitted = {key for key in self._submitted if key[0] != subject}
+            self._compatible = {key for key in self._compatible if key[0] != subject}
             log.info(
                 "Deleted subject.",
                 subject=subject,
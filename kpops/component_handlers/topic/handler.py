@@ -1,17 +1,24 @@
 from __future__ import annotations
 
-from typing import Any, final
+import asyncio
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, final
 
 import structlog
 
 from kpops.component_handlers.topic.exception import (
+    KafkaRestProxyError,
+    KafkaRestProxyException,
     TopicNotFoundException,
     TopicTransactionError,
 )
 from kpops.component_handlers.topic.kafka_rest import KafkaRest
 from kpops.component_handlers.topic.model import (
+    KafkaTopicConfig,
     TopicConfigResponse,
+    TopicOperationResult,
     TopicResponse,
+    TopicSnapshot,
     TopicSpec,
 )
 from kpops.component_handlers.topic.utils import (
@@ -21,15 +28,29 @@ from kpops.component_handlers.topic.utils import (
 )
 from kpops.components.common.topic import KafkaTopic
 from kpops.utils.colorify import greenify, magentaify
+from kpops.utils.concurrency import RunCache
 from kpops.utils.dict_differ import Diff, DiffType, render_diff
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+
 log = structlog.get_logger("KafkaTopic")
 
 
 @final
 class TopicHandler:
-    def __init__(self, kafka_rest: KafkaRest) -> None:
+    """Create, update and delete Kafka topics.
+
+    :param kafka_rest: Kafka REST Proxy client
+    :param prefetch: Whether to fetch the state of all topics in bulk once per
+        run, defaults to False
+    """
+
+    def __init__(self, kafka_rest: KafkaRest, prefetch: bool = False) -> None:
         self.kafka_rest = kafka_rest
+        self._prefetch = prefetch
+        self._snapshot = RunCache(self.__fetch_snapshot)
+        self._effective_broker_config = RunCache(self.__fetch_effective_broker_config)
 
     async def create_topic(self, topic: KafkaTopic, dry_run: bool) -> None:
         """Create a new Kafka topic or update topic configuration if it already exists.
@@ -56,6 +77,83 @@ class TopicHandler:
         else:
             await self.__execute_topic_deletion(topic.name)
 
+    async def create_topics(
+        self, topics: Iterable[KafkaTopic], dry_run: bool, raise_on_error: bool = True
+    ) -> list[TopicOperationResult]:
+        """Create or update multiple Kafka topics concurrently.
+
+        The number of concurrent requests is bounded by the Kafka REST Proxy
+        config. A failing topic does not stop the operations on other topics.
+
+        :param topics: Kafka topics to be created or updated
+        :param dry_run: Whether to do a dry run without making changes
+        :param raise_on_error: Whether to raise the error of the first failed
+            topic once all operations are done, defaults to True
+        :raises KafkaRestProxyException: A topic operation failed
+        :raises Exception: A topic operation failed unexpectedly, raised once
+            all operations are done regardless of ``raise_on_error``
+        :return: Result for each topic, in the order of the given topics
+        """
+        return await self.__run_batch(
+            lambda topic: self.create_topic(topic, dry_run=dry_run),
+            topics,
+            raise_on_error,
+        )
+
+    async def delete_topics(
+        self, topics: Iterable[KafkaTopic], dry_run: bool, raise_on_error: bool = True
+    ) -> list[TopicOperationResult]:
+        """Delete multiple Kafka topics concurrently.
+
+        The number of concurrent requests is bounded by the Kafka REST Proxy
+        config. A failing topic does not stop the operations on other topics.
+
+        :param topics: Kafka topics to be deleted
+        :param dry_run: Whether to do a dry run without making changes
+        :param raise_on_error: Whether to raise the error of the first failed
+            topic once all operations are done, defaults to True
+        :raises KafkaRestProxyException: A topic operation failed
+        :raises Exception: A topic operation failed unexpectedly, raised once
+            all operations are done regardless of ``raise_on_error``
+        :return: Result for each topic, in the order of the given topics
+        """
+        return await self.__run_batch(
+            lambda topic: self.delete_topic(topic, dry_run=dry_run),
+            topics,
+            raise_on_error,
+        )
+
+    @staticmethod
+    async def __run_batch(
+        operation: Callable[[KafkaTopic], Awaitable[None]],
+        topics: Iterable[KafkaTopic],
+        raise_on_error: bool,
+    ) -> list[TopicOperationResult]:
+        topics = list(topics)
+        # wait for all operations, so that no task is left running on errors
+        outcomes = await asyncio.gather(
+            *(operation(topic) for topic in topics), return_exceptions=True
+        )
+        results: list[TopicOperationResult] = []
+        errors: list[BaseException] = []
+        for topic, outcome in zip(topics, outcomes, strict=True):
+            if isinstance(outcome, KafkaRestProxyException):
+                log.warning(
+                    "Topic operation failed.", topic_name=topic.name, error=str(outcome)
+                )
+                results.append(TopicOperationResult(topic.name, outcome))
+            elif isinstance(outcome, BaseException):
+                errors.append(outcome)
+            else:
+                results.append(TopicOperationResult(topic.name))
+        if errors:
+            raise errors[0]
+        if raise_on_error:
+            for result in results:
+                if result.exception is not None:
+                    raise result.exception
+        return results
+
     @staticmethod
     def __get_topic_config_diff(
         cluster_config: TopicConfigResponse, current_config: dict[str, Any]
@@ -69,9 +167,9 @@ class TopicHandler:
         self, topic: KafkaTopic, topic_spec: TopicSpec
     ) -> None:
         try:
-            topic_in_cluster = await self.kafka_rest.get_topic(topic.name)
+            topic_in_cluster = await self.__get_topic(topic.name)
             topic_name = topic_in_cluster.topic_name
-            topic_config_in_cluster = await self.kafka_rest.get_topic_config(topic_name)
+            topic_config_in_cluster = await self.__get_topic_config(topic_name)
             in_cluster_config, new_config = parse_and_compare_topic_configs(
                 topic_config_in_cluster, topic.config.configs
             )
@@ -81,8 +179,7 @@ class TopicHandler:
 
             log.info("Topic already exists in cluster.", topic_name=topic_name)
 
-            broker_config = await self.kafka_rest.get_broker_config()
-            effective_config = get_effective_config(broker_config)
+            effective_config = await self.effective_broker_config()
 
             self.__check_partition_count(topic_in_cluster, topic_spec, effective_config)
             self.__check_replication_factor(
@@ -99,8 +196,8 @@ class TopicHandler:
         self, topic: KafkaTopic, topic_spec: TopicSpec
     ) -> None:
         try:
-            await self.kafka_rest.get_topic(topic.name)
-            topic_config_in_cluster = await self.kafka_rest.get_topic_config(topic.name)
+            await self.__get_topic(topic.name)
+            topic_config_in_cluster = await self.__get_topic_config(topic.name)
             differences = self.__get_topic_config_diff(
                 topic_config_in_cluster, topic.config.configs
             )
@@ -117,6 +214,7 @@ class TopicHandler:
                             {"name": difference.key, "value": config_value}
                         )
                 await self.kafka_rest.batch_alter_topic_config(topic.name, json_body)
+                await self.__invalidate(topic.name)
 
             else:
                 log.info(
@@ -125,6 +223,7 @@ class TopicHandler:
                 )
         except TopicNotFoundException:
             await self.kafka_rest.create_topic(topic_spec)
+            await self.__invalidate(topic.name)
 
     @staticmethod
     def __check_partition_count(
@@ -169,7 +268,7 @@ class TopicHandler:
 
     async def __dry_run_topic_deletion(self, topic_name: str) -> None:
         try:
-            topic_in_cluster = await self.kafka_rest.get_topic(topic_name)
+            topic_in_cluster = await self.__get_topic(topic_name)
             log.info(
                 magentaify(
                     f"Topic Deletion: topic {topic_in_cluster.topic_name} exists in the cluster. Deleting topic."
@@ -183,14 +282,98 @@ class TopicHandler:
 
     async def __execute_topic_deletion(self, topic_name: str) -> None:
         try:
-            await self.kafka_rest.get_topic(topic_name)
+            await self.__get_topic(topic_name)
             await self.kafka_rest.delete_topic(topic_name)
+            await self.__invalidate(topic_name)
         except TopicNotFoundException:
             log.warning(
                 "Topic does not exist in the cluster and cannot be deleted. Skipping.",
                 topic_name=topic_name,
             )
 
+    async def snapshot(self) -> TopicSnapshot | None:
+        """Return the state of all topics in the cluster if prefetching is enabled.
+
+        The snapshot is fetched once per run and shared by all concurrent
+        operations.
+
+        :return: Topic snapshot, None if prefetching is disabled or failed
+        """
+        if not self._prefetch:
+            return None
+        return await self._snapshot.get()
+
+    async def effective_broker_config(self) -> dict[str, str]:
+        """Return the effective config of the brokers in the cluster.
+
+        The broker config does not change during a run, so it is requested
+        once per run and shared by all concurrent operations.
+
+        :return: Broker config values by name
+        """
+        return await self._effective_broker_config.get()
+
+    def invalidate_broker_config(self) -> None:
+        """Discard the cached broker config, so that it is requested again."""
+        self._effective_broker_config.invalidate()
+
+    async def __fetch_snapshot(self) -> TopicSnapshot | None:
+        try:
+            topics, topic_configs, broker_config = await asyncio.gather(
+                self.kafka_rest.get_topics(),
+                self.kafka_rest.get_all_topic_configs(),
+                self.kafka_rest.get_broker_config(),
+            )
+        except KafkaRestProxyError as e:
+            log.warning(
+                "Could not prefetch topics. Falling back to requests per topic.",
+                error=str(e),
+            )
+            return None
+        configs: defaultdict[str, list[KafkaTopicConfig]] = defaultdict(list)
+        for config in topic_configs.data:
+            if config.topic_name is not None:
+                configs[config.topic_name].append(config)
+        log.debug("Prefetched topics.", topics=len(topics.data))
+        return TopicSnapshot(
+            topics={topic.topic_name: topic for topic in topics.data},
+            configs={
+                topic_name: TopicConfigResponse(data=data)
+                for topic_name, data in configs.items()
+            },
+            broker_config=broker_config,
+        )
+
+    async def __get_topic(self, topic_name: str) -> TopicResponse:
+        snapshot = await self.snapshot()
+        if snapshot is None or topic_name in snapshot.invalidated:
+            return await self.kafka_rest.get_topic(topic_name)
+        if (topic := snapshot.topics.get(topic_name)) is None:
+            raise TopicNotFoundException
+        return topic
+
+    async def __get_topic_config(self, topic_name: str) -> TopicConfigResponse:
+        snapshot = await self.snapshot()
+        if (
+            snapshot is None
+            or topic_name in snapshot.invalidated
+            or (config := snapshot.configs.get(topic_name)) is None
+        ):
+            return await self.kafka_rest.get_topic_config(topic_name)
+        return config
+
+    async def __fetch_effective_broker_config(self) -> dict[str, str]:
+        snapshot = await self.snapshot()
+        if snapshot is None:
+            broker_config = await self.kafka_rest.get_broker_config()
+        else:
+            broker_config = snapshot.broker_config
+        return get_effective_config(broker_config)
+
+    async def __invalidate(self, topic_name: str) -> None:
+        if snapshot := await self.snapshot():
+            snapshot.invalidated.add(topic_name)
+
     @classmethod
     def __prepare_body(cls, topic: KafkaTopic) -> TopicSpec:
         """Prepare the POST request body needed for the topic creation.
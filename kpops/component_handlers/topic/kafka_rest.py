@@ -16,9 +16,11 @@ from kpops.component_handlers.topic.exception import (
 from kpops.component_handlers.topic.model import (
     BrokerConfigResponse,
     TopicConfigResponse,
+    TopicListResponse,
     TopicResponse,
     TopicSpec,
 )
+from kpops.utils.concurrency import ConcurrencyLimiter
 from kpops.utils.logging import bound_service_context
 
 if TYPE_CHECKING:
@@ -37,6 +39,7 @@ class KafkaRest:
 
     def __init__(self, config: KafkaRestConfig) -> None:
         self._config: KafkaRestConfig = config
+        self._limiter = ConcurrencyLimiter(config.max_concurrency)
         self._client = httpx2.AsyncClient(
             timeout=config.timeout,
             event_hooks={
@@ -106,7 +109,10 @@ class KafkaRest:
     ) -> httpx2.Response:
         """Send a request, translating transport failures into a KafkaRestProxyConnectionError."""
         try:
-            return await self._client.request(method, url, headers=headers, json=json)
+            async with self._limiter:
+                return await self._client.request(
+                    method, url, headers=headers, json=json
+                )
         except httpx2.TransportError as ex:
             raise KafkaRestProxyConnectionError(url=url, cause=ex) from ex
 
@@ -252,6 +258,50 @@ class KafkaRest:
 
             raise KafkaRestProxyError(response)
 
+    async def get_topics(self) -> TopicListResponse:
+        """Return all topics in the cluster.
+
+        API Reference:
+        https://docs.confluent.io/platform/current/kafka-rest/api.html#get--clusters-cluster_id-topics
+        :raises KafkaRestProxyConnectionError: Connection to Kafka REST Proxy failed
+        :raises KafkaRestProxyError: Kafka REST proxy error
+        :return: Response of the list topics API.
+        """
+        with bound_service_context(url=str(self.url)):
+            response = await self._request(
+                "GET",
+                url=f"{self.url!s}v3/clusters/{self.cluster_id}/topics",
+                headers=HEADERS,
+            )
+
+            if response.status_code == httpx2.codes.OK.value:
+                log.debug("Topics found.")
+                return TopicListResponse.model_validate(response.json())
+
+            raise KafkaRestProxyError(response)
+
+    async def get_all_topic_configs(self) -> TopicConfigResponse:
+        """Return the configs of all topics in the cluster.
+
+        API Reference:
+        https://docs.confluent.io/platform/current/kafka-rest/api.html#get--clusters-cluster_id-topics---configs
+        :raises KafkaRestProxyConnectionError: Connection to Kafka REST Proxy failed
+        :raises KafkaRestProxyError: Kafka REST proxy error
+        :return: The configs of all topics.
+        """
+        with bound_service_context(url=str(self.url)):
+            response = await self._request(
+                "GET",
+                url=f"{self.url!s}v3/clusters/{self.cluster_id}/topics/-/configs",
+                headers=HEADERS,
+            )
+
+            if response.status_code == httpx2.codes.OK.value:
+                log.debug("Topic configs found.")
+                return TopicConfigResponse.model_validate(response.json())
+
+            raise KafkaRestProxyError(response)
+
     async def batch_alter_topic_config(
         self, topic_name: str, json_body: list[dict[str, Any]]
     ) -> None:
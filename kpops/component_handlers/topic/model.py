@@ -1,8 +1,11 @@
+from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any, ClassVar
 
 from pydantic import BaseModel, ConfigDict
 
+from kpops.component_handlers.topic.exception import KafkaRestProxyException
+
 
 class TopicSpec(BaseModel):
     topic_name: str
@@ -28,6 +31,14 @@ class TopicResponse(BaseModel):
     )
 
 
+class TopicListResponse(BaseModel):
+    data: list[TopicResponse]
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(
+        extra="allow",
+    )
+
+
 class KafkaTopicConfigSource(StrEnum):
     DYNAMIC_TOPIC_CONFIG = "DYNAMIC_TOPIC_CONFIG"
     DEFAULT_CONFIG = "DEFAULT_CONFIG"
@@ -54,6 +65,7 @@ class KafkaTopicConfig(BaseModel):
     synonyms: list[KafkaTopicConfigSynonyms]
     value: str
     name: str
+    topic_name: str | None = None
 
     model_config: ClassVar[ConfigDict] = ConfigDict(
         extra="allow",
@@ -101,3 +113,36 @@ class BrokerConfigResponse(BaseModel):
     model_config: ClassVar[ConfigDict] = ConfigDict(
         extra="allow",
     )
+
+
+@dataclass
+class TopicSnapshot:
+    """State of all topics in the cluster, fetched in bulk once per run.
+
+    :param topics: Topics in the cluster by name
+    :param configs: Configs of the topics in the cluster by topic name
+    :param broker_config: Config of the brokers in the cluster
+    :param invalidated: Topics that were modified after the snapshot was taken
+    """
+
+    topics: dict[str, TopicResponse]
+    configs: dict[str, TopicConfigResponse]
+    broker_config: BrokerConfigResponse
+    invalidated: set[str] = field(default_factory=set)
+
+
+@dataclass(frozen=True)
+class TopicOperationResult:
+    """Result of an operation on a single topic.
+
+    :param topic_name: Name of the topic
+    :param exception: Error raised by the operation, None if it succeeded
+    """
+
+    topic_name: str
+    exception: KafkaRestProxyException | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded."""
+        return self.exception is None
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 import json
 from abc import ABC
-from collections.abc import Generator, Hashable, Sequence
+from collections.abc import Generator, Hashable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import asdict
 from functools import cached_property
 from pathlib import Path
-from typing import Any, ClassVar, Self, TypeVar, cast
+from typing import Any, ClassVar, Self, TypeVar, cast, final
 
 import pydantic
 import structlog
@@ -17,23 +20,33 @@ from pydantic import (
     computed_field,
 )
 from pydantic.json_schema import SkipJsonSchema
+from pydantic_core import to_jsonable_python
 
 from kpops.config import KpopsConfig, get_config
 from kpops.const.file_type import KpopsFileType
 from kpops.utils import cached_classproperty
 from kpops.utils.dataclasses import is_dataclass_instance
 from kpops.utils.dict_ops import (
+    ImprovedTemplate,
     generate_substitution,
     update_nested,
     update_nested_pair,
 )
 from kpops.utils.environment import ENV, PIPELINE_PATH
-from kpops.utils.pydantic import DescConfigModel, issubclass_patched, to_dash
+from kpops.utils.pydantic import (
+    DescConfigModel,
+    include_defaults,
+    issubclass_patched,
+    to_dash,
+)
 from kpops.utils.types import JsonType
-from kpops.utils.yaml import load_yaml_file, substitute_nested
+from kpops.utils.yaml import Substitution, load_yaml_file
 
 log = structlog.get_logger("BaseDefaultsComponent")
 
+COMPONENT_PREFIX = "component."
+COMPONENT_PLACEHOLDER = f"${{{COMPONENT_PREFIX}"
+
 
 class BaseDefaultsComponent(DescConfigModel, ABC):
     """Base for all components, handles defaults.
@@ -61,19 +74,18 @@ class BaseDefaultsComponent(DescConfigModel, ABC):
     )
 
     def __init__(self, **values: Any) -> None:
-        if values.get("enrich", True):
-            cls = self.__class__
-            values = cls.extend_with_defaults(**values)
-            tmp_self = cls(**values, enrich=False)
-            values = tmp_self.model_dump(mode="json", by_alias=True)
-            values = cls.substitute_in_component(**values)
-            self.__init__(
-                enrich=False,
-                validate=True,
-                **values,
-            )
-        else:
+        if not values.get("enrich", True):
             super().__init__(**values)
+            return
+        cls = self.__class__
+        enriched, references = cls._enrich_values(**values)
+        super().__init__(**{**enriched, "enrich": False, "validate": True})
+        if not self.__resolves_to_validated(references):
+            log.debug("Resolving component references after validation", type=cls.type)
+            enriched = cls._enrich_validated_values(
+                **cls.extend_with_defaults(**values)
+            )
+            super().__init__(**{**enriched, "enrich": False, "validate": True})
 
     @pydantic.model_validator(mode="after")
     def validate_component(self) -> Self:
@@ -106,6 +118,67 @@ class BaseDefaultsComponent(DescConfigModel, ABC):
 
         return tuple(gen_parents())
 
+    @classmethod
+    def _enrich_values(cls, **values: Any) -> tuple[dict[str, Any], dict[str, str]]:
+        """Enrich the init kwargs with defaults and substitute all $-placeholders.
+
+        The kwargs are processed as raw dicts, so that the component only
+        needs to be validated once. Placeholders referring to the component
+        are resolved against the raw kwargs as well, which is only correct if
+        the referenced values are the same after validation.
+
+        :param values: The init kwargs for pydantic
+        :returns: Enriched kwargs and the resolved values of all referenced
+            component variables
+        """
+        values = cls.extend_with_defaults(**values)
+        component_data = include_defaults(
+            cls, to_jsonable_python(values, by_alias=True)
+        )
+        component_data.setdefault("type", cls.type)
+        substitution = cls._substitution(component_data)
+        names: set[str] = set()
+        substituted = substitution.substitute(json.dumps(component_data), names)
+        if COMPONENT_PLACEHOLDER in substituted:
+            # refers to an attribute that only exists after validation
+            return cls._enrich_validated_values(**values), {}
+        references = {
+            name: substitution.substitute(f"${{{name}}}")
+            for name in names
+            if name.startswith(COMPONENT_PREFIX)
+        }
+        return json.loads(substituted), references
+
+    @classmethod
+    def _enrich_validated_values(cls, **values: Any) -> dict[str, Any]:
+        """Substitute all $-placeholders, resolving the component ones after validation.
+
+        :param values: The init kwargs for pydantic, extended with defaults
+        :returns: Enriched kwargs
+        """
+        tmp_self = cls(**values, enrich=False)
+        return cls.substitute_in_component(
+            **tmp_self.model_dump(mode="json", by_alias=True)
+        )
+
+    def __resolves_to_validated(self, references: dict[str, str]) -> bool:
+        """Check whether component references resolve the same after validation.
+
+        Validation may change referenced values, e.g. by normalizing them or
+        by serializing a field under its alias.
+
+        :param references: Resolved values of the referenced component variables
+        """
+        if not references:
+            return True
+        validated = generate_substitution(
+            self.model_dump(mode="json", by_alias=True), "component", separator="."
+        )
+        return all(
+            name in validated and str(validated[name]) == value
+            for name, value in references.items()
+        )
+
     @classmethod
     def substitute_in_component(cls, **component_data: Any) -> dict[str, Any]:
         """Substitute all $-placeholders in a component in dict representation.
@@ -113,7 +186,24 @@ class BaseDefaultsComponent(DescConfigModel, ABC):
         :param component_as_dict: Component represented as dict
         :return: Updated component
         """
-        config = get_config()
+        return json.loads(
+            cls._substitution(component_data).substitute(json.dumps(component_data))
+        )
+
+    @staticmethod
+    def _substitution(component_data: dict[str, Any]) -> Substitution:
+        """Generate the substitution for a component in dict representation.
+
+        The variables shared by all components are only resolved once per
+        pipeline if a ``DefaultsResolver`` is active.
+        """
+        resolver = DefaultsResolver.active()
+        if resolver:
+            config = resolver.config
+            pipeline_substitution = resolver.substitution
+        else:
+            config = get_config()
+            pipeline_substitution = generate_pipeline_substitution(config)
         # Leftover variables that were previously introduced in the component by the substitution
         # functions, still hardcoded, because of their names.
         # TODO(Ivan Yordanov): Get rid of them
@@ -127,19 +217,7 @@ class BaseDefaultsComponent(DescConfigModel, ABC):
             substitution_hardcoded,
             separator=".",
         )
-        substitution = generate_substitution(
-            config.model_dump(mode="json"),
-            "config",
-            existing_substitution=component_substitution,
-            separator=".",
-        )
-
-        return json.loads(
-            substitute_nested(
-                json.dumps(component_data),
-                **update_nested_pair(substitution, ENV),
-            )
-        )
+        return Substitution(component_substitution, pipeline_substitution)
 
     @classmethod
     def extend_with_defaults(cls, **kwargs: Any) -> dict[str, Any]:
@@ -160,10 +238,10 @@ class BaseDefaultsComponent(DescConfigModel, ABC):
             elif is_dataclass_instance(v):
                 kwargs[k] = asdict(v)
 
-        defaults_file_paths_ = get_defaults_file_paths(
+        resolver = DefaultsResolver.active() or DefaultsResolver(
             pipeline_path, config, ENV.get("environment")
         )
-        defaults = cls.load_defaults(*defaults_file_paths_)
+        defaults = resolver.resolve(cls)
         log.debug("Enriching component", type=cls.type)
         return update_nested_pair(kwargs, defaults)
 
@@ -192,6 +270,133 @@ class BaseDefaultsComponent(DescConfigModel, ABC):
         """Run custom validation on component."""
 
 
+_active_defaults_resolver: ContextVar[DefaultsResolver | None] = ContextVar(
+    "active_defaults_resolver", default=None
+)
+
+
+@final
+class DefaultsResolver:
+    """Resolve the defaults of all components in a pipeline.
+
+    The ``defaults*.yaml`` files of the pipeline are looked up only once and
+    the merged defaults are cached per component type. Likewise, the config
+    and environment variables used for substitution are resolved only once.
+    A resolver is meant to be activated for a single run, during which the
+    pipeline path, environment and substitution variables don't change.
+
+    :param pipeline_path: Path to the pipeline.yaml file
+    :param config: KPOps configuration
+    :param environment: Environment name
+    """
+
+    def __init__(
+        self, pipeline_path: Path, config: KpopsConfig, environment: str | None
+    ) -> None:
+        self.pipeline_path: Path = pipeline_path
+        self.config: KpopsConfig = config
+        self.environment: str | None = environment
+        self._defaults: dict[type[BaseDefaultsComponent], dict[str, Any]] = {}
+
+    @cached_property
+    def defaults_file_paths(self) -> list[Path]:
+        """Defaults files of the pipeline, ordered from highest to lowest priority."""
+        return get_defaults_file_paths(
+            self.pipeline_path, self.config, self.environment
+        )
+
+    def resolve(self, component_cls: type[BaseDefaultsComponent]) -> dict[str, Any]:
+        """Return the merged defaults for a component type.
+
+        :param component_cls: Component class
+        :returns: Component defaults, must not be modified
+        """
+        if (defaults := self._defaults.get(component_cls)) is None:
+            defaults = component_cls.load_defaults(*self.defaults_file_paths)
+            self._defaults[component_cls] = defaults
+        return defaults
+
+    @contextmanager
+    def activate(self) -> Iterator[Self]:
+        """Use this resolver for all components instantiated within the context."""
+        token = _active_defaults_resolver.set(self)
+        try:
+            yield self
+        finally:
+            _active_defaults_resolver.reset(token)
+
+    @cached_property
+    def substitution(self) -> Substitution:
+        """Substitution variables shared by all components of the pipeline."""
+        return generate_pipeline_substitution(self.config)
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """Fingerprint of the inputs shared by all components of the pipeline.
+
+        Covers the content of the defaults files, the config, the variables
+        set for the pipeline and the environment variables they reference,
+        directly or through the value of another variable, i.e. everything
+        besides its own definition that the enrichment of a component depends on.
+        """
+        defaults = {path: path.read_text() for path in self.defaults_file_paths}
+        config = self.config.model_dump(mode="json")
+        referenced = referenced_env_vars(
+            *defaults.values(),
+            json.dumps(config),
+            *ENV.data.values(),
+        )
+        content = json.dumps(
+            {
+                "defaults": [
+                    [str(path), hashlib.sha256(text.encode()).hexdigest()]
+                    for path, text in defaults.items()
+                ],
+                "config": config,
+                "env": {**ENV.data, **referenced},
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    @staticmethod
+    def active() -> DefaultsResolver | None:
+        """Return the currently active resolver, if any."""
+        return _active_defaults_resolver.get()
+
+
+def referenced_env_vars(*texts: str) -> dict[str, str]:
+    """Collect the environment variables referenced in texts.
+
+    Variables referenced in the value of a referenced variable are collected
+    as well, since the substitution resolves them recursively.
+
+    :param texts: Texts that may contain $-placeholders
+    :returns: Names and values of the referenced environment variables
+    """
+    referenced: dict[str, str] = {}
+    pending = list(texts)
+    while pending:
+        for name in ImprovedTemplate(pending.pop()).get_identifiers():
+            if name not in referenced and name in ENV:
+                referenced[name] = ENV[name]
+                pending.append(referenced[name])
+    return referenced
+
+
+def generate_pipeline_substitution(config: KpopsConfig) -> Substitution:
+    """Generate the substitution variables shared by all components.
+
+    :param config: KPOps configuration
+    :returns: Resolved config and environment variables
+    """
+    substitution = generate_substitution(
+        config.model_dump(mode="json"), "config", separator="."
+    )
+    return Substitution(update_nested_pair(substitution, ENV))
+
+
 def defaults_from_yaml(path: Path, key: str) -> dict[str, Any]:
     """Read component-specific settings from a ``defaults*.yaml`` file and return @default if not found.
 
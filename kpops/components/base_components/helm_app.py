@@ -32,6 +32,7 @@ from kpops.manifests.argo import ArgoSyncWave, enrich_annotations
 from kpops.manifests.kubernetes import K8S_LABEL_MAX_LEN, KubernetesManifest
 from kpops.utils.colorify import magentaify
 from kpops.utils.pydantic import SkipGenerate
+from kpops.utils.yaml import safe_dump, safe_load
 
 log = structlog.get_logger("HelmApp")
 
@@ -86,15 +87,31 @@ class HelmApp(KubernetesApp):
 
     @cached_property
     def _helm(self) -> Helm:
-        """Helm object that contains component-specific config such as repo."""
-        helm = Helm(get_config().helm_config)
+        """Helm object that contains component-specific config."""
+        return Helm(get_config().helm_config)
+
+    async def _add_repo(self) -> None:
+        """Add the Helm repository of this component if it uses one."""
         if self.repo_config is not None:
-            helm.add_repo(
+            await self._helm.add_repo(
                 self.repo_config.repository_name,
                 self.repo_config.url,
                 self.repo_config.repo_auth_flags,
             )
-        return helm
+
+    async def _template(self, values: dict[str, Any]) -> tuple[KubernetesManifest, ...]:
+        """Render the Helm chart of this component locally.
+
+        :param values: Helm values to render the chart with
+        :return: The rendered Kubernetes manifests
+        """
+        return await self._helm.template(
+            self.helm_release_name,
+            self.helm_chart,
+            self.namespace,
+            values,
+            self.template_flags,
+        )
 
     @cached_property
     def _helm_diff(self) -> HelmDiff:
@@ -151,37 +168,65 @@ class HelmApp(KubernetesApp):
         )
 
     @override
-    def manifest_deploy(self) -> tuple[KubernetesManifest, ...]:
+    async def manifest_deploy(self) -> tuple[KubernetesManifest, ...]:
         values = self.to_helm_values()
         if get_config().operation_mode is OperationMode.ARGO:
             sync_wave = ArgoSyncWave(sync_wave=1)
             values = enrich_annotations(values, sync_wave.key, sync_wave.value)
 
-        return self._helm.template(
-            self.helm_release_name,
-            self.helm_chart,
-            self.namespace,
-            values,
-            self.template_flags,
-        )
+        return await self._template(values)
 
     @property
     def deploy_flags(self) -> HelmUpgradeInstallFlags:
         """Return flags for Helm upgrade install command."""
         return HelmUpgradeInstallFlags.model_validate(self.helm_flags.model_dump())
 
+    @override
+    async def prepare(self) -> None:
+        await self._add_repo()
+
     @override
     async def deploy(self, dry_run: bool) -> None:
+        values = self.to_helm_values()
+        if get_config().helm_config.skip_unchanged and await self.is_release_unchanged(
+            values
+        ):
+            log.info(
+                "Helm release unchanged. Skipping upgrade.",
+                release=self.helm_release_name,
+            )
+            return
         stdout = await self._helm.upgrade_install(
             self.helm_release_name,
             self.helm_chart,
             dry_run,
             self.namespace,
-            self.to_helm_values(),
+            values,
             self.deploy_flags,
         )
         if dry_run:
-            self._dry_run_handler.print_helm_diff(stdout, self.helm_release_name, log)
+            await self._dry_run_handler.print_helm_diff(
+                stdout, self.helm_release_name, log
+            )
+
+    async def is_release_unchanged(self, values: dict[str, Any]) -> bool:
+        """Check whether the deployed release matches the chart version and values.
+
+        Releases of charts without a pinned version are never considered unchanged.
+
+        :param values: Helm values to be deployed
+        :return: True if upgrading the release would not change it
+        """
+        if self.version is None:
+            return False
+        release = await self._helm.get_release(self.helm_release_name, self.namespace)
+        if release is None or not release.is_deployed(self.helm_chart, self.version):
+            return False
+        deployed_values = await self._helm.get_values(
+            self.namespace, self.helm_release_name
+        )
+        # normalize the values the same way Helm stores them
+        return (deployed_values or {}) == safe_load(safe_dump(values))
 
     @override
     async def destroy(self, dry_run: bool) -> None:
@@ -206,13 +251,13 @@ class HelmApp(KubernetesApp):
             self.values.fullname_override = name_override
         return self.values.model_dump()
 
-    def print_helm_diff(self, stdout: str) -> None:
+    async def print_helm_diff(self, stdout: str) -> None:
         """Print the diff of the last and current release of this component.
 
         :param stdout: The output of a Helm command that installs or upgrades the release
         """
         current_release = list(
-            self._helm.get_manifest(self.helm_release_name, self.namespace)
+            await self._helm.get_manifest(self.helm_release_name, self.namespace)
         )
         if current_release:
             log.info("Helm release already exists", release=self.helm_release_name)
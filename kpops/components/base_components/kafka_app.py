@@ -17,8 +17,9 @@ class KafkaApp(PipelineComponent, ABC):
     @override
     async def deploy(self, dry_run: bool) -> None:
         if self.to:
-            for topic in self.to.kafka_topics:
-                await get_handlers().topic_handler.create_topic(topic, dry_run=dry_run)
+            await get_handlers().topic_handler.create_topics(
+                self.to.kafka_topics, dry_run=dry_run
+            )
 
             if schema_handler := get_handlers().schema_handler:
                 await schema_handler.submit_schemas(to_section=self.to, dry_run=dry_run)
@@ -54,8 +54,9 @@ class KafkaConnector(PipelineComponent, ABC):
     async def deploy(self, dry_run: bool) -> None:
         """Deploy Kafka Connector (Source/Sink). Create output topics and register schemas if configured."""
         if self.to:
-            for topic in self.to.kafka_topics:
-                await get_handlers().topic_handler.create_topic(topic, dry_run=dry_run)
+            await get_handlers().topic_handler.create_topics(
+                self.to.kafka_topics, dry_run=dry_run
+            )
 
             if schema_handler := get_handlers().schema_handler:
                 await schema_handler.submit_schemas(to_section=self.to, dry_run=dry_run)
@@ -86,8 +87,9 @@ class KafkaConnector(PipelineComponent, ABC):
         if self.to:
             if schema_handler := get_handlers().schema_handler:
                 await schema_handler.delete_schemas(to_section=self.to, dry_run=dry_run)
-            for topic in self.to.kafka_topics:
-                await get_handlers().topic_handler.delete_topic(topic, dry_run=dry_run)
+            await get_handlers().topic_handler.delete_topics(
+                self.to.kafka_topics, dry_run=dry_run
+            )
 
 
 class KafkaSourceConnector(KafkaConnector):
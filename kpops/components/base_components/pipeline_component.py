@@ -253,19 +253,19 @@ class PipelineComponent(BaseDefaultsComponent, ABC):
         """
         return [self]
 
-    def manifest_deploy(self) -> tuple[KubernetesManifest, ...]:
+    async def manifest_deploy(self) -> tuple[KubernetesManifest, ...]:
         """Render Kubernetes manifests for deploy."""
         return ()
 
-    def manifest_destroy(self) -> tuple[KubernetesManifest, ...]:
+    async def manifest_destroy(self) -> tuple[KubernetesManifest, ...]:
         """Render Kubernetes manifests resources for destroy."""
         return ()
 
-    def manifest_reset(self) -> tuple[KubernetesManifest, ...]:
+    async def manifest_reset(self) -> tuple[KubernetesManifest, ...]:
         """Render Kubernetes manifests resources for reset."""
         return ()
 
-    def manifest_clean(self) -> tuple[KubernetesManifest, ...]:
+    async def manifest_clean(self) -> tuple[KubernetesManifest, ...]:
         """Render Kubernetes manifests resources for clean."""
         return ()
 
@@ -274,6 +274,13 @@ class PipelineComponent(BaseDefaultsComponent, ABC):
             context="generate", mode="json", by_alias=True, exclude_none=True
         )
 
+    async def prepare(self) -> None:
+        """Prepare resources shared with other components before the pipeline runs.
+
+        Called concurrently for all components before deploying, resetting,
+        cleaning or rendering manifests, e.g. to add Helm repositories.
+        """
+
     async def deploy(self, dry_run: bool) -> None:
         """Deploy component, e.g. to Kubernetes cluster.
 
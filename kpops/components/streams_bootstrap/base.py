@@ -80,8 +80,8 @@ class StreamsBootstrap(KafkaApp, HelmApp, ABC):
         return self
 
     @override
-    def manifest_deploy(self) -> tuple[KubernetesManifest, ...]:
-        resource = super().manifest_deploy()
+    async def manifest_deploy(self) -> tuple[KubernetesManifest, ...]:
+        resource = await super().manifest_deploy()
         if self.to:
             resource = resource + tuple(
                 StrimziKafkaTopic.from_topic(topic) for topic in self.to.kafka_topics
@@ -90,7 +90,7 @@ class StreamsBootstrap(KafkaApp, HelmApp, ABC):
         return resource
 
     @override
-    def manifest_destroy(self) -> tuple[KubernetesManifest, ...]:
+    async def manifest_destroy(self) -> tuple[KubernetesManifest, ...]:
         if self.to:
             return tuple(
                 StrimziKafkaTopic.from_topic(topic) for topic in self.to.kafka_topics
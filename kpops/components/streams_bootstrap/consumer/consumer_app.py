@@ -48,30 +48,18 @@ class ConsumerAppCleaner(StreamsBootstrapCleaner, StreamsBootstrap):
             await self.clean_pvcs(dry_run)
 
     @override
-    def manifest_deploy(self) -> tuple[KubernetesManifest, ...]:
+    async def manifest_deploy(self) -> tuple[KubernetesManifest, ...]:
         values = self.to_helm_values()
         if get_config().operation_mode is OperationMode.ARGO:
             post_delete = ArgoHook.POST_DELETE
             values = enrich_annotations(values, post_delete.key, post_delete.value)
-        return self._helm.template(
-            self.helm_release_name,
-            self.helm_chart,
-            self.namespace,
-            values,
-            self.template_flags,
-        )
+        return await self._template(values)
 
     @override
-    def manifest_reset(self) -> tuple[KubernetesManifest, ...]:
+    async def manifest_reset(self) -> tuple[KubernetesManifest, ...]:
         values = self.to_helm_values()
 
-        return self._helm.template(
-            self.helm_release_name,
-            self.helm_chart,
-            self.namespace,
-            values,
-            self.template_flags,
-        )
+        return await self._template(values)
 
     async def clean_pvcs(self, dry_run: bool) -> None:
         app_full_name = super(HelmApp, self).full_name
@@ -161,19 +149,19 @@ class ConsumerApp(StreamsBootstrap):
         await self._cleaner.clean(dry_run)
 
     @override
-    def manifest_deploy(self) -> tuple[KubernetesManifest, ...]:
-        manifests = super().manifest_deploy()
+    async def manifest_deploy(self) -> tuple[KubernetesManifest, ...]:
+        manifests = await super().manifest_deploy()
         if get_config().operation_mode is OperationMode.ARGO:
-            manifests = manifests + self._cleaner.manifest_deploy()
+            manifests = manifests + await self._cleaner.manifest_deploy()
 
         return manifests
 
     @override
-    def manifest_reset(self) -> tuple[KubernetesManifest, ...]:
-        return self._cleaner.manifest_reset()
+    async def manifest_reset(self) -> tuple[KubernetesManifest, ...]:
+        return await self._cleaner.manifest_reset()
 
     @override
-    def manifest_clean(self) -> tuple[KubernetesManifest, ...]:
+    async def manifest_clean(self) -> tuple[KubernetesManifest, ...]:
         if get_config().operation_mode is OperationMode.MANIFEST:
-            return self._cleaner.manifest_deploy()
+            return await self._cleaner.manifest_deploy()
         return ()
@@ -37,19 +37,13 @@ class ProducerAppCleaner(StreamsBootstrapCleaner, StreamsBootstrap):  # pyright:
         )
 
     @override
-    def manifest_deploy(self) -> tuple[KubernetesManifest, ...]:
+    async def manifest_deploy(self) -> tuple[KubernetesManifest, ...]:
         values = self.to_helm_values()
         if get_config().operation_mode is OperationMode.ARGO:
             post_delete = ArgoHook.POST_DELETE
             values = enrich_annotations(values, post_delete.key, post_delete.value)
 
-        return self._helm.template(
-            self.helm_release_name,
-            self.helm_chart,
-            self.namespace,
-            values,
-            self.template_flags,
-        )
+        return await self._template(values)
 
 
 class ProducerApp(StreamsBootstrap):
@@ -151,17 +145,17 @@ class ProducerApp(StreamsBootstrap):
         await self._cleaner.clean(dry_run)
 
     @override
-    def manifest_deploy(self) -> tuple[KubernetesManifest, ...]:
-        manifests = super().manifest_deploy()
+    async def manifest_deploy(self) -> tuple[KubernetesManifest, ...]:
+        manifests = await super().manifest_deploy()
         operation_mode = get_config().operation_mode
 
         if operation_mode is OperationMode.ARGO:
-            manifests = manifests + self._cleaner.manifest_deploy()
+            manifests = manifests + await self._cleaner.manifest_deploy()
 
         return manifests
 
     @override
-    def manifest_reset(self) -> tuple[KubernetesManifest, ...]:
+    async def manifest_reset(self) -> tuple[KubernetesManifest, ...]:
         if self.to:
             return tuple(
                 StrimziKafkaTopic.from_topic(topic) for topic in self.to.kafka_topics
@@ -169,7 +163,7 @@ class ProducerApp(StreamsBootstrap):
         return ()
 
     @override
-    def manifest_clean(self) -> tuple[KubernetesManifest, ...]:
+    async def manifest_clean(self) -> tuple[KubernetesManifest, ...]:
         if get_config().operation_mode is OperationMode.MANIFEST:
-            return self._cleaner.manifest_deploy()
+            return await self._cleaner.manifest_deploy()
         return ()
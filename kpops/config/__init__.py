@@ -6,7 +6,14 @@ from typing import ClassVar
 
 import pydantic
 import structlog
-from pydantic import AnyHttpUrl, Field, PrivateAttr, TypeAdapter
+from pydantic import (
+    AnyHttpUrl,
+    Field,
+    PositiveFloat,
+    PositiveInt,
+    PrivateAttr,
+    TypeAdapter,
+)
 from pydantic.json_schema import SkipJsonSchema
 from pydantic_settings import (
     BaseSettings,
@@ -85,6 +92,15 @@ class SchemaRegistryConfig(BaseSettings):
     timeout: int | float = Field(
         default=30, description="Operation timeout in seconds."
     )
+    max_concurrency: PositiveInt | None = Field(
+        default=None,
+        description="Maximum number of concurrent requests to the Schema Registry. Unlimited if not set.",
+    )
+    schema_cache: Path | None = Field(
+        default=None,
+        description="Directory to cache schemas generated by the schema provider in. Disabled if not set. Must be cleared when schema classes change.",
+        examples=[".kpops/schemas"],
+    )
 
 
 class KafkaRestConfig(BaseSettings):
@@ -97,6 +113,34 @@ class KafkaRestConfig(BaseSettings):
     timeout: int | float = Field(
         default=30, description="Operation timeout in seconds."
     )
+    max_concurrency: PositiveInt | None = Field(
+        default=None,
+        description="Maximum number of concurrent requests to the Kafka REST Proxy. Unlimited if not set.",
+    )
+    prefetch: bool = Field(
+        default=False,
+        description="Whether to fetch all topics and their configs in bulk once per run instead of requesting them for each topic.",
+    )
+
+
+class RetryConfig(BaseSettings):
+    """Configuration for retrying requests with exponential backoff."""
+
+    max_attempts: PositiveInt = Field(
+        default=10,
+        description="Maximum number of attempts of a request, including the first one.",
+    )
+    backoff: PositiveFloat = Field(
+        default=0.5,
+        description="Maximum delay in seconds before the first retry. The maximum delay doubles with every retry, the actual delay is chosen at random up to it.",
+    )
+    max_backoff: PositiveFloat = Field(
+        default=10, description="Upper bound of the delay in seconds between retries."
+    )
+    deadline: PositiveFloat | None = Field(
+        default=120,
+        description="Time in seconds after which no more retries are started. Unlimited if not set.",
+    )
 
 
 class KafkaConnectConfig(BaseSettings):
@@ -109,6 +153,18 @@ class KafkaConnectConfig(BaseSettings):
     timeout: int | float = Field(
         default=30, description="Operation timeout in seconds."
     )
+    max_concurrency: PositiveInt | None = Field(
+        default=None,
+        description="Maximum number of concurrent requests to Kafka Connect. Unlimited if not set.",
+    )
+    prefetch: bool = Field(
+        default=False,
+        description="Whether to fetch the info and status of all connectors in bulk once per run instead of requesting them for each connector.",
+    )
+    retry: RetryConfig = Field(
+        default_factory=RetryConfig,
+        description="Retries of requests rejected while Kafka Connect is rebalancing.",
+    )
 
 
 class KpopsConfig(BaseSettings):
@@ -150,6 +206,10 @@ class KpopsConfig(BaseSettings):
         default=HelmConfig(),
         description="Global flags for Helm.",
     )
+    max_concurrency: PositiveInt | None = Field(
+        default=None,
+        description="Maximum number of pipeline steps that are processed concurrently with `--parallel`. Unlimited if not set.",
+    )
     retain_clean_jobs: bool = Field(
         default=False,
         description="Whether to retain clean up jobs in the cluster or uninstall the, after completion.",
@@ -158,6 +218,11 @@ class KpopsConfig(BaseSettings):
         default=None,
         description=describe_object(StrimziTopicConfig.__doc__),
     )
+    component_cache: Path | None = Field(
+        default=None,
+        description="Directory to cache enriched pipeline components in. Components whose definition, defaults, config and environment variables are unchanged are restored from the cache instead of being enriched again. Disabled if not set. Must be cleared when custom component classes change.",
+        examples=[".kpops/components"],
+    )
     operation_mode: SkipJsonSchema[OperationMode] = Field(
         default=OperationMode.MANAGED,
         description="The operation mode of KPOps (managed, manifest, argo).",
@@ -2,11 +2,11 @@ from collections.abc import Iterator
 from typing import Any, ClassVar, Self
 
 import pydantic
-import yaml
 from pydantic import ConfigDict, Field
 from typing_extensions import override
 
 from kpops.utils.pydantic import CamelCaseConfigModel, by_alias
+from kpops.utils.yaml import safe_load_all
 
 K8S_LABEL_MAX_LEN = 63
 # https://kubernetes.io/docs/concepts/workloads/controllers/cron-jobs
@@ -57,7 +57,7 @@ class KubernetesManifest(CamelCaseConfigModel):
 
     @classmethod
     def from_yaml(cls, /, content: str) -> Iterator[Self]:
-        manifests: Iterator[dict[str, Any]] = yaml.safe_load_all(content)
+        manifests: Iterator[dict[str, Any]] = safe_load_all(content)
         for manifest in manifests:
             yield cls(**manifest)
 
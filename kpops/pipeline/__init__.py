@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, TypeAlias
@@ -14,16 +16,21 @@ from pydantic import (
 )
 
 from kpops.component_handlers import ComponentHandlers
+from kpops.components.base_components.base_defaults_component import (
+    DefaultsResolver,
+)
 from kpops.components.base_components.pipeline_component import PipelineComponent
 from kpops.core.exception import KpopsException, ParsingException, ValidationError
 from kpops.core.registry import Registry
+from kpops.pipeline.cache import ComponentCache
+from kpops.utils.concurrency import ConcurrencyLimiter, iterate_in_loop
 from kpops.utils.dict_ops import update_nested_pair
 from kpops.utils.environment import ENV, PIPELINE_PATH
 from kpops.utils.logging import log_action, log_kpops_exception
 from kpops.utils.yaml import CustomSafeDumper, load_yaml_file
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Coroutine, Iterator
+    from collections.abc import AsyncIterator, Awaitable, Coroutine, Iterator
     from pathlib import Path
 
     from kpops.config import KpopsConfig
@@ -45,6 +52,68 @@ async def _run_component(
         raise
 
 
+@dataclass
+class _DependencyScheduler:
+    """Run components of a pipeline graph as soon as their dependencies are done."""
+
+    graph: rx.PyDiGraph[str, None]
+    component_index: dict[str, PipelineComponent]
+    runner: Callable[[PipelineComponent], Coroutine[Any, Any, None]]
+    reverse: bool
+    _pending: dict[int, int] = field(init=False, default_factory=dict)
+    _ready: deque[int] = field(init=False, default_factory=deque)
+    _running: dict[asyncio.Task[None], int] = field(init=False, default_factory=dict)
+
+    def dependencies(self, node: int) -> set[int]:
+        if self.reverse:
+            return set(self.graph.successor_indices(node))
+        return set(self.graph.predecessor_indices(node))
+
+    def dependents(self, node: int) -> set[int]:
+        if self.reverse:
+            return set(self.graph.predecessor_indices(node))
+        return set(self.graph.successor_indices(node))
+
+    async def run(self) -> None:
+        self._pending = {
+            node: len(self.dependencies(node)) for node in self.graph.node_indices()
+        }
+        self._ready.extend(node for node, count in self._pending.items() if count == 0)
+        failure: BaseException | None = None
+        while self._ready or self._running:
+            if failure is None:
+                self.__start_ready()
+            if not self._running:
+                break
+            done, _ = await asyncio.wait(
+                self._running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                node = self._running.pop(task)
+                if (exception := task.exception()) is None:
+                    self.__release(node)
+                elif failure is None:
+                    failure = exception
+        if failure is not None:
+            raise failure
+
+    def __start_ready(self) -> None:
+        while self._ready:
+            node = self._ready.popleft()
+            component = self.component_index.get(self.graph[node])
+            if component is None:
+                # topics and filtered components are resolved immediately
+                self.__release(node)
+                continue
+            self._running[asyncio.create_task(self.runner(component))] = node
+
+    def __release(self, node: int) -> None:
+        for dependent in self.dependents(node):
+            self._pending[dependent] -= 1
+            if self._pending[dependent] == 0:
+                self._ready.append(dependent)
+
+
 @dataclass
 class Pipeline:
     """Pipeline representation."""
@@ -118,105 +187,229 @@ class Pipeline:
         /,
         reverse: bool = False,
     ) -> Awaitable[None]:
-        async def run_layer_parallel(
-            components: list[PipelineComponent],
-        ) -> None:
-            tasks: list[asyncio.Task[None]] = []
-            for component in components:
-                tasks.append(asyncio.create_task(runner(component)))
-            await asyncio.gather(*tasks)
-
-        async def run_graph_layers(
-            pending_layers: list[list[PipelineComponent]],
-        ) -> None:
-            for layer_components in pending_layers:
-                await run_layer_parallel(layer_components)
-
-        graph = self._graph.copy()
-
-        # We add an extra node to the graph, connecting all the leaf nodes to it
-        # in that way we make this node the root of the graph, avoiding backtracking
-        root_node = graph.add_node("root_node_bfs")
+        """Schedule the components along the dependency graph of the pipeline.
 
-        for node in graph.node_indices():
-            if node != root_node and not list(graph.predecessors(node)):
-                graph.add_edge(root_node, node, None)
+        Each component is started as soon as all of its own upstream components
+        (or downstream components in reverse mode) have finished, independent
+        branches of the graph don't wait for each other. Topics are resolved as
+        soon as their dependencies have finished.
 
-        layers_graph = list(rx.bfs_layers(graph, [root_node]))
+        If a component fails, no further components are started. Components
+        that are already running are awaited before the error is raised.
 
-        sorted_layers: list[list[PipelineComponent]] = []
-        for layer in layers_graph[1:]:
-            if parallel_components := self.__get_parallel_components_from(
-                [graph[idx] for idx in layer]
-            ):
-                sorted_layers.append(parallel_components)
+        :param runner: Coroutine function that is executed for every component
+        :param reverse: Whether to traverse the graph from the sinks to the sources,
+            e.g. for destroy, reset & clean
+        :returns: Awaitable running the whole execution graph
+        """
+        scheduler = _DependencyScheduler(
+            self._graph.copy(), self._component_index, runner, reverse
+        )
+        return scheduler.run()
 
-        if reverse:
-            sorted_layers.reverse()
+    async def prepare(self) -> None:
+        """Prepare all pipeline steps concurrently before any of them runs or renders.
 
-        return run_graph_layers(sorted_layers)
+        Resources shared between pipeline steps, e.g. Helm repositories, are
+        set up exactly once instead of lazily by the first step using them.
+        """
+        await asyncio.gather(*(component.prepare() for component in self.components))
 
-    async def deploy(self, dry_run: bool, parallel: bool = False) -> None:
+    async def deploy(
+        self,
+        dry_run: bool,
+        parallel: bool = False,
+        max_concurrency: int | None = None,
+    ) -> None:
         """Deploy pipeline steps.
 
         :param dry_run: Whether to dry run the command or execute it.
         :param parallel: Enable or disable parallel execution of pipeline steps.
+        :param max_concurrency: Maximum number of pipeline steps processed concurrently
+            in parallel mode, unlimited if None.
         """
+        await self.prepare()
         await self._run_action(
             "Deploy",
             lambda component: component.deploy(dry_run),
             parallel,
             reverse=False,
+            max_concurrency=max_concurrency,
         )
 
-    async def destroy(self, dry_run: bool, parallel: bool = False) -> None:
+    async def destroy(
+        self,
+        dry_run: bool,
+        parallel: bool = False,
+        max_concurrency: int | None = None,
+    ) -> None:
         """Destroy pipeline steps.
 
         :param dry_run: Whether to dry run the command or execute it.
         :param parallel: Enable or disable parallel execution of pipeline steps.
+        :param max_concurrency: Maximum number of pipeline steps processed concurrently
+            in parallel mode, unlimited if None.
         """
         await self._run_action(
             "Destroy",
             lambda component: component.destroy(dry_run),
             parallel,
             reverse=True,
+            max_concurrency=max_concurrency,
         )
 
-    async def reset(self, dry_run: bool, parallel: bool = False) -> None:
+    async def reset(
+        self,
+        dry_run: bool,
+        parallel: bool = False,
+        max_concurrency: int | None = None,
+    ) -> None:
         """Reset pipeline steps.
 
         :param dry_run: Whether to dry run the command or execute it.
         :param parallel: Enable or disable parallel execution of pipeline steps.
+        :param max_concurrency: Maximum number of pipeline steps processed concurrently
+            in parallel mode, unlimited if None.
         """
+        await self.prepare()
         await self._run_action(
-            "Reset", lambda component: component.reset(dry_run), parallel, reverse=True
+            "Reset",
+            lambda component: component.reset(dry_run),
+            parallel,
+            reverse=True,
+            max_concurrency=max_concurrency,
         )
 
-    async def clean(self, dry_run: bool, parallel: bool = False) -> None:
+    async def clean(
+        self,
+        dry_run: bool,
+        parallel: bool = False,
+        max_concurrency: int | None = None,
+    ) -> None:
         """Clean pipeline steps.
 
         :param dry_run: Whether to dry run the command or execute it.
         :param parallel: Enable or disable parallel execution of pipeline steps.
+        :param max_concurrency: Maximum number of pipeline steps processed concurrently
+            in parallel mode, unlimited if None.
         """
+        await self.prepare()
         await self._run_action(
-            "Clean", lambda component: component.clean(dry_run), parallel, reverse=True
+            "Clean",
+            lambda component: component.clean(dry_run),
+            parallel,
+            reverse=True,
+            max_concurrency=max_concurrency,
         )
 
-    def manifest_deploy(self) -> Iterator[tuple[KubernetesManifest, ...]]:
-        for component in self.components:
-            yield component.manifest_deploy()
+    def manifest_deploy(
+        self, parallel: bool = False, max_concurrency: int | None = None
+    ) -> Iterator[tuple[KubernetesManifest, ...]]:
+        """Render the deployment manifests of pipeline steps.
 
-    def manifest_destroy(self) -> Iterator[tuple[KubernetesManifest, ...]]:
-        for component in self.components:
-            yield component.manifest_destroy()
+        :param parallel: Enable or disable parallel rendering of pipeline steps.
+        :param max_concurrency: Maximum number of pipeline steps rendered concurrently
+            in parallel mode, unlimited if None.
+        :returns: Manifests of each pipeline step, in pipeline order
+        """
+        return iterate_in_loop(
+            self._render_manifests(
+                lambda component: component.manifest_deploy(), parallel, max_concurrency
+            )
+        )
 
-    def manifest_reset(self) -> Iterator[tuple[KubernetesManifest, ...]]:
-        for component in self.components:
-            yield component.manifest_reset()
+    def manifest_destroy(
+        self, parallel: bool = False, max_concurrency: int | None = None
+    ) -> Iterator[tuple[KubernetesManifest, ...]]:
+        """Render the destroy manifests of pipeline steps.
 
-    def manifest_clean(self) -> Iterator[tuple[KubernetesManifest, ...]]:
-        for component in self.components:
-            yield component.manifest_clean()
+        :param parallel: Enable or disable parallel rendering of pipeline steps.
+        :param max_concurrency: Maximum number of pipeline steps rendered concurrently
+            in parallel mode, unlimited if None.
+        :returns: Manifests of each pipeline step, in pipeline order
+        """
+        return iterate_in_loop(
+            self._render_manifests(
+                lambda component: component.manifest_destroy(),
+                parallel,
+                max_concurrency,
+            )
+        )
+
+    def manifest_reset(
+        self, parallel: bool = False, max_concurrency: int | None = None
+    ) -> Iterator[tuple[KubernetesManifest, ...]]:
+        """Render the reset manifests of pipeline steps.
+
+        :param parallel: Enable or disable parallel rendering of pipeline steps.
+        :param max_concurrency: Maximum number of pipeline steps rendered concurrently
+            in parallel mode, unlimited if None.
+        :returns: Manifests of each pipeline step, in pipeline order
+        """
+        return iterate_in_loop(
+            self._render_manifests(
+                lambda component: component.manifest_reset(), parallel, max_concurrency
+            )
+        )
+
+    def manifest_clean(
+        self, parallel: bool = False, max_concurrency: int | None = None
+    ) -> Iterator[tuple[KubernetesManifest, ...]]:
+        """Render the clean manifests of pipeline steps.
+
+        :param parallel: Enable or disable parallel rendering of pipeline steps.
+        :param max_concurrency: Maximum number of pipeline steps rendered concurrently
+            in parallel mode, unlimited if None.
+        :returns: Manifests of each pipeline step, in pipeline order
+        """
+        return iterate_in_loop(
+            self._render_manifests(
+                lambda component: component.manifest_clean(), parallel, max_concurrency
+            )
+        )
+
+    async def _render_manifests(
+        self,
+        component_manifest: Callable[
+            [PipelineComponent],
+            Awaitable[tuple[KubernetesManifest, ...]] | tuple[KubernetesManifest, ...],
+        ],
+        parallel: bool,
+        max_concurrency: int | None = None,
+    ) -> AsyncIterator[tuple[KubernetesManifest, ...]]:
+        await self.prepare()
+
+        async def render(
+            component: PipelineComponent,
+        ) -> tuple[KubernetesManifest, ...]:
+            manifests = component_manifest(component)
+            # support components overriding the manifest hooks synchronously
+            if inspect.isawaitable(manifests):
+                return await manifests
+            return manifests
+
+        if not parallel:
+            for component in self.components:
+                yield await render(component)
+            return
+        limiter = ConcurrencyLimiter(max_concurrency)
+
+        async def render_limited(
+            component: PipelineComponent,
+        ) -> tuple[KubernetesManifest, ...]:
+            async with limiter:
+                return await render(component)
+
+        tasks = [
+            asyncio.create_task(render_limited(component))
+            for component in self.components
+        ]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def _run_action(
         self,
@@ -224,9 +417,15 @@ class Pipeline:
         component_action: Callable[[PipelineComponent], Coroutine[Any, Any, None]],
         parallel: bool,
         reverse: bool,
+        max_concurrency: int | None = None,
     ) -> None:
+        limiter = ConcurrencyLimiter(max_concurrency if parallel else None)
+
         async def runner(component: PipelineComponent) -> None:
-            await _run_component(action_name, component, component_action(component))
+            async with limiter:
+                await _run_component(
+                    action_name, component, component_action(component)
+                )
 
         if parallel:
             await self.build_execution_graph(runner, reverse=reverse)
@@ -273,17 +472,6 @@ class Pipeline:
         topic = self.__get_or_add_node(topic_id)
         self._graph.add_edge(topic, target, None)
 
-    def __get_parallel_components_from(
-        self, layer: list[str]
-    ) -> list[PipelineComponent]:
-        def gen_parallel_components() -> Iterator[PipelineComponent]:
-            for node_in_layer in layer:
-                # check if component, skip topics
-                if (component := self._component_index.get(node_in_layer)) is not None:
-                    yield component
-
-        return list(gen_parallel_components())
-
     def __validate_graph(self) -> None:
         if not rx.is_directed_acyclic_graph(self._graph):
             msg = "Pipeline is not a valid DAG."
@@ -316,6 +504,11 @@ class PipelineGenerator:
     env_components_index: dict[str, dict[str, Any]] = field(
         init=False, default_factory=dict
     )
+    component_cache: ComponentCache | None = field(init=False, default=None)
+
+    def __post_init__(self) -> None:
+        if self.config.component_cache:
+            self.component_cache = ComponentCache(self.config.component_cache)
 
     def parse(
         self,
@@ -369,7 +562,8 @@ class PipelineGenerator:
                 msg = f"The pipeline definition {env_file} should contain a list of components"
                 raise TypeError(msg)
 
-        return self.parse(main_content, env_content)  # pyright: ignore[reportUnknownArgumentType]
+        with DefaultsResolver(path, self.config, environment).activate():
+            return self.parse(main_content, env_content)  # pyright: ignore[reportUnknownArgumentType]
 
     def parse_components(self, components: list[dict[str, Any]]) -> None:
         """Instantiate, enrich and inflate a list of components.
@@ -405,8 +599,9 @@ class PipelineGenerator:
         :param component_class: Type of pipeline component
         :param component_data: Arguments for instantiation of pipeline component
         """
-        component = component_class(**component_data)
-        component = self.enrich_component_with_env(component)
+        component = self.create_component(
+            component_class, self.enrich_component_with_env(component_data)
+        )
         # if component is disabled then we skip it
         if not component.enabled:
             return
@@ -432,23 +627,47 @@ class PipelineGenerator:
                 inflated_component.weave_from_topics(prev_component.to)
             self.pipeline.add(inflated_component)
 
-    def enrich_component_with_env(
-        self, component: PipelineComponent
+    def create_component(
+        self, component_class: type[PipelineComponent], component_data: dict[str, Any]
     ) -> PipelineComponent:
-        """Enrich a pipeline component with env-specific config.
+        """Instantiate and enrich a pipeline component.
+
+        If the component cache is enabled, a component with an unchanged
+        fingerprint is validated from its cached enriched values instead.
 
-        :param component: Component to be enriched
+        :param component_class: Type of pipeline component
+        :param component_data: Arguments for instantiation of pipeline component
         :returns: Enriched component
         """
-        env_component = self.env_components_index.get(component.name)
-        if not env_component:
+        resolver = DefaultsResolver.active()
+        if (
+            self.component_cache is None
+            or resolver is None
+            or not component_data.get("enrich", True)
+        ):
+            return component_class(**component_data)
+        key = ComponentCache.key(component_class, component_data, resolver)
+        values = self.component_cache.get(key)
+        if values is None:
+            component = component_class(**component_data)
+            self.component_cache.set(
+                key, component.model_dump(mode="json", by_alias=True)
+            )
             return component
-        env_component_as_dict = update_nested_pair(
-            env_component,
-            component.model_dump(mode="json", by_alias=True),
-        )
+        return component_class(**{**values, "enrich": False, "validate": True})
+
+    def enrich_component_with_env(
+        self, component_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Enrich the arguments of a pipeline component with env-specific config.
 
-        return component.__class__(**env_component_as_dict)
+        :param component_data: Arguments for instantiation of pipeline component
+        :returns: Enriched arguments
+        """
+        env_component = self.env_components_index.get(component_data.get("name", ""))
+        if not env_component:
+            return component_data
+        return update_nested_pair(env_component, component_data)
 
     @staticmethod
     def pipeline_filename_environment(pipeline_path: Path, environment: str) -> Path:
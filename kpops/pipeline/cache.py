@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any, final
+
+import structlog
+
+from kpops.const import __version__
+from kpops.utils.files import write_atomic
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from kpops.components.base_components.base_defaults_component import (
+        DefaultsResolver,
+    )
+    from kpops.components.base_components.pipeline_component import (
+        PipelineComponent,
+    )
+
+log = structlog.get_logger("ComponentCache")
+
+
+@functools.cache
+def _schema_digest(component_class: type[PipelineComponent]) -> str:
+    """Digest the JSON schema of a component class, including its field defaults."""
+    schema = json.dumps(component_class.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode()).hexdigest()
+
+
+@final
+class ComponentCache:
+    """On-disk cache for the enriched values of pipeline components.
+
+    Enriched values are stored under a fingerprint of everything their
+    enrichment depends on, i.e. the KPOps version, the component class and its
+    schema including field defaults, the component definition and the
+    fingerprint of the pipeline's defaults files, config and environment
+    variables. A component with an unchanged fingerprint is validated from its
+    cached values without being enriched again.
+
+    :param directory: Directory in which enriched components are stored
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    @staticmethod
+    def key(
+        component_class: type[PipelineComponent],
+        component_data: dict[str, Any],
+        resolver: DefaultsResolver,
+    ) -> str:
+        """Compute the fingerprint of a component.
+
+        :param component_class: Type of pipeline component
+        :param component_data: Definition of the component, including
+            environment-specific overrides
+        :param resolver: Defaults resolver of the pipeline
+        :return: Cache key
+        """
+        content = json.dumps(
+            {
+                "version": __version__,
+                "class": f"{component_class.__module__}.{component_class.__qualname__}",
+                "schema": _schema_digest(component_class),
+                "component": component_data,
+                "pipeline": resolver.fingerprint,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Read the enriched values stored under a key.
+
+        :param key: Cache key
+        :return: Enriched values of the component, None if not cached
+        """
+        try:
+            values = json.loads(self.__path(key).read_text())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(values, dict):
+            return None
+        log.debug("Using cached component.", key=key)
+        return values  # pyright: ignore[reportUnknownVariableType]
+
+    def set(self, key: str, values: dict[str, Any]) -> None:
+        """Store the enriched values of a component under a key.
+
+        :param key: Cache key
+        :param values: Enriched values of the component
+        """
+        try:
+            write_atomic(self.__path(key), json.dumps(values))
+        except OSError as e:
+            log.warning("Could not cache component.", error=str(e))
+
+    def __path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
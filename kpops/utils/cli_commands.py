@@ -1,7 +1,6 @@
 from pathlib import Path
 from typing import Any
 
-import yaml
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 from pydantic_core import PydanticUndefined
@@ -11,6 +10,7 @@ from kpops.const.file_type import KpopsFileType
 from kpops.utils.docstring import describe_object
 from kpops.utils.json import is_jsonable
 from kpops.utils.pydantic import collect_fields, issubclass_patched
+from kpops.utils.yaml import safe_dump
 
 
 def extract_config_fields_for_yaml(
@@ -58,7 +58,7 @@ def create_config(file_name: str, dir_path: Path, include_optional: bool) -> Non
         for k in non_required:
             required.pop(k, None)
         conf.write("\n\n# Required fields\n")
-        conf.write(yaml.safe_dump(required))
+        conf.write(safe_dump(required))
 
         if include_optional:
             dump = KpopsConfig.model_validate(non_required).model_dump(
@@ -67,7 +67,7 @@ def create_config(file_name: str, dir_path: Path, include_optional: bool) -> Non
             for k in required:
                 dump.pop(k, None)
             conf.write("\n# Non-required fields\n")
-            conf.write(yaml.safe_dump(dump))
+            conf.write(safe_dump(dump))
 
 
 def init_project(path: Path, conf_incl_opt: bool) -> None:
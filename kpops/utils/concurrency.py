@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import weakref
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast, final
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Coroutine, Generator
+    from types import TracebackType
+
+T = TypeVar("T")
+
+
+@final
+class ConcurrencyLimiter:
+    """Limit the number of concurrent operations, e.g. requests to a service.
+
+    The underlying semaphore is created lazily for each running event loop,
+    so a limiter can be shared across multiple ``asyncio.run`` calls.
+
+    :param limit: Maximum number of concurrent operations, unlimited if None
+    """
+
+    def __init__(self, limit: int | None) -> None:
+        self.limit = limit
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    def __semaphore(self) -> asyncio.Semaphore | None:
+        if self.limit is None:
+            return None
+        loop = asyncio.get_running_loop()
+        if (semaphore := self._semaphores.get(loop)) is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.limit)
+        return semaphore
+
+    async def __aenter__(self) -> None:
+        if (semaphore := self.__semaphore()) is not None:
+            await semaphore.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if (semaphore := self.__semaphore()) is not None:
+            semaphore.release()
+
+
+@final
+class RunCache(Generic[T]):
+    """Compute a value once per run and share it between concurrent callers.
+
+    A run corresponds to a running event loop, so the value is computed again
+    in the next ``asyncio.run`` call. A failed computation is not cached.
+
+    :param factory: Coroutine function that computes the value
+    """
+
+    def __init__(self, factory: Callable[[], Coroutine[Any, Any, T]]) -> None:
+        self._factory = factory
+        self._task: asyncio.Task[T] | None = None
+
+    async def get(self) -> T:
+        """Return the value, computing it if it is not cached for this run."""
+        loop = asyncio.get_running_loop()
+        task = self._task
+        if (
+            task is None
+            or task.get_loop() is not loop
+            or (task.done() and (task.cancelled() or task.exception() is not None))
+        ):
+            task = self._task = loop.create_task(self._factory())
+        # a cancelled caller must not cancel the computation for other callers
+        return await asyncio.shield(task)
+
+    def invalidate(self) -> None:
+        """Discard the cached value, so that the next call computes it again."""
+        self._task = None
+
+
+def iterate_in_loop(iterator: AsyncIterator[T]) -> Generator[T]:
+    """Iterate an async iterator synchronously within a single event loop.
+
+    Items are yielded as soon as they are available, so the caller can
+    consume them while the remaining ones are still pending. The event loop
+    is closed once the iterator is exhausted or the caller stops iterating.
+
+    :param iterator: Async iterator to consume
+    :returns: Items of the async iterator
+    """
+    exhausted = object()
+
+    async def next_item() -> object:
+        return await anext(iterator, exhausted)
+
+    with asyncio.Runner() as runner:
+        try:
+            while (item := runner.run(next_item())) is not exhausted:
+                yield cast("T", item)
+        finally:
+            if (aclose := getattr(iterator, "aclose", None)) is not None:
+                runner.run(aclose())
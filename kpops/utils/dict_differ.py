@@ -7,10 +7,10 @@ from enum import StrEnum
 from typing import TYPE_CHECKING, Any, Generic, NamedTuple, TypeVar, cast
 
 import typer
-import yaml
 from dictdiffer import diff, patch
 
 from kpops.component_handlers.helm.model import KeyPath
+from kpops.utils.yaml import safe_dump
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator, Sequence
@@ -138,4 +138,4 @@ def colorize_line(line: str) -> str:
 
 
 def to_yaml(data: Mapping[str, Any]) -> Sequence[str]:
-    return yaml.safe_dump(data, sort_keys=True).splitlines(keepends=True)
+    return safe_dump(data, sort_keys=True).splitlines(keepends=True)
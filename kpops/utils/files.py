@@ -0,0 +1,24 @@
+import os
+import threading
+from pathlib import Path
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """Write a text file atomically.
+
+    The content is written to a temporary file next to the target, which then
+    replaces the target, so that concurrent runs never read a partially
+    written file. Missing parent directories are created.
+
+    :param path: Path of the file
+    :param content: Text to write
+    :raises OSError: The file could not be written
+    """
+    temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.write_text(content)
+        temp_path.replace(path)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+        raise
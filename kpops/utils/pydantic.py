@@ -1,10 +1,24 @@
 import json
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
-from typing import Annotated, Any, ClassVar, TypeAlias, final
+from types import NoneType, UnionType
+from typing import (
+    Annotated,
+    Any,
+    ClassVar,
+    TypeAlias,
+    Union,
+    final,
+    get_args,
+    get_origin,
+)
 
 import humps
 import structlog
 from pydantic import (
+    AliasChoices,
     BaseModel,
     BeforeValidator,
     ConfigDict,
@@ -16,7 +30,7 @@ from pydantic import (
 )
 from pydantic.fields import FieldInfo
 from pydantic.json_schema import SkipJsonSchema
-from pydantic_core import PydanticUseDefault, core_schema
+from pydantic_core import PydanticUseDefault, core_schema, to_jsonable_python
 from pydantic_settings import BaseSettings, PydanticBaseSettingsSource
 from typing_extensions import TypeVar, override
 
@@ -122,6 +136,89 @@ def exclude_defaults(
     }
 
 
+def include_defaults(
+    model_cls: type[BaseModel], model_data: dict[str, Any]
+) -> dict[str, Any]:
+    """Add the default values of all unset fields, including those of nested models.
+
+    Counterpart to ``exclude_defaults`` for raw model data, which allows
+    processing the complete model without validating it first.
+    Excluded fields are skipped.
+
+    :param model_cls: Model
+    :param model_data: Model data in JSON representation
+    :return: Model data with defaults in JSON representation
+    """
+    data = dict(model_data)
+    for field in _fields_with_defaults(model_cls):
+        key = next((key for key in field.keys if key in data), None)
+        if key is None:
+            if not field.required:
+                data[field.serialization_key] = deepcopy(field.default)
+            continue
+        value = data[key]
+        if field.nested_model_cls and isinstance(value, dict):
+            data[key] = include_defaults(field.nested_model_cls, value)  # pyright: ignore[reportUnknownArgumentType]
+    return data
+
+
+@dataclass(frozen=True)
+class _FieldWithDefault:
+    keys: tuple[str, ...]
+    serialization_key: str
+    required: bool
+    default: Any
+    nested_model_cls: type[BaseModel] | None
+
+
+@cache
+def _fields_with_defaults(
+    model_cls: type[BaseModel],
+) -> tuple[_FieldWithDefault, ...]:
+    fields: list[_FieldWithDefault] = []
+    for field_name, field_info in model_cls.model_fields.items():
+        if field_info.exclude:
+            continue
+        keys = [field_name]
+        if field_info.alias:
+            keys.append(field_info.alias)
+        if isinstance(field_info.validation_alias, str):
+            keys.append(field_info.validation_alias)
+        elif isinstance(field_info.validation_alias, AliasChoices):
+            keys.extend(
+                choice
+                for choice in field_info.validation_alias.choices
+                if isinstance(choice, str)
+            )
+        required = field_info.is_required()
+        fields.append(
+            _FieldWithDefault(
+                keys=tuple(dict.fromkeys(keys)),
+                serialization_key=field_info.serialization_alias
+                or field_info.alias
+                or field_name,
+                required=required,
+                default=None
+                if required
+                else to_jsonable_python(
+                    field_info.get_default(call_default_factory=True), by_alias=True
+                ),
+                nested_model_cls=_nested_model(field_info.annotation),
+            )
+        )
+    return tuple(fields)
+
+
+def _nested_model(annotation: Any) -> type[BaseModel] | None:
+    if isinstance(annotation, type) and issubclass_patched(annotation):
+        return annotation
+    if get_origin(annotation) in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if len(args) == 1:
+            return _nested_model(args[0])
+    return None
+
+
 ModelFields: TypeAlias = dict[str, "FieldInfo | ModelFields"]
 
 
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import random
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from kpops.config import RetryConfig
+
+
+def backoff_delays(config: RetryConfig) -> Iterator[float]:
+    """Generate the delays between attempts of an operation.
+
+    The delays grow exponentially and are randomized with full jitter, so that
+    concurrent clients do not retry in lockstep. The generator is exhausted once
+    the maximum number of attempts is reached or the next attempt would start
+    after the deadline.
+
+    :param config: Retry configuration
+    :return: Delays in seconds before each retry
+    """
+    # the deadline counts from the call, not from the first delay requested
+    return _backoff_delays(config, time.monotonic())
+
+
+def _backoff_delays(config: RetryConfig, start: float) -> Iterator[float]:
+    for attempt in range(config.max_attempts - 1):
+        cap = min(config.max_backoff, config.backoff * 2**attempt)
+        delay = random.uniform(0, cap)
+        if (
+            config.deadline is not None
+            and time.monotonic() - start + delay > config.deadline
+        ):
+            return
+        yield delay
@@ -1,11 +1,14 @@
-import json
-from collections.abc import Hashable, Mapping
+from __future__ import annotations
+
+import re
+from collections.abc import Hashable, Iterable, Iterator, Mapping
+from copy import deepcopy
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple, final
 
 import structlog
 import yaml
-from cachetools import cached
+from cachetools import LRUCache, cached
 from cachetools.keys import hashkey
 from rich.console import Console
 from rich.syntax import Syntax
@@ -13,23 +16,116 @@ from typing_extensions import override
 
 from kpops.utils.dict_ops import ImprovedTemplate
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
 log = structlog.get_logger("Yaml")
 
 
+YAML_CACHE_SIZE = 256
+_YAML_CACHE: LRUCache[Hashable, Any] = LRUCache(maxsize=YAML_CACHE_SIZE)
+
+
 def generate_hashkey(
     file_path: Path, substitution: Mapping[str, Any] | None = None
 ) -> tuple[Hashable, ...]:
-    if substitution is None:
-        substitution = {}
-    return hashkey(str(file_path) + str(sorted(substitution.items())))
+    """Generate the cache key for a YAML document.
+
+    The key changes whenever the file is modified, so that a changed file is
+    loaded again.
+
+    :param file_path: Path to the YAML file
+    :param substitution: The key-value mapping containing substitutions
+    :return: Cache key
+    """
+    path = file_path.resolve()
+    stat = path.stat()
+    items = substitution.items() if substitution else ()
+    try:
+        frozen_substitution: Hashable = frozenset(items)
+    except TypeError:  # unhashable values
+        frozen_substitution = frozenset((key, repr(value)) for key, value in items)
+    return hashkey(str(path), stat.st_mtime_ns, stat.st_size, frozen_substitution)
 
 
-@cached(cache={}, key=generate_hashkey)
 def load_yaml_file(
     file_path: Path, *, substitution: Mapping[str, Any] | None = None
+) -> Any:
+    """Load a YAML file and substitute its $-placeholders.
+
+    Parsed documents are kept in a bounded LRU cache. Every call returns a
+    copy, so the document can be modified without affecting the cache.
+
+    :param file_path: Path to the YAML file
+    :param substitution: The key-value mapping containing substitutions
+    :return: Parsed YAML document
+    """
+    return deepcopy(_load_yaml_document(file_path, substitution=substitution))
+
+
+class YamlCacheInfo(NamedTuple):
+    """Statistics of the YAML document cache.
+
+    :param hits: Number of documents served from the cache
+    :param misses: Number of documents that were loaded from disk
+    :param maxsize: Maximum number of cached documents
+    :param currsize: Current number of cached documents
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def yaml_cache_info() -> YamlCacheInfo:
+    """Return hits, misses and size of the YAML document cache."""
+    info = _load_yaml_document.cache_info()
+    return YamlCacheInfo(info.hits, info.misses, YAML_CACHE_SIZE, len(_YAML_CACHE))
+
+
+def yaml_cache_clear() -> None:
+    """Clear the YAML document cache and reset its statistics."""
+    _load_yaml_document.cache_clear()
+
+
+@cached(cache=_YAML_CACHE, key=generate_hashkey, info=True)
+def _load_yaml_document(
+    file_path: Path, *, substitution: Mapping[str, Any] | None = None
 ) -> Any:
     log.debug("Picked up YAML file", path=file_path.resolve().relative_to(Path.cwd()))
-    return yaml.safe_load(substitute(file_path.read_text(), substitution))
+    return safe_load(substitute(file_path.read_text(), substitution))
+
+
+def safe_load(stream: str) -> Any:
+    """Parse a YAML document, using libyaml if available.
+
+    :param stream: YAML document
+    :return: Parsed YAML document
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_load_all(stream: str) -> Iterator[Any]:
+    """Parse all documents in a YAML stream, using libyaml if available.
+
+    :param stream: YAML stream
+    :return: Parsed YAML documents
+    """
+    return yaml.load_all(stream, Loader=SafeLoader)
+
+
+def safe_dump(data: Any, *, sort_keys: bool = True) -> str:
+    """Serialize data to YAML, using libyaml if available.
+
+    :param data: Data to serialize
+    :param sort_keys: Whether to sort mapping keys, defaults to True
+    :return: YAML document
+    """
+    return yaml.dump(data, Dumper=SafeDumper, sort_keys=sort_keys)
 
 
 def substitute(input: str, substitution: Mapping[str, Any] | None = None) -> str:
@@ -49,18 +145,6 @@ def substitute(input: str, substitution: Mapping[str, Any] | None = None) -> str
     return ImprovedTemplate(input).safe_substitute(**prepare_substitution(substitution))
 
 
-def _diff_substituted_str(s1: str, s2: str) -> None:
-    """Compare 2 strings, raise exception if not equal.
-
-    :param s1: String to compare
-    :param s2: String to compare
-    :raises ValueError: An infinite loop condition detected. Check substitution variables.
-    """
-    if s1 != s2:
-        msg = "An infinite loop condition detected. Check substitution variables."
-        raise ValueError(msg)
-
-
 def substitute_nested(input: str, **kwargs: Any) -> str:
     """Allow for multiple substitutions to be passed.
 
@@ -85,32 +169,191 @@ def substitute_nested(input: str, **kwargs: Any) -> str:
     """
     if not kwargs:
         return input
-    kwargs = substitute_in_self(kwargs)
-    old_str, new_str = "", substitute(input, kwargs)
-    steps: set[str] = set()
-    while new_str not in steps:
-        steps.add(new_str)
-        old_str, new_str = new_str, substitute(new_str, kwargs)
-    _diff_substituted_str(new_str, old_str)
-    return old_str
+    return Substitution(kwargs).substitute(input)
 
 
 def substitute_in_self(input: dict[str, Any]) -> dict[str, Any]:
     """Substitute all self-references in mapping.
 
-    Will make as many passes as needed to substitute all possible placeholders.
-
     :param input: Mapping containing $-placeholders
     :raises ValueError: An infinite loop condition detected. Check substitution variables.
     :return: Substituted input mapping as dict
     """
-    old_str, new_str = "", substitute(json.dumps(input), input)
-    steps: set[str] = set()
-    while new_str not in steps:
-        steps.add(new_str)
-        old_str, new_str = new_str, substitute(new_str, json.loads(new_str))
-    _diff_substituted_str(new_str, old_str)
-    return json.loads(old_str)
+    return Substitution(input).variables
+
+
+@final
+class Substitution:
+    """Substitution variables resolved along their references.
+
+    Variables can reference other variables using $-placeholders. All of them
+    are resolved once in dependency order, after which any input can be
+    substituted without resolving the variables again.
+
+    A substitution can extend a parent substitution, e.g. component variables
+    extending the config variables. Resolved variables of the parent are
+    reused unless they reference a variable that is (re)defined by the child.
+
+    :param variables: Substitution variables
+    :param parent: Resolved substitution to extend, defaults to None
+    :raises ValueError: An infinite loop condition detected. Check substitution variables.
+    """
+
+    def __init__(
+        self, variables: Mapping[str, Any], parent: Substitution | None = None
+    ) -> None:
+        self._parent: Substitution | None = parent
+        self._variables: dict[str, Any] = {}
+        self._keys: dict[str, str] = {}
+        self._resolved: dict[str, Any] = {}
+        self._references: dict[str, frozenset[str]] = {}
+        self._open: set[str] = set()
+        self._pending: set[str] = set()
+        templated = {name: value for name, value in variables.items() if "$" in name}
+        self._define(
+            {name: value for name, value in variables.items() if name not in templated}
+        )
+        # variable names can contain placeholders as well
+        while templated:
+            substituted = {
+                self.substitute(name): value for name, value in templated.items()
+            }
+            if substituted.keys() == templated.keys():
+                self._define(templated)
+                break
+            templated = {
+                name: value for name, value in substituted.items() if "$" in name
+            }
+            self._define(
+                {
+                    name: value
+                    for name, value in substituted.items()
+                    if name not in templated
+                }
+            )
+
+    @property
+    def variables(self) -> dict[str, Any]:
+        """Resolved substitution variables."""
+        variables = self._parent.variables if self._parent else {}
+        variables.update(self._resolved)
+        return variables
+
+    def substitute(self, input: str, references: set[str] | None = None) -> str:
+        """Substitute all $-placeholders in input.
+
+        :param input: The raw input containing $-placeholders
+        :param references: Collects the names of all variables the input
+            references, including indirect references, defaults to None
+        :raises ValueError: An infinite loop condition detected. Check substitution variables.
+        :return: Substituted input string
+        """
+        return self._substitute(input, references if references is not None else set())
+
+    def _define(self, variables: dict[str, Any]) -> None:
+        """Add variables and resolve all variables affected by them."""
+        if not variables:
+            return
+        affected = set(variables) | self._open
+        affected.update(
+            name
+            for name, references in self._references.items()
+            if not references.isdisjoint(variables)
+        )
+        if self._parent:
+            affected.update(self._parent._dependents(variables.keys()))
+        self._variables.update(variables)
+        self._keys.update((_key(name), name) for name in variables)
+        for name in affected:
+            self._resolved.pop(name, None)
+            self._open.discard(name)
+        self._pending = affected
+        # resolve in order of definition for deterministic error messages
+        for name in (*variables, *sorted(affected.difference(variables))):
+            self._resolve(name, [])
+        self._pending = set()
+
+    def _dependents(self, names: Iterable[str]) -> set[str]:
+        """Return all variables that are affected by (re)defining the given variables."""
+        redefined = {
+            name for key in map(_key, names) if (name := self._lookup(key)) is not None
+        }
+        dependents = set(self._open)
+        if redefined:
+            dependents.update(
+                name
+                for name, references in self._references.items()
+                if not references.isdisjoint(redefined)
+            )
+        if self._parent:
+            dependents.update(self._parent._dependents(names))
+        return dependents
+
+    def _lookup(self, key: str) -> str | None:
+        if (name := self._keys.get(key)) is not None:
+            return name
+        return self._parent._lookup(key) if self._parent else None
+
+    def _variable(self, name: str) -> Any:
+        if name in self._variables or not self._parent:
+            return self._variables[name]
+        return self._parent._variable(name)
+
+    def _value(self, name: str) -> tuple[Any, frozenset[str]]:
+        if name in self._resolved or not self._parent:
+            return self._resolved[name], self._references[name]
+        return self._parent._value(name)
+
+    def _resolve(self, name: str, path: list[str]) -> None:
+        if name in self._resolved:
+            return
+        if name in path:
+            cycle = " -> ".join((*path[path.index(name) :], name))
+            msg = f"An infinite loop condition detected. Check substitution variables: {cycle}"
+            raise ValueError(msg)
+        value = self._variable(name)
+        references: set[str] = set()
+        if isinstance(value, str):
+            path.append(name)
+            value = self._substitute(value, references, path)
+            path.pop()
+            if "$" in value:
+                self._open.add(name)
+        self._resolved[name] = value
+        self._references[name] = frozenset(references)
+
+    def _substitute(
+        self, input: str, references: set[str], path: list[str] | None = None
+    ) -> str:
+        def convert(match: re.Match[str]) -> str:
+            named = match.group("named") or match.group("braced")
+            if named is not None:
+                name = self._lookup(_key(named))
+                if name is None:
+                    return match.group()
+                if path is not None and name in self._pending:
+                    self._resolve(name, path)
+                value, value_references = self._value(name)
+                references.add(name)
+                references.update(value_references)
+                return str(value)
+            if match.group("escaped") is not None:
+                return ImprovedTemplate.delimiter
+            return match.group()
+
+        steps: set[str] = set()
+        while input not in steps:
+            steps.add(input)
+            output = ImprovedTemplate.pattern.sub(convert, input)
+            if output == input:
+                return output
+            input = output
+        msg = "An infinite loop condition detected. Check substitution variables."
+        raise ValueError(msg)
+
+
+def _key(name: str) -> str:
+    return name.replace(".", "__")
 
 
 def multiline_str_representer(
@@ -124,6 +367,7 @@ def multiline_str_representer(
 yaml.representer.SafeRepresenter.add_representer(str, multiline_str_representer)
 
 
+# NOTE: libyaml's emitter cannot be customized, hence the pure Python dumper
 class CustomSafeDumper(yaml.SafeDumper):
     @override
     def increase_indent(self, flow: bool = False, indentless: bool = False) -> None:
@@ -1,10 +1,17 @@
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 import yaml
 
-from kpops.utils.yaml import load_yaml_file
+from kpops.utils.yaml import (
+    YAML_CACHE_SIZE,
+    YamlCacheInfo,
+    load_yaml_file,
+    yaml_cache_clear,
+    yaml_cache_info,
+)
 
 RESOURCE_PATH = Path(__file__).parent / "resources"
 
@@ -20,7 +27,7 @@ def test_fail_load_yaml() -> None:
         load_yaml_file(RESOURCE_PATH / "erroneous-file.yaml")
 
 
-@patch("yaml.safe_load")
+@patch("kpops.utils.yaml.safe_load")
 def test_caching_load_yaml(mocked_func: MagicMock) -> None:
     load_yaml_file(
         RESOURCE_PATH / "test.yaml",
@@ -56,3 +63,42 @@ def test_caching_load_yaml(mocked_func: MagicMock) -> None:
     # load the another yaml
     load_yaml_file(RESOURCE_PATH / "another-test.yaml")
     mocked_func.assert_called_once()
+
+
+@pytest.fixture()
+def yaml_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    monkeypatch.chdir(tmp_path)
+    yaml_cache_clear()
+    path = tmp_path / "test.yaml"
+    path.write_text("test: ${example}\n")
+    yield path
+    yaml_cache_clear()
+
+
+def test_load_yaml_cache_info(yaml_file: Path) -> None:
+    substitution = {"example": "foo"}
+    assert load_yaml_file(yaml_file, substitution=substitution) == {"test": "foo"}
+    assert load_yaml_file(yaml_file, substitution=substitution) == {"test": "foo"}
+    assert load_yaml_file(yaml_file, substitution={"example": "bar"}) == {"test": "bar"}
+    assert yaml_cache_info() == YamlCacheInfo(
+        hits=1, misses=2, maxsize=YAML_CACHE_SIZE, currsize=2
+    )
+
+
+def test_load_yaml_cache_invalidated_on_change(yaml_file: Path) -> None:
+    assert load_yaml_file(yaml_file) == {"test": "${example}"}
+    yaml_file.write_text("test: changed\n")
+    assert load_yaml_file(yaml_file) == {"test": "changed"}
+    assert yaml_cache_info().misses == 2
+
+
+def test_load_yaml_cache_returns_copy(yaml_file: Path) -> None:
+    content = load_yaml_file(yaml_file)
+    content["test"] = "modified"
+    assert load_yaml_file(yaml_file) == {"test": "${example}"}
+
+
+def test_load_yaml_cache_bounded(yaml_file: Path) -> None:
+    for i in range(YAML_CACHE_SIZE + 1):
+        load_yaml_file(yaml_file, substitution={"example": str(i)})
+    assert yaml_cache_info().currsize == YAML_CACHE_SIZE
@@ -0,0 +1,177 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from kpops.component_handlers.helm.cache import HelmTemplateCache, HelmVersionCache
+from kpops.component_handlers.helm.model import HelmTemplateFlags, Version
+
+HELM_VERSION = Version(3, 12, 0)
+CHART = "bakdata-streams-bootstrap/streams-app"
+
+
+class TestHelmTemplateCache:
+    @pytest.fixture()
+    def cache(self, tmp_path: Path) -> HelmTemplateCache:
+        return HelmTemplateCache(tmp_path / "cache")
+
+    def test_get_set(self, cache: HelmTemplateCache) -> None:
+        assert cache.get("key") is None
+        cache.set("key", "---\nkind: Pod\n")
+        assert cache.get("key") == "---\nkind: Pod\n"
+        assert [path.name for path in cache.directory.iterdir()] == ["key.yaml"]
+
+    def test_key_stable(self) -> None:
+        key = HelmTemplateCache.key(
+            HELM_VERSION,
+            "release",
+            CHART,
+            "ns",
+            {"a": 1, "b": {"c": "d"}},
+            HelmTemplateFlags(version="3.0.0"),
+        )
+        assert key is not None
+        assert key == HelmTemplateCache.key(
+            HELM_VERSION,
+            "release",
+            CHART,
+            "ns",
+            {"b": {"c": "d"}, "a": 1},
+            HelmTemplateFlags(version="3.0.0"),
+        )
+
+    @pytest.mark.parametrize(
+        ("helm_version", "release_name", "namespace", "values", "flags"),
+        [
+            pytest.param(
+                Version(4),
+                "release",
+                "ns",
+                {},
+                HelmTemplateFlags(version="3.0.0"),
+                id="helm_version",
+            ),
+            pytest.param(
+                HELM_VERSION,
+                "other",
+                "ns",
+                {},
+                HelmTemplateFlags(version="3.0.0"),
+                id="release_name",
+            ),
+            pytest.param(
+                HELM_VERSION,
+                "release",
+                "other",
+                {},
+                HelmTemplateFlags(version="3.0.0"),
+                id="namespace",
+            ),
+            pytest.param(
+                HELM_VERSION,
+                "release",
+                "ns",
+                {"a": 1},
+                HelmTemplateFlags(version="3.0.0"),
+                id="values",
+            ),
+            pytest.param(
+                HELM_VERSION,
+                "release",
+                "ns",
+                {},
+                HelmTemplateFlags(version="3.1.0"),
+                id="chart_version",
+            ),
+            pytest.param(
+                HELM_VERSION,
+                "release",
+                "ns",
+                {},
+                HelmTemplateFlags(version="3.0.0", api_version="2.1.1"),
+                id="flags",
+            ),
+        ],
+    )
+    def test_key_changes(
+        self,
+        helm_version: Version,
+        release_name: str,
+        namespace: str,
+        values: dict[str, int],
+        flags: HelmTemplateFlags,
+    ) -> None:
+        key = HelmTemplateCache.key(
+            HELM_VERSION, "release", CHART, "ns", {}, HelmTemplateFlags(version="3.0.0")
+        )
+        assert key != HelmTemplateCache.key(
+            helm_version, release_name, CHART, namespace, values, flags
+        )
+
+    def test_key_set_file(self, tmp_path: Path) -> None:
+        set_file = tmp_path / "file.txt"
+        set_file.write_text("foo")
+        flags = HelmTemplateFlags(version="3.0.0", set_file={"config": set_file})
+        key = HelmTemplateCache.key(HELM_VERSION, "release", CHART, "ns", {}, flags)
+        set_file.write_text("bar")
+        assert key != HelmTemplateCache.key(
+            HELM_VERSION, "release", CHART, "ns", {}, flags
+        )
+
+    def test_key_unpinned_chart(self) -> None:
+        assert (
+            HelmTemplateCache.key(
+                HELM_VERSION, "release", CHART, "ns", {}, HelmTemplateFlags()
+            )
+            is None
+        )
+
+    def test_key_local_chart(self, tmp_path: Path) -> None:
+        assert (
+            HelmTemplateCache.key(
+                HELM_VERSION,
+                "release",
+                str(tmp_path),
+                "ns",
+                {},
+                HelmTemplateFlags(version="3.0.0"),
+            )
+            is None
+        )
+
+
+class TestHelmVersionCache:
+    @pytest.fixture()
+    def cache(self, tmp_path: Path) -> HelmVersionCache:
+        return HelmVersionCache(tmp_path / "cache")
+
+    @pytest.fixture()
+    def binary(self, tmp_path: Path) -> Path:
+        binary = tmp_path / "helm"
+        binary.write_text("#!/bin/sh\n")
+        return binary
+
+    def test_get_set(self, cache: HelmVersionCache) -> None:
+        assert cache.get("key") is None
+        cache.set("key", HELM_VERSION)
+        assert cache.get("key") == HELM_VERSION
+        assert [path.name for path in cache.directory.iterdir()] == ["key.json"]
+
+    def test_get_invalid(self, cache: HelmVersionCache) -> None:
+        cache.directory.mkdir()
+        (cache.directory / "key.json").write_text('{"major": "3"')
+        assert cache.get("key") is None
+
+    def test_key_stable(self, binary: Path) -> None:
+        key = HelmVersionCache.key(binary)
+        assert key is not None
+        assert key == HelmVersionCache.key(binary)
+
+    def test_key_changes_with_mtime(self, binary: Path) -> None:
+        key = HelmVersionCache.key(binary)
+        stat = binary.stat()
+        os.utime(binary, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert HelmVersionCache.key(binary) != key
+
+    def test_key_missing_binary(self, tmp_path: Path) -> None:
+        assert HelmVersionCache.key(tmp_path / "missing") is None
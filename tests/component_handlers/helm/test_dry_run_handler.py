@@ -16,9 +16,12 @@ log = structlog.get_logger("TestLogger")
 class TestDryRunHandler:
     @pytest.fixture()
     def helm_mock(self, mocker: MockerFixture) -> MagicMock:
-        return mocker.patch(
+        helm_mock = mocker.patch(
             "kpops.component_handlers.helm.dry_run_handler.Helm"
         ).return_value
+        helm_mock.release_exists = mocker.AsyncMock(return_value=None)
+        helm_mock.get_manifest = mocker.AsyncMock()
+        return helm_mock
 
     @pytest.fixture()
     def helm_diff_mock(self, mocker: MockerFixture) -> MagicMock:
@@ -26,7 +29,7 @@ class TestDryRunHandler:
             "kpops.component_handlers.helm.dry_run_handler.HelmDiff"
         ).return_value
 
-    def test_should_print_helm_diff_when_release_is_new(
+    async def test_should_print_helm_diff_when_release_is_new(
         self,
         helm_mock: MagicMock,
         helm_diff_mock: MagicMock,
@@ -50,7 +53,9 @@ class TestDryRunHandler:
 
         dry_run_handler = DryRunHandler(helm_mock, helm_diff_mock, "test-namespace")
         with capture_logs() as cap_logs:
-            dry_run_handler.print_helm_diff("A test stdout", "a-release-name", log)
+            await dry_run_handler.print_helm_diff(
+                "A test stdout", "a-release-name", log
+            )
 
         helm_mock.get_manifest.assert_called_once_with(
             "a-release-name", "test-namespace"
@@ -63,7 +68,7 @@ class TestDryRunHandler:
         mock_load_manifest.assert_called_once_with("A test stdout")
         helm_diff_mock.log_helm_diff.assert_called_once_with(log, [], new_release)
 
-    def test_should_print_helm_diff_when_release_exists(
+    async def test_should_print_helm_diff_when_release_exists(
         self,
         helm_mock: MagicMock,
         helm_diff_mock: MagicMock,
@@ -96,7 +101,9 @@ class TestDryRunHandler:
 
         dry_run_handler = DryRunHandler(helm_mock, helm_diff_mock, "test-namespace")
         with capture_logs() as cap_logs:
-            dry_run_handler.print_helm_diff("A test stdout", "a-release-name", log)
+            await dry_run_handler.print_helm_diff(
+                "A test stdout", "a-release-name", log
+            )
 
         helm_mock.get_manifest.assert_called_once_with(
             "a-release-name", "test-namespace"
@@ -110,3 +117,33 @@ class TestDryRunHandler:
         helm_diff_mock.log_helm_diff.assert_called_once_with(
             log, current_release, new_release
         )
+
+    async def test_should_not_get_manifest_of_release_missing_from_inventory(
+        self,
+        helm_mock: MagicMock,
+        helm_diff_mock: MagicMock,
+        mocker: MockerFixture,
+    ) -> None:
+        helm_mock.release_exists.return_value = False
+        new_release = iter(())
+        mocker.patch(
+            "kpops.component_handlers.helm.dry_run_handler.Helm.load_manifest",
+            return_value=new_release,
+        )
+
+        dry_run_handler = DryRunHandler(helm_mock, helm_diff_mock, "test-namespace")
+        with capture_logs() as cap_logs:
+            await dry_run_handler.print_helm_diff(
+                "A test stdout", "a-release-name", log
+            )
+
+        helm_mock.release_exists.assert_called_once_with(
+            "a-release-name", "test-namespace"
+        )
+        helm_mock.get_manifest.assert_not_called()
+        assert {
+            "event": "Helm release does not exist",
+            "release": "a-release-name",
+            "log_level": "info",
+        } in cap_logs
+        helm_diff_mock.log_helm_diff.assert_called_once_with(log, [], new_release)
@@ -1,5 +1,8 @@
+import asyncio
+import json
 import os
 import re
+import tempfile
 from pathlib import Path
 from textwrap import dedent
 from unittest import mock
@@ -28,29 +31,18 @@ from kpops.manifests.kubernetes import KubernetesManifest
 
 
 class TestHelm:
-    @pytest.fixture(autouse=True)
-    def temp_file_mock(self, mocker: MockerFixture) -> MagicMock:
-        temp_file_mock = mocker.patch("tempfile.NamedTemporaryFile")
-        temp_file_mock.return_value.__enter__.return_value.name = "values.yaml"
-        return temp_file_mock
-
-    @pytest.fixture()
-    def mock_execute(self, mocker: MockerFixture) -> MagicMock:
-        mock_execute = mocker.patch.object(Helm, "_Helm__execute")
-        mock_execute.return_value = ""
-        return mock_execute
-
     @pytest.fixture()
     def run_command_async(self, mocker: MockerFixture) -> MagicMock:
-        return mocker.patch.object(Helm, "_Helm__async_execute")
+        run_command_async = mocker.patch.object(Helm, "_Helm__async_execute")
+        run_command_async.return_value = ""
+        return run_command_async
 
     @pytest.fixture()
     def mock_version(self, mocker: MockerFixture) -> MagicMock:
         return mocker.patch.object(
             Helm,
-            "version",
+            "get_version",
             return_value=Version(major=3, minor=12, patch=0),
-            new_callable=mocker.PropertyMock,
         )
 
     @pytest.fixture()
@@ -62,23 +54,51 @@ class TestHelm:
         helm = Helm._instance
         if not helm:
             return
-        helm.add_repo.cache_clear()
-        if hasattr(helm, "version"):
-            del helm.version
+        helm._added_repositories.clear()
+        helm._repositories.clear()
+        helm._repository_cache = None
+        helm._version = None
+        helm._version_probe.invalidate()
 
     def test_singleton(self, helm: Helm) -> None:
         assert Helm(helm_config=HelmConfig()) is helm
 
-    def test_version_cached(self, helm: Helm, mock_execute: MagicMock) -> None:
-        assert helm.version
-        mock_execute.assert_not_called()
+    async def test_version_cached(self, run_command_async: AsyncMock) -> None:
+        run_command_async.return_value = "v3.12.0+gc9f554d"
+        helm = Helm(helm_config=HelmConfig())
+
+        versions = await asyncio.gather(helm.get_version(), helm.get_version())
+        assert versions == [Version(3, 12, 0), Version(3, 12, 0)]
+        assert await asyncio.to_thread(
+            lambda: asyncio.run(helm.get_version())
+        ) == Version(3, 12, 0)
+        run_command_async.assert_called_once()
 
-    def test_add_repo_cached(self, helm: Helm, mock_execute: MagicMock) -> None:
-        helm.add_repo("test-foo", "fake")
-        helm.add_repo("test-bar", "fake")
-        helm.add_repo("test-foo", "fake")
-        helm.add_repo("test-bar", "fake2")
-        assert mock_execute.mock_calls == [
+    async def test_version_disk_cache(
+        self, run_command_async: AsyncMock, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        binary = tmp_path / "helm"
+        binary.write_text("#!/bin/sh\n")
+        mocker.patch("shutil.which", return_value=str(binary))
+        run_command_async.return_value = "v3.12.0+gc9f554d"
+        helm = Helm(helm_config=HelmConfig(version_cache=tmp_path / "cache"))
+
+        assert await helm.get_version() == Version(3, 12, 0)
+        run_command_async.assert_called_once()
+
+        helm._version = None
+        helm._version_probe.invalidate()
+        assert await helm.get_version() == Version(3, 12, 0)
+        run_command_async.assert_called_once()
+
+    async def test_add_repo_cached(
+        self, helm: Helm, run_command_async: AsyncMock
+    ) -> None:
+        await helm.add_repo("test-foo", "fake")
+        await helm.add_repo("test-bar", "fake")
+        await helm.add_repo("test-foo", "fake")
+        await helm.add_repo("test-bar", "fake2")
+        assert run_command_async.mock_calls == [
             mock.call(
                 [
                     "helm",
@@ -139,30 +159,47 @@ class TestHelm:
                 "--namespace",
                 "test-namespace",
                 "--values",
-                "values.yaml",
+                "-",
                 "--timeout",
                 "5m0s",
                 "--wait",
             ],
+            stdin="commandLine: test\n",
         )
 
-    def test_should_include_configured_tls_parameters_on_add_when_version_is_old(
-        self, mock_execute: MagicMock, mocker: MockerFixture
+    async def test_should_skip_repo_update_when_index_is_fresh(
+        self, mock_version: MagicMock, run_command_async: AsyncMock, tmp_path: Path
+    ) -> None:
+        helm = Helm(helm_config=HelmConfig(repo_update_ttl=3600))
+        run_command_async.return_value = str(tmp_path)
+        await asyncio.to_thread((tmp_path / "fresh-index.yaml").touch)
+
+        await helm.add_repo("fresh", "fake")
+        await helm.add_repo("stale", "fake")
+
+        assert run_command_async.mock_calls == [
+            mock.call(["helm", "repo", "add", "fresh", "fake"]),
+            mock.call(["helm", "env", "HELM_REPOSITORY_CACHE"]),
+            mock.call(["helm", "repo", "add", "stale", "fake"]),
+            mock.call(["helm", "repo", "update", "stale"]),
+        ]
+
+    async def test_should_include_configured_tls_parameters_on_add_when_version_is_old(
+        self, run_command_async: AsyncMock, mocker: MockerFixture
     ) -> None:
         mocker.patch.object(
             Helm,
-            "version",
+            "get_version",
             return_value=Version(major=3, minor=6, patch=0),
-            new_callable=mocker.PropertyMock,
         )
         helm = Helm(HelmConfig())
 
-        helm.add_repo(
+        await helm.add_repo(
             "test-repository",
             "fake",
             RepoAuthFlags(ca_file=Path("a_file.ca"), insecure_skip_tls_verify=True),
         )
-        assert mock_execute.mock_calls == [
+        assert run_command_async.mock_calls == [
             mock.call(
                 [
                     "helm",
@@ -180,15 +217,15 @@ class TestHelm:
             ),
         ]
 
-    def test_should_include_configured_tls_parameters_on_add_when_version_is_new(
-        self, helm: Helm, mock_execute: MagicMock
+    async def test_should_include_configured_tls_parameters_on_add_when_version_is_new(
+        self, helm: Helm, run_command_async: AsyncMock
     ) -> None:
-        helm.add_repo(
+        await helm.add_repo(
             "test-repository",
             "fake",
             RepoAuthFlags(ca_file=Path("a_file.ca"), insecure_skip_tls_verify=True),
         )
-        assert mock_execute.mock_calls == [
+        assert run_command_async.mock_calls == [
             mock.call(
                 [
                     "helm",
@@ -206,23 +243,22 @@ class TestHelm:
             ),
         ]
 
-    def test_helm_repo_update_excludes_repository_name_when_version_is_old(
-        self, mock_execute: MagicMock, mocker: MockerFixture
+    async def test_helm_repo_update_excludes_repository_name_when_version_is_old(
+        self, run_command_async: AsyncMock, mocker: MockerFixture
     ) -> None:
         mocker.patch.object(
             Helm,
-            "version",
+            "get_version",
             return_value=Version(major=3, minor=6, patch=0),
-            new_callable=mocker.PropertyMock,
         )
         helm = Helm(HelmConfig())
 
-        helm.add_repo(
+        await helm.add_repo(
             "test-repository",
             "fake",
             RepoAuthFlags(ca_file=Path("a_file.ca"), insecure_skip_tls_verify=True),
         )
-        assert mock_execute.mock_calls == [
+        assert run_command_async.mock_calls == [
             mock.call(
                 [
                     "helm",
@@ -247,23 +283,22 @@ class TestHelm:
             Version(major=4, minor=0, patch=0),
         ],
     )
-    def test_helm_repo_update_includes_repository_name_when_version_is_new(
-        self, mock_execute: MagicMock, mocker: MockerFixture, version: Version
+    async def test_helm_repo_update_includes_repository_name_when_version_is_new(
+        self, run_command_async: AsyncMock, mocker: MockerFixture, version: Version
     ) -> None:
         mocker.patch.object(
             Helm,
-            "version",
+            "get_version",
             return_value=version,
-            new_callable=mocker.PropertyMock,
         )
         helm = Helm(HelmConfig())
 
-        helm.add_repo(
+        await helm.add_repo(
             "test-repository",
             "fake",
             RepoAuthFlags(ca_file=Path("a_file.ca"), insecure_skip_tls_verify=True),
         )
-        assert mock_execute.mock_calls == [
+        assert run_command_async.mock_calls == [
             mock.call(
                 [
                     "helm",
@@ -281,6 +316,41 @@ class TestHelm:
             ),
         ]
 
+    async def test_should_pass_values_over_stdin_without_leaking_files(
+        self,
+        helm: Helm,
+        mocker: MockerFixture,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ) -> None:
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        proc = mocker.AsyncMock()
+        proc.communicate.return_value = (b"", b"")
+        create_subprocess_exec = mocker.patch(
+            "asyncio.create_subprocess_exec", return_value=proc
+        )
+        values = {"commandLine": "test"}
+
+        await helm.upgrade_install(
+            release_name="test-release",
+            chart="test-repository/test-chart",
+            dry_run=True,
+            namespace="test-namespace",
+            values=values,
+        )
+        await helm.template(
+            release_name="test-release",
+            chart="test-repository/test-chart",
+            namespace="test-namespace",
+            values=values,
+        )
+
+        assert create_subprocess_exec.call_count == 2
+        for call in create_subprocess_exec.call_args_list:
+            assert call.kwargs["stdin"] == asyncio.subprocess.PIPE
+        proc.communicate.assert_called_with(b"commandLine: test\n")
+        assert not await asyncio.to_thread(lambda: list(tmp_path.iterdir()))
+
     async def test_should_include_configured_tls_parameters_on_update(
         self, helm: Helm, run_command_async: AsyncMock
     ) -> None:
@@ -306,7 +376,7 @@ class TestHelm:
                 "--namespace",
                 "test-namespace",
                 "--values",
-                "values.yaml",
+                "-",
                 "--ca-file",
                 "a_file.ca",
                 "--insecure-skip-tls-verify",
@@ -314,6 +384,7 @@ class TestHelm:
                 "5m0s",
                 "--wait",
             ],
+            stdin="{}\n",
         )
 
     async def test_should_call_run_command_method_when_helm_install_with_non_defaults(
@@ -345,7 +416,7 @@ class TestHelm:
                 "--namespace",
                 "test-namespace",
                 "--values",
-                "values.yaml",
+                "-",
                 "--set-file",
                 f"key1=example{os.path.sep}path1,key2=example{os.path.sep}path2",
                 "--create-namespace",
@@ -358,6 +429,7 @@ class TestHelm:
                 "--wait-for-jobs",
                 "--dry-run",
             ],
+            stdin="commandLine: test\n",
         )
 
     @pytest.mark.parametrize(
@@ -374,9 +446,8 @@ class TestHelm:
     ) -> None:
         mocker.patch.object(
             Helm,
-            "version",
+            "get_version",
             return_value=Version(major=helm_major_version, minor=2, patch=0),
-            new_callable=mocker.PropertyMock,
         )
         helm = Helm(helm_config=HelmConfig())
 
@@ -398,12 +469,13 @@ class TestHelm:
                 "--namespace",
                 "test-namespace",
                 "--values",
-                "values.yaml",
+                "-",
                 expected_force_flag,
                 "--timeout",
                 "5m0s",
                 "--wait",
             ],
+            stdin="commandLine: test\n",
         )
 
     async def test_should_call_run_command_method_when_uninstalling_streams_app(
@@ -612,8 +684,10 @@ class TestHelm:
             }
         )
 
-    def test_helm_get_manifest(self, helm: Helm, mock_execute: MagicMock) -> None:
-        mock_execute.return_value = dedent(
+    async def test_helm_get_manifest(
+        self, helm: Helm, run_command_async: AsyncMock
+    ) -> None:
+        run_command_async.return_value = dedent(
             """
             ---
             # Source: chart/templates/test.yaml
@@ -623,9 +697,9 @@ class TestHelm:
               name: my-pod
             """
         )
-        helm_templates = list(helm.get_manifest("test-release", "test-namespace"))
-        mock_execute.assert_called_once_with(
-            command=[
+        helm_templates = list(await helm.get_manifest("test-release", "test-namespace"))
+        run_command_async.assert_called_once_with(
+            [
                 "helm",
                 "get",
                 "manifest",
@@ -644,13 +718,97 @@ class TestHelm:
             }
         )
 
-        mock_execute.side_effect = ReleaseNotFoundException()
-        assert helm.get_manifest("test-release", "test-namespace") == ()
+        run_command_async.side_effect = ReleaseNotFoundException()
+        assert await helm.get_manifest("test-release", "test-namespace") == ()
+
+    async def test_helm_get_release(
+        self, helm: Helm, run_command_async: AsyncMock
+    ) -> None:
+        run_command_async.return_value = json.dumps(
+            [
+                {
+                    "name": "test-release",
+                    "namespace": "test-namespace",
+                    "revision": "2",
+                    "updated": "2024-01-01 00:00:00.000000 +0000 UTC",
+                    "status": "deployed",
+                    "chart": "streams-app-3.0.0",
+                    "app_version": "3.0.0",
+                }
+            ]
+        )
+        release = await helm.get_release("test-release", "test-namespace")
+        run_command_async.assert_called_once_with(
+            [
+                "helm",
+                "list",
+                "--namespace",
+                "test-namespace",
+                "--filter",
+                "^test\\-release$",
+                "--all",
+                "--output",
+                "json",
+            ],
+        )
+        assert release is not None
+        assert release.revision == "2"
+        assert release.is_deployed("bakdata-streams-bootstrap/streams-app", "3.0.0")
+        assert not release.is_deployed("bakdata-streams-bootstrap/streams-app", "3.1.0")
+        assert not release.is_deployed(
+            "bakdata-streams-bootstrap/producer-app", "3.0.0"
+        )
+
+        run_command_async.return_value = "[]"
+        assert await helm.get_release("test-release", "test-namespace") is None
+
+    async def test_helm_release_inventory(
+        self, mock_version: MagicMock, run_command_async: AsyncMock
+    ) -> None:
+        helm = Helm(helm_config=HelmConfig(release_inventory=True))
+        run_command_async.return_value = json.dumps(
+            [
+                {
+                    "name": "test-release",
+                    "namespace": "test-namespace",
+                    "revision": "1",
+                    "updated": "2024-01-01 00:00:00.000000 +0000 UTC",
+                    "status": "deployed",
+                    "chart": "streams-app-3.0.0",
+                    "app_version": "3.0.0",
+                }
+            ]
+        )
+        assert await helm.release_exists("test-release", "test-namespace") is True
+        assert await helm.release_exists("other-release", "test-namespace") is False
+        assert await helm.get_release("test-release", "test-namespace") is not None
+        assert await helm.get_values("test-namespace", "other-release") is None
+        run_command_async.assert_called_once_with(
+            [
+                "helm",
+                "list",
+                "--namespace",
+                "test-namespace",
+                "--all",
+                "--max",
+                "0",
+                "--output",
+                "json",
+            ],
+        )
+
+        run_command_async.return_value = ""
+        await helm.uninstall("test-namespace", "test-release", dry_run=False)
+        assert await helm.release_exists("test-release", "test-namespace") is None
+        run_command_async.reset_mock()
+        run_command_async.side_effect = HelmError("error")
+        assert await helm.release_exists("test-release", "other-namespace") is None
+        run_command_async.assert_called_once()
 
-    def test_should_call_run_command_method_when_helm_template_with_optional_args(
-        self, helm: Helm, mock_execute: MagicMock
+    async def test_should_call_run_command_method_when_helm_template_with_optional_args(
+        self, helm: Helm, run_command_async: AsyncMock
     ) -> None:
-        helm.template(
+        await helm.template(
             release_name="test-release",
             chart="bakdata-streams-bootstrap/streams-app",
             namespace="test-ns",
@@ -661,7 +819,7 @@ class TestHelm:
                 cert_file=Path("a_file.pem"),
             ),
         )
-        mock_execute.assert_called_once_with(
+        run_command_async.assert_called_once_with(
             [
                 "helm",
                 "template",
@@ -670,7 +828,7 @@ class TestHelm:
                 "--namespace",
                 "test-ns",
                 "--values",
-                "values.yaml",
+                "-",
                 "--ca-file",
                 "a_file.ca",
                 "--cert-file",
@@ -681,18 +839,19 @@ class TestHelm:
                 "--api-versions",
                 "2.1.1",
             ],
+            stdin="commandLine: test\n",
         )
 
-    def test_should_call_run_command_method_when_helm_template_without_optional_args(
-        self, helm: Helm, mock_execute: MagicMock
+    async def test_should_call_run_command_method_when_helm_template_without_optional_args(
+        self, helm: Helm, run_command_async: AsyncMock
     ) -> None:
-        helm.template(
+        await helm.template(
             release_name="test-release",
             chart="bakdata-streams-bootstrap/streams-app",
             namespace="test-ns",
             values={"commandLine": "test"},
         )
-        mock_execute.assert_called_once_with(
+        run_command_async.assert_called_once_with(
             [
                 "helm",
                 "template",
@@ -701,13 +860,45 @@ class TestHelm:
                 "--namespace",
                 "test-ns",
                 "--values",
-                "values.yaml",
+                "-",
                 "--timeout",
                 "5m0s",
                 "--wait",
             ],
+            stdin="commandLine: test\n",
         )
 
+    async def test_helm_template_cache(
+        self, mock_version: MagicMock, run_command_async: AsyncMock, tmp_path: Path
+    ) -> None:
+        run_command_async.return_value = dedent(
+            """
+            ---
+            # Source: chart/templates/test.yaml
+            apiVersion: v1
+            kind: Pod
+            metadata:
+              name: test
+            """
+        )
+        helm = Helm(helm_config=HelmConfig(template_cache=tmp_path))
+
+        async def template(values: dict[str, str]) -> tuple[KubernetesManifest, ...]:
+            return await helm.template(
+                release_name="test-release",
+                chart="bakdata-streams-bootstrap/streams-app",
+                namespace="test-ns",
+                values=values,
+                flags=HelmTemplateFlags(version="3.0.0"),
+            )
+
+        manifests = await template({"commandLine": "test"})
+        assert await template({"commandLine": "test"}) == manifests
+        run_command_async.assert_called_once()
+
+        await template({"commandLine": "changed"})
+        assert run_command_async.call_count == 2
+
     @pytest.mark.parametrize(
         ("raw_version", "expected_version"),
         [
@@ -721,42 +912,44 @@ class TestHelm:
             ("v4", Version(4, 0, 0)),
         ],
     )
-    def test_parse_version(
+    async def test_parse_version(
         self,
-        mock_execute: MagicMock,
+        run_command_async: AsyncMock,
         raw_version: str,
         expected_version: Version,
     ) -> None:
-        mock_execute.return_value = raw_version
+        run_command_async.return_value = raw_version
         helm = Helm(helm_config=HelmConfig())
 
-        mock_execute.assert_called_once_with(
+        assert await helm.get_version() == expected_version
+        run_command_async.assert_called_once_with(
             [
                 "helm",
                 "version",
                 "--short",
             ],
         )
-        assert helm.version == expected_version
 
-    def test_should_raise_exception_if_helm_version_is_old(
-        self, mock_execute: MagicMock
+    async def test_should_raise_exception_if_helm_version_is_old(
+        self, run_command_async: AsyncMock
     ) -> None:
-        mock_execute.return_value = "v2.9.0+gc9f554d"
+        run_command_async.return_value = "v2.9.0+gc9f554d"
+        helm = Helm(helm_config=HelmConfig())
         with pytest.raises(
             RuntimeError,
             match=re.escape(
                 "The supported Helm version is 3.x.x|4.x.x. The current Helm version is 2.9.0"
             ),
         ):
-            Helm(helm_config=HelmConfig())
+            await helm.get_version()
 
-    def test_should_raise_exception_if_helm_version_cannot_be_parsed(
-        self, mock_execute: MagicMock
+    async def test_should_raise_exception_if_helm_version_cannot_be_parsed(
+        self, run_command_async: AsyncMock
     ) -> None:
-        mock_execute.return_value = "123"
+        run_command_async.return_value = "123"
+        helm = Helm(helm_config=HelmConfig())
         with pytest.raises(
             RuntimeError,
             match=re.escape("Could not parse the Helm version.\n\nHelm output:\n123"),
         ):
-            Helm(helm_config=HelmConfig())
+            await helm.get_version()
@@ -1,4 +1,5 @@
 import json
+from collections import Counter
 from typing import Any
 
 import httpx2
@@ -7,6 +8,7 @@ from anyio import Path
 from pytest_httpx2 import HTTPXMock
 from pytest_mock import MockerFixture
 from structlog.testing import capture_logs
+from structlog.typing import EventDict
 
 from kpops.component_handlers.kafka_connect.exception import (
     ConnectorNotFoundException,
@@ -32,6 +34,14 @@ HEADERS = {"Accept": "application/json", "Content-Type": "application/json"}
 CONNECTOR_NAME = "test-connector"
 
 
+def retried_requests(cap_logs: list[EventDict]) -> list[tuple[str, str]]:
+    return [
+        (log["method"], log["endpoint"])
+        for log in cap_logs
+        if log["event"] == "Rebalancing in progress... Retrying..."
+    ]
+
+
 class TestKafkaConnect:
     @pytest.fixture()
     def kafka_connect(self) -> KafkaConnect:
@@ -182,10 +192,8 @@ class TestKafkaConnect:
         with capture_logs() as cap_logs:
             await kafka_connect.create_connector(connector_config)
 
-        assert {
-            "event": "Rebalancing in progress while creating a connector... Retrying...",
-            "log_level": "warning",
-        } in cap_logs
+        assert retried_requests(cap_logs) == [("POST", "/connectors")]
+        assert kafka_connect.retries == Counter({"POST /connectors": 1})
         assert {
             "event": "Connector created.",
             "connector_name": CONNECTOR_NAME,
@@ -245,12 +253,80 @@ class TestKafkaConnect:
         )
         with capture_logs() as cap_logs:
             actual_response = await kafka_connect.get_connector(CONNECTOR_NAME)
-        assert {
-            "event": "Rebalancing in progress while getting a connector... Retrying...",
-            "log_level": "warning",
-        } in cap_logs
+        assert retried_requests(cap_logs) == [("GET", f"/connectors/{CONNECTOR_NAME}")]
+        assert kafka_connect.retries == Counter(
+            {f"GET /connectors/{CONNECTOR_NAME}": 1}
+        )
         assert actual_response == ConnectorResponse.model_validate(connector_response)
 
+    async def test_get_connectors(
+        self,
+        kafka_connect: KafkaConnect,
+        httpx_mock: HTTPXMock,
+        connector_response: dict[str, Any],
+    ) -> None:
+        status_response: dict[str, Any] = {
+            "name": CONNECTOR_NAME,
+            "connector": {
+                "state": "RUNNING",
+                "worker_id": "kafka-connect.infrastructure.svc:8083",
+            },
+            "tasks": [
+                {
+                    "id": 0,
+                    "state": "FAILED",
+                    "worker_id": "kafka-connect.infrastructure.svc:8083",
+                    "trace": "org.apache.kafka.common.errors.RecordTooLargeException",
+                }
+            ],
+            "type": "sink",
+        }
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{DEFAULT_HOST}/connectors?expand=info&expand=status",
+            headers=HEADERS,
+            json={
+                CONNECTOR_NAME: {"info": connector_response, "status": status_response},
+                "unassigned-connector": {
+                    "info": {**connector_response, "name": "unassigned-connector"},
+                    "status": {
+                        **status_response,
+                        "name": "unassigned-connector",
+                        "connector": {
+                            "state": "UNASSIGNED",
+                            "worker_id": "kafka-connect.infrastructure.svc:8083",
+                        },
+                        "tasks": [],
+                    },
+                },
+            },
+        )
+        connectors = await kafka_connect.get_connectors()
+        assert connectors.keys() == {CONNECTOR_NAME, "unassigned-connector"}
+        connector = connectors[CONNECTOR_NAME]
+        assert connector.info == ConnectorResponse.model_validate(connector_response)
+        assert connector.status.connector.state is ConnectorCurrentState.RUNNING
+        assert connector.status.tasks[0].state is ConnectorCurrentState.FAILED
+        assert (
+            connectors["unassigned-connector"].status.connector.state
+            is ConnectorCurrentState.UNASSIGNED
+        )
+
+    async def test_get_connectors_error(
+        self,
+        kafka_connect: KafkaConnect,
+        httpx_mock: HTTPXMock,
+    ) -> None:
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{DEFAULT_HOST}/connectors?expand=info&expand=status",
+            headers=HEADERS,
+            status_code=httpx2.codes.INTERNAL_SERVER_ERROR,
+            json={},
+        )
+        with pytest.raises(KafkaConnectError):
+            await kafka_connect.get_connectors()
+
     @pytest.mark.parametrize(
         ("api_state", "enum_state"),
         [
@@ -473,16 +549,47 @@ class TestKafkaConnect:
         with capture_logs() as cap_logs:
             await kafka_connect.update_connector_config(connector_config)
 
-        assert {
-            "event": "Rebalancing in progress while updating a connector... Retrying...",
-            "log_level": "warning",
-        } in cap_logs
+        assert retried_requests(cap_logs) == [
+            ("PUT", f"/connectors/{CONNECTOR_NAME}/config")
+        ]
+        assert kafka_connect.retries == Counter(
+            {f"PUT /connectors/{CONNECTOR_NAME}/config": 1}
+        )
         assert {
             "event": "Config for connector updated.",
             "connector_name": CONNECTOR_NAME,
             "log_level": "info",
         } in cap_logs
 
+    @pytest.mark.usefixtures("mock_sleep")
+    async def test_give_up_retrying_after_max_attempts(
+        self,
+        httpx_mock: HTTPXMock,
+    ) -> None:
+        config = KpopsConfig.model_validate(
+            {"kafka_connect": {"retry": {"max_attempts": 3}}}
+        )
+        kafka_connect = KafkaConnect(config.kafka_connect)
+        httpx_mock.add_response(
+            method="DELETE",
+            url=f"{DEFAULT_HOST}/connectors/{CONNECTOR_NAME}",
+            headers=HEADERS,
+            status_code=httpx2.codes.CONFLICT,
+            json={},
+            is_reusable=True,
+        )
+        with capture_logs() as cap_logs, pytest.raises(KafkaConnectError):
+            await kafka_connect.delete_connector(CONNECTOR_NAME)
+
+        assert len(httpx_mock.get_requests()) == 3
+        assert len(retried_requests(cap_logs)) == 2
+        assert {
+            "event": "Rebalancing still in progress. Giving up.",
+            "method": "DELETE",
+            "endpoint": f"/connectors/{CONNECTOR_NAME}",
+            "log_level": "warning",
+        } in cap_logs
+
     async def test_delete_connector(
         self,
         kafka_connect: KafkaConnect,
@@ -542,10 +649,12 @@ class TestKafkaConnect:
         with capture_logs() as cap_logs:
             await kafka_connect.delete_connector(CONNECTOR_NAME)
 
-        assert {
-            "event": "Rebalancing in progress while deleting a connector... Retrying...",
-            "log_level": "warning",
-        } in cap_logs
+        assert retried_requests(cap_logs) == [
+            ("DELETE", f"/connectors/{CONNECTOR_NAME}")
+        ]
+        assert kafka_connect.retries == Counter(
+            {f"DELETE /connectors/{CONNECTOR_NAME}": 1}
+        )
         assert {
             "event": "Connector deleted.",
             "connector_name": CONNECTOR_NAME,
@@ -1,20 +1,26 @@
+import asyncio
 import re
+from collections import Counter
 from unittest import mock
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx2
 import pytest
+from pydantic import ValidationError
 from pytest_mock import MockerFixture
 from structlog.testing import capture_logs
 
 from kpops.component_handlers.kafka_connect.exception import (
     ConnectorNotFoundException,
     ConnectorStateException,
+    KafkaConnectError,
 )
 from kpops.component_handlers.kafka_connect.kafka_connect_handler import (
     KafkaConnectHandler,
 )
 from kpops.component_handlers.kafka_connect.model import (
     ConnectorCurrentState,
+    ConnectorInfoStatusResponse,
     ConnectorNewState,
     ConnectorResponse,
     ConnectorStatus,
@@ -28,10 +34,21 @@ from tests.components.test_kafka_connector import CONNECTOR_NAME
 TOPIC_NAME = "test-topic"
 
 
+def unexpected_response_error() -> ValidationError:
+    try:
+        ConnectorStatus.model_validate({"state": "UNKNOWN", "worker_id": "foo"})
+    except ValidationError as e:
+        return e
+    msg = "Expected a validation error"
+    raise AssertionError(msg)
+
+
 class TestConnectorHandler:
     @pytest.fixture()
     def kafka_connect(self) -> AsyncMock:
-        return AsyncMock()
+        kafka_connect = AsyncMock()
+        kafka_connect.retries = Counter()
+        return kafka_connect
 
     @pytest.fixture()
     def renderer_diff_mock(self, mocker: MockerFixture) -> MagicMock:
@@ -382,6 +399,7 @@ class TestConnectorHandler:
         )
 
     @pytest.mark.parametrize("current_state", list(ConnectorCurrentState))
+    @pytest.mark.usefixtures("mock_get_connector")
     async def test_update_connector_state_unchanged(
         self,
         kafka_connect: AsyncMock,
@@ -398,6 +416,7 @@ class TestConnectorHandler:
         ]
 
     @pytest.mark.parametrize("state", list(ConnectorNewState))
+    @pytest.mark.usefixtures("mock_get_connector")
     async def test_update_connector_same_state(
         self,
         kafka_connect: AsyncMock,
@@ -414,6 +433,7 @@ class TestConnectorHandler:
         ]
 
     @pytest.mark.parametrize("current_state", list(ConnectorCurrentState))
+    @pytest.mark.usefixtures("mock_get_connector")
     async def test_update_and_resume_connector(
         self,
         kafka_connect: AsyncMock,
@@ -436,6 +456,7 @@ class TestConnectorHandler:
             )
         assert kafka_connect.mock_calls == expected_calls
 
+    @pytest.mark.usefixtures("mock_get_connector")
     async def test_update_and_pause_connector(
         self,
         kafka_connect: AsyncMock,
@@ -455,6 +476,74 @@ class TestConnectorHandler:
             mock.call.update_connector_config(connector_config, dry_run=False),
         ]
 
+    @pytest.mark.parametrize("dry_run", [True, False])
+    async def test_skip_update_when_config_unchanged(
+        self,
+        kafka_connect: AsyncMock,
+        handler: KafkaConnectHandler,
+        connector_config: KafkaConnectorConfig,
+        connector_config_update: KafkaConnectorConfig,
+        dry_run: bool,
+    ) -> None:
+        self.mock_connector_status(
+            kafka_connect, connector_config.name, ConnectorCurrentState.RUNNING
+        )
+        kafka_connect.get_connector.return_value = ConnectorResponse(
+            name=CONNECTOR_NAME,
+            config=connector_config,
+            tasks=[],
+            type=KafkaConnectorType.SINK,
+        )
+
+        with capture_logs() as cap_logs:
+            await handler.create_connector(
+                connector_config, state=None, dry_run=dry_run
+            )
+            await handler.create_connector(
+                connector_config_update, state=None, dry_run=dry_run
+            )
+            handler.log_summary()
+
+        kafka_connect.update_connector_config.assert_called_once_with(
+            connector_config_update, dry_run=dry_run
+        )
+        assert {
+            "event": "Connector config unchanged.",
+            "connector_name": CONNECTOR_NAME,
+            "log_level": "info",
+        } in cap_logs
+        assert {
+            "event": "Connector config updates.",
+            "applied": 1,
+            "skipped": 1,
+            "log_level": "info",
+        } in cap_logs
+
+    def test_log_summary_retries(
+        self, kafka_connect: AsyncMock, handler: KafkaConnectHandler
+    ) -> None:
+        kafka_connect.retries.update(
+            {
+                f"PUT /connectors/{CONNECTOR_NAME}/config": 2,
+                f"PUT /connectors/{CONNECTOR_NAME}/pause": 1,
+            }
+        )
+
+        with capture_logs() as cap_logs:
+            handler.log_summary()
+
+        assert cap_logs == [
+            {
+                "event": "Kafka Connect requests retried.",
+                "retries": 3,
+                "requests": {
+                    f"PUT /connectors/{CONNECTOR_NAME}/config": 2,
+                    f"PUT /connectors/{CONNECTOR_NAME}/pause": 1,
+                },
+                "log_level": "info",
+            }
+        ]
+
     async def test_call_create_connector_when_connector_does_not_exists(
         self,
         kafka_connect: AsyncMock,
@@ -643,3 +732,114 @@ class TestConnectorHandler:
             "connector_name": CONNECTOR_NAME,
             "log_level": "warning",
         } in cap_logs
+
+    @pytest.fixture()
+    def prefetch_handler(self, kafka_connect: AsyncMock) -> KafkaConnectHandler:
+        return KafkaConnectHandler(kafka_connect=kafka_connect, prefetch=True)
+
+    @pytest.fixture
+    def mock_get_connectors(self, kafka_connect: AsyncMock) -> None:
+        kafka_connect.get_connectors.return_value = {
+            CONNECTOR_NAME: ConnectorInfoStatusResponse.model_validate(
+                {
+                    "info": {
+                        "name": CONNECTOR_NAME,
+                        "config": {
+                            "connector.class": "com.bakdata.connect.TestConnector",
+                            "name": CONNECTOR_NAME,
+                        },
+                        "tasks": [],
+                        "type": "sink",
+                    },
+                    "status": {
+                        "name": CONNECTOR_NAME,
+                        "connector": {"state": "RUNNING", "worker_id": "foo"},
+                        "tasks": [],
+                        "type": "sink",
+                    },
+                }
+            )
+        }
+
+    @pytest.mark.usefixtures("mock_get_connectors", "renderer_diff_mock")
+    async def test_create_connector_dry_run_prefetched(
+        self,
+        kafka_connect: AsyncMock,
+        prefetch_handler: KafkaConnectHandler,
+        connector_config: KafkaConnectorConfig,
+    ) -> None:
+        other_config = connector_config.model_copy(update={"name": "other-connector"})
+
+        with capture_logs() as cap_logs:
+            await asyncio.gather(
+                prefetch_handler.create_connector(
+                    connector_config, state=None, dry_run=True
+                ),
+                prefetch_handler.create_connector(
+                    other_config, state=None, dry_run=True
+                ),
+            )
+
+        kafka_connect.get_connectors.assert_awaited_once()
+        kafka_connect.get_connector.assert_not_called()
+        kafka_connect.get_connector_status.assert_not_called()
+        assert {
+            "event": "Connector already exists.",
+            "connector_name": CONNECTOR_NAME,
+            "log_level": "info",
+        } in cap_logs
+        assert {
+            "event": "Connector does not exist. Creating connector",
+            "connector_name": "other-connector",
+            "state": None,
+            "log_level": "info",
+        } in cap_logs
+
+    @pytest.mark.usefixtures("mock_get_connectors")
+    async def test_destroy_connector_after_update_prefetched(
+        self,
+        kafka_connect: AsyncMock,
+        prefetch_handler: KafkaConnectHandler,
+        connector_config_update: KafkaConnectorConfig,
+    ) -> None:
+        await prefetch_handler.create_connector(
+            connector_config_update, state=None, dry_run=False
+        )
+        kafka_connect.update_connector_config.assert_called_once()
+        kafka_connect.get_connector.assert_not_called()
+
+        # the snapshot is stale for modified connectors
+        await prefetch_handler.destroy_connector(CONNECTOR_NAME, dry_run=False)
+        kafka_connect.get_connector.assert_called_once_with(CONNECTOR_NAME)
+        kafka_connect.delete_connector.assert_called_once_with(
+            CONNECTOR_NAME, dry_run=False
+        )
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            KafkaConnectError(httpx2.Response(httpx2.codes.NOT_FOUND)),
+            unexpected_response_error(),
+        ],
+        ids=["kafka-connect-error", "validation-error"],
+    )
+    @pytest.mark.usefixtures("mock_get_connector")
+    async def test_destroy_connector_dry_run_when_prefetch_fails(
+        self,
+        kafka_connect: AsyncMock,
+        prefetch_handler: KafkaConnectHandler,
+        error: Exception,
+    ) -> None:
+        kafka_connect.get_connectors.side_effect = error
+
+        with capture_logs() as cap_logs:
+            await prefetch_handler.destroy_connector(CONNECTOR_NAME, dry_run=True)
+            await prefetch_handler.destroy_connector(CONNECTOR_NAME, dry_run=True)
+
+        kafka_connect.get_connectors.assert_awaited_once()
+        assert kafka_connect.get_connector.await_count == 2
+        assert [
+            log["event"] for log in cap_logs if log["log_level"] == "warning"
+        ].count(
+            "Could not prefetch connectors. Falling back to requests per connector."
+        ) == 1
@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import pytest
+from schema_registry.client.schema import AvroSchema, JsonSchema
+
+from kpops.component_handlers.schema_handler.cache import SchemaCache
+from kpops.component_handlers.schema_handler.schema_provider import Schema
+from kpops.components.base_components.models import ModelName, ModelVersion
+
+SCHEMA_CLASS = "com.bakdata.kpops.test.SchemaHandlerTest"
+
+
+class TestSchemaCache:
+    @pytest.fixture()
+    def cache(self, tmp_path: Path) -> SchemaCache:
+        return SchemaCache(tmp_path / "cache")
+
+    @pytest.mark.parametrize(
+        "schema",
+        [
+            pytest.param(
+                AvroSchema({"type": "record", "name": "A", "fields": []}), id="avro"
+            ),
+            pytest.param(JsonSchema({"type": "object"}), id="json"),
+        ],
+    )
+    def test_get_set(self, cache: SchemaCache, schema: Schema) -> None:
+        assert cache.get("key") is None
+        cache.set("key", schema)
+        cached_schema = cache.get("key")
+        assert type(cached_schema) is type(schema)
+        assert cached_schema == schema
+        assert [path.name for path in cache.directory.iterdir()] == ["key.json"]
+
+    def test_get_corrupt(self, cache: SchemaCache) -> None:
+        cache.directory.mkdir()
+        (cache.directory / "key.json").write_text("{")
+        assert cache.get("key") is None
+
+    def test_key(self) -> None:
+        a = {ModelName("a"): ModelVersion("1")}
+        b = {ModelName("b"): ModelVersion("2")}
+        key = SchemaCache.key(SCHEMA_CLASS, a | b)
+        assert key == SchemaCache.key(SCHEMA_CLASS, b | a)
+        assert key != SchemaCache.key(SCHEMA_CLASS, a)
+        assert key != SchemaCache.key("com.bakdata.kpops.test.Other", {})
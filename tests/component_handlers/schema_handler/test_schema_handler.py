@@ -1,5 +1,7 @@
+import asyncio
 import json
 import re
+from pathlib import Path
 from unittest.mock import AsyncMock
 
 import pytest
@@ -10,7 +12,10 @@ from schema_registry.client.schema import AvroSchema
 from schema_registry.client.utils import SchemaVersion
 from structlog.testing import capture_logs
 
-from kpops.component_handlers.schema_handler.schema_handler import SchemaHandler
+from kpops.component_handlers.schema_handler.schema_handler import (
+    SchemaHandler,
+    schema_fingerprint,
+)
 from kpops.component_handlers.schema_handler.schema_provider import SchemaProvider
 from kpops.components.base_components.models import TopicName
 from kpops.components.base_components.models.to_section import (
@@ -253,6 +258,101 @@ async def test_should_submit_non_existing_schema_when_not_dry(
     )
 
 
+@pytest.mark.usefixtures("custom_components")
+async def test_should_submit_schemas_concurrently(
+    topic_config: TopicConfig,
+    schema_registry_mock: AsyncMock,
+    kpops_config: KpopsConfig,
+) -> None:
+    kpops_config.schema_registry.max_concurrency = 2
+    schema_handler = SchemaHandler(kpops_config)
+    to_section = ToSection(
+        topics={TopicName(f"topic-{i}"): topic_config for i in range(5)}
+    )
+
+    running = 0
+    peak = 0
+
+    async def register(subject: str, schema: AvroSchema) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return 1
+
+    schema_registry_mock.register.side_effect = register
+
+    await schema_handler.submit_schemas(to_section, False)
+
+    assert peak == 2
+    assert schema_registry_mock.register.call_count == 5
+
+
+@pytest.mark.usefixtures("custom_components")
+async def test_should_cache_verified_schemas_for_the_run(
+    to_section: ToSection,
+    schema_registry_mock: AsyncMock,
+    kpops_config: KpopsConfig,
+) -> None:
+    schema_handler = SchemaHandler(kpops_config)
+
+    schema_registry_mock.get_versions.return_value = [1]
+    schema_registry_mock.check_version.return_value = None
+    schema_registry_mock.test_compatibility.return_value = True
+
+    await schema_handler.submit_schemas(to_section, True)
+    await schema_handler.submit_schemas(to_section, True)
+    schema_registry_mock.get_versions.assert_called_once_with("topic-X-value")
+    schema_registry_mock.test_compatibility.assert_called_once()
+
+    await schema_handler.submit_schemas(to_section, False)
+    await schema_handler.submit_schemas(to_section, False)
+    await schema_handler.submit_schemas(to_section, True)
+    schema_registry_mock.register.assert_called_once()
+
+    schema_registry_mock.delete_subject.return_value = [1]
+    await schema_handler.delete_schemas(to_section, False)
+    await schema_handler.submit_schemas(to_section, False)
+    assert schema_registry_mock.register.call_count == 2
+
+
+@pytest.mark.usefixtures("custom_components")
+async def test_should_provide_shared_schema_once(
+    topic_config: TopicConfig,
+    schema_registry_mock: AsyncMock,
+    kpops_config: KpopsConfig,
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    kpops_config.schema_registry.schema_cache = tmp_path
+    to_section = ToSection(
+        topics={TopicName(f"topic-{i}"): topic_config for i in range(5)}
+    )
+    schema_handler = SchemaHandler(kpops_config)
+    provide_schema = mocker.spy(schema_handler.schema_provider, "provide_schema")
+
+    await schema_handler.submit_schemas(to_section, False)
+    provide_schema.assert_called_once_with(topic_config.value_schema, {})
+    assert schema_registry_mock.register.call_count == 5
+
+    # the next run reads the schema from disk
+    schema_handler = SchemaHandler(kpops_config)
+    provide_schema = mocker.spy(schema_handler.schema_provider, "provide_schema")
+    await schema_handler.submit_schemas(to_section, False)
+    provide_schema.assert_not_called()
+    assert schema_registry_mock.register.call_count == 10
+
+
+def test_schema_fingerprint() -> None:
+    schema = AvroSchema({"type": "record", "name": "A", "fields": []})
+    same_schema = AvroSchema({"fields": [], "name": "A", "type": "record"})
+    other_schema = AvroSchema({"type": "record", "name": "B", "fields": []})
+
+    assert schema_fingerprint(schema) == schema_fingerprint(same_schema)
+    assert schema_fingerprint(schema) != schema_fingerprint(other_schema)
+
+
 async def test_should_log_correct_message_when_delete_schemas_and_in_dry_run(
     to_section: ToSection,
     schema_registry_mock: AsyncMock,
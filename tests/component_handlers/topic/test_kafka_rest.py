@@ -153,6 +153,54 @@ class TestKafkaRest:
         with pytest.raises(KafkaRestProxyError):
             await kafka_rest.get_broker_config()
 
+    async def test_should_call_get_topics(
+        self, kafka_rest: KafkaRest, httpx_mock: HTTPXMock
+    ) -> None:
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{DEFAULT_HOST}/v3/clusters/{kafka_rest.cluster_id}/topics",
+            status_code=httpx2.codes.INTERNAL_SERVER_ERROR,
+        )
+
+        with pytest.raises(KafkaRestProxyError):
+            await kafka_rest.get_topics()
+
+    async def test_should_get_topics(
+        self, kafka_rest: KafkaRest, httpx_mock: HTTPXMock
+    ) -> None:
+        topic_response = json.loads(
+            await Path(
+                RESOURCES_PATH / "kafka_rest_proxy_responses/get_topic_response.json"
+            ).read_text()
+        )
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{DEFAULT_HOST}/v3/clusters/{kafka_rest.cluster_id}/topics",
+            json={"kind": "KafkaTopicList", "data": [topic_response]},
+            status_code=httpx2.codes.OK,
+        )
+
+        topics = await kafka_rest.get_topics()
+        assert topics.data == [TopicResponse.model_validate(topic_response)]
+
+    async def test_should_get_all_topic_configs(
+        self, kafka_rest: KafkaRest, httpx_mock: HTTPXMock
+    ) -> None:
+        topic_config_response = json.loads(
+            await Path(
+                RESOURCES_PATH / "kafka_rest_proxy_responses/topic_config_response.json"
+            ).read_text()
+        )
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{DEFAULT_HOST}/v3/clusters/{kafka_rest.cluster_id}/topics/-/configs",
+            json=topic_config_response,
+            status_code=httpx2.codes.OK,
+        )
+
+        topic_configs = await kafka_rest.get_all_topic_configs()
+        assert {config.topic_name for config in topic_configs.data} == {"topic-1"}
+
     async def test_should_raise_connection_error_when_service_unreachable(
         self, kafka_rest: KafkaRest, httpx_mock: HTTPXMock
     ) -> None:
@@ -1,8 +1,10 @@
+import asyncio
 import json
 import re
 from unittest import mock
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx2
 import pytest
 import pytest_asyncio
 import structlog
@@ -10,6 +12,7 @@ from anyio import Path
 from structlog.testing import capture_logs
 
 from kpops.component_handlers.topic.exception import (
+    KafkaRestProxyError,
     TopicNotFoundException,
     TopicTransactionError,
 )
@@ -17,6 +20,7 @@ from kpops.component_handlers.topic.handler import TopicHandler
 from kpops.component_handlers.topic.model import (
     BrokerConfigResponse,
     TopicConfigResponse,
+    TopicListResponse,
     TopicResponse,
     TopicSpec,
 )
@@ -508,3 +512,205 @@ class TestTopicHandler:
             "topic_name": "topic-X",
             "log_level": "warning",
         } in cap_logs
+
+    @pytest.fixture()
+    def prefetch_kafka_rest(self, get_topic_response_mock: MagicMock) -> MagicMock:
+        kafka_rest = get_topic_response_mock
+        topic = kafka_rest.get_topic.return_value
+        topic_config = kafka_rest.get_topic_config.return_value
+        kafka_rest.get_topics.return_value = TopicListResponse(data=[topic])
+        kafka_rest.get_all_topic_configs.return_value = TopicConfigResponse(
+            data=[
+                config.model_copy(update={"topic_name": topic.topic_name})
+                for config in topic_config.data
+            ]
+        )
+        return kafka_rest
+
+    async def test_should_prefetch_topics_once(
+        self, prefetch_kafka_rest: MagicMock
+    ) -> None:
+        kafka_rest = prefetch_kafka_rest
+        topic_handler = TopicHandler(kafka_rest=kafka_rest, prefetch=True)
+
+        topic_config = TopicConfig(
+            type=OutputTopicTypes.OUTPUT,
+            partitions_count=10,
+            replication_factor=3,
+            configs={"cleanup.policy": "compact", "compression.type": "gzip"},
+        )
+        topics = [
+            KafkaTopic(name="topic-X", config=topic_config),
+            KafkaTopic(name="topic-Y", config=topic_config),
+        ]
+        with capture_logs() as cap_logs:
+            await asyncio.gather(
+                *(topic_handler.create_topic(topic, dry_run=True) for topic in topics)
+            )
+
+        kafka_rest.get_topics.assert_awaited_once()
+        kafka_rest.get_all_topic_configs.assert_awaited_once()
+        kafka_rest.get_broker_config.assert_awaited_once()
+        kafka_rest.get_topic.assert_not_called()
+        kafka_rest.get_topic_config.assert_not_called()
+        assert {
+            "event": "Topic already exists in cluster.",
+            "topic_name": "topic-X",
+            "log_level": "info",
+        } in cap_logs
+        assert {
+            "event": greenify(
+                "Topic Creation: topic-Y does not exist in the cluster. Creating topic."
+            ),
+            "log_level": "info",
+        } in cap_logs
+
+    async def test_should_request_modified_topics_after_prefetch(
+        self, prefetch_kafka_rest: MagicMock
+    ) -> None:
+        kafka_rest = prefetch_kafka_rest
+        topic_handler = TopicHandler(kafka_rest=kafka_rest, prefetch=True)
+
+        topic_config = TopicConfig(
+            type=OutputTopicTypes.OUTPUT,
+            partitions_count=10,
+            replication_factor=3,
+            configs={"cleanup.policy": "delete"},
+        )
+        topic = KafkaTopic(name="topic-X", config=topic_config)
+        await topic_handler.create_topic(topic, dry_run=False)
+        kafka_rest.batch_alter_topic_config.assert_called_once()
+        kafka_rest.get_topic.assert_not_called()
+
+        await topic_handler.delete_topic(topic, dry_run=False)
+        kafka_rest.get_topic.assert_called_once_with("topic-X")
+        kafka_rest.delete_topic.assert_called_once_with("topic-X")
+
+    async def test_should_fall_back_when_prefetch_fails(
+        self, prefetch_kafka_rest: MagicMock
+    ) -> None:
+        kafka_rest = prefetch_kafka_rest
+        kafka_rest.get_topics.side_effect = KafkaRestProxyError(
+            httpx2.Response(httpx2.codes.FORBIDDEN)
+        )
+        topic_handler = TopicHandler(kafka_rest=kafka_rest, prefetch=True)
+
+        topic = KafkaTopic(name="topic-X", config=TopicConfig(partitions_count=10))
+        with capture_logs() as cap_logs:
+            await topic_handler.delete_topic(topic, dry_run=True)
+            await topic_handler.delete_topic(topic, dry_run=True)
+
+        kafka_rest.get_topics.assert_awaited_once()
+        assert kafka_rest.get_topic.await_count == 2
+        assert (
+            sum(
+                log["event"]
+                == "Could not prefetch topics. Falling back to requests per topic."
+                for log in cap_logs
+            )
+            == 1
+        )
+
+    async def test_should_request_broker_config_once(
+        self, get_topic_response_mock: MagicMock
+    ) -> None:
+        kafka_rest = get_topic_response_mock
+        topic_handler = TopicHandler(kafka_rest=kafka_rest)
+
+        topic_config = TopicConfig(
+            type=OutputTopicTypes.OUTPUT,
+            partitions_count=10,
+            replication_factor=3,
+            configs={"cleanup.policy": "compact", "compression.type": "gzip"},
+        )
+        topic = KafkaTopic(name="topic-X", config=topic_config)
+        await asyncio.gather(
+            *(topic_handler.create_topic(topic, dry_run=True) for _ in range(3))
+        )
+        kafka_rest.get_broker_config.assert_awaited_once()
+
+        topic_handler.invalidate_broker_config()
+        await topic_handler.create_topic(topic, dry_run=True)
+        assert kafka_rest.get_broker_config.await_count == 2
+
+    async def test_should_create_topics_concurrently(self) -> None:
+        kafka_rest = AsyncMock()
+        kafka_rest.get_topic.side_effect = TopicNotFoundException()
+        running = 0
+        max_running = 0
+
+        async def create_topic(topic_spec: TopicSpec) -> None:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if topic_spec.topic_name == "topic-2":
+                raise TopicTransactionError
+
+        kafka_rest.create_topic.side_effect = create_topic
+        topic_handler = TopicHandler(kafka_rest=kafka_rest)
+
+        topics = [
+            KafkaTopic(name=f"topic-{i}", config=TopicConfig(partitions_count=1))
+            for i in range(5)
+        ]
+        with capture_logs() as cap_logs:
+            results = await topic_handler.create_topics(
+                topics, dry_run=False, raise_on_error=False
+            )
+
+        assert max_running == 5
+        assert [result.topic_name for result in results] == [
+            topic.name for topic in topics
+        ]
+        assert [result.ok for result in results] == [True, True, False, True, True]
+        assert isinstance(results[2].exception, TopicTransactionError)
+        assert {
+            "event": "Topic operation failed.",
+            "topic_name": "topic-2",
+            "error": "",
+            "log_level": "warning",
+        } in cap_logs
+        with pytest.raises(TopicTransactionError):
+            await topic_handler.create_topics(topics, dry_run=False)
+
+    async def test_should_raise_unexpected_error_after_all_topics(self) -> None:
+        kafka_rest = AsyncMock()
+        kafka_rest.get_topic.side_effect = TopicNotFoundException()
+        created: list[str] = []
+
+        async def create_topic(topic_spec: TopicSpec) -> None:
+            if topic_spec.topic_name == "topic-0":
+                msg = "Connection lost"
+                raise RuntimeError(msg)
+            await asyncio.sleep(0.01)
+            created.append(topic_spec.topic_name)
+
+        kafka_rest.create_topic.side_effect = create_topic
+        topic_handler = TopicHandler(kafka_rest=kafka_rest)
+
+        topics = [
+            KafkaTopic(name=f"topic-{i}", config=TopicConfig(partitions_count=1))
+            for i in range(3)
+        ]
+        with pytest.raises(RuntimeError, match="Connection lost"):
+            await topic_handler.create_topics(
+                topics, dry_run=False, raise_on_error=False
+            )
+        assert created == ["topic-1", "topic-2"]
+
+    async def test_should_delete_topics(self) -> None:
+        kafka_rest = AsyncMock()
+        topic_handler = TopicHandler(kafka_rest=kafka_rest)
+
+        topics = [
+            KafkaTopic(name=f"topic-{i}", config=TopicConfig(partitions_count=1))
+            for i in range(3)
+        ]
+        results = await topic_handler.delete_topics(topics, dry_run=False)
+
+        assert all(result.ok for result in results)
+        assert kafka_rest.delete_topic.mock_calls == [
+            mock.call(topic.name) for topic in topics
+        ]
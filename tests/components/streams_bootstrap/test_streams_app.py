@@ -382,15 +382,15 @@ class TestStreamsApp:
                 },
             },
         )
-        mock_create_topic = mocker.patch.object(
-            get_handlers().topic_handler, "create_topic"
+        mock_create_topics = mocker.patch.object(
+            get_handlers().topic_handler, "create_topics"
         )
         mock_helm_upgrade_install = mocker.patch.object(
             streams_app._helm, "upgrade_install"
         )
 
         mock = mocker.AsyncMock()
-        mock.attach_mock(mock_create_topic, "mock_create_topic")
+        mock.attach_mock(mock_create_topics, "mock_create_topics")
         mock.attach_mock(mock_helm_upgrade_install, "helm_upgrade_install")
 
         dry_run = False
@@ -428,9 +428,8 @@ class TestStreamsApp:
             ),
         ]
         assert mock.mock_calls == [
-            *(
-                mocker.call.mock_create_topic(topic, dry_run=dry_run)
-                for topic in streams_app.to.kafka_topics
+            mocker.call.mock_create_topics(
+                streams_app.to.kafka_topics, dry_run=dry_run
             ),
             mocker.call.helm_upgrade_install(
                 STREAMS_APP_RELEASE_NAME,
@@ -124,20 +124,17 @@ class TestProducerApp:
         mocker: MockerFixture,
     ) -> None:
         mock = mocker.AsyncMock()
-        mock_create_topic = mocker.patch.object(
-            get_handlers().topic_handler, "create_topic"
+        mock_create_topics = mocker.patch.object(
+            get_handlers().topic_handler, "create_topics"
         )
-        mock.attach_mock(mock_create_topic, "mock_create_topic")
+        mock.attach_mock(mock_create_topics, "mock_create_topics")
         mock_helm_upgrade_install = mocker.patch.object(Helm, "upgrade_install")
         mock.attach_mock(mock_helm_upgrade_install, "mock_helm_upgrade_install")
 
         await producer_app.deploy(dry_run=False)
         assert producer_app.to
         assert mock.mock_calls == [
-            *(
-                mocker.call.mock_create_topic(topic, dry_run=False)
-                for topic in producer_app.to.kafka_topics
-            ),
+            mocker.call.mock_create_topics(producer_app.to.kafka_topics, dry_run=False),
             mocker.call.mock_helm_upgrade_install(
                 PRODUCER_APP_RELEASE_NAME,
                 "bakdata-streams-bootstrap/producer-app",
@@ -5,12 +5,15 @@ from typing import Any, ClassVar
 
 import pydantic
 import pytest
+from pytest_mock import MockerFixture
 
+from kpops.components.base_components import base_defaults_component
 from kpops.components.base_components.base_defaults_component import (
     BaseDefaultsComponent,
+    DefaultsResolver,
     get_defaults_file_paths,
 )
-from kpops.config import KpopsConfig
+from kpops.config import KpopsConfig, get_config
 from kpops.const.file_type import DEFAULTS_YAML, PIPELINE_YAML, KpopsFileType
 from kpops.utils.environment import ENV, PIPELINE_PATH
 from tests.components import PIPELINE_BASE_DIR, RESOURCES_PATH
@@ -44,6 +47,52 @@ class EnvVarTest(BaseDefaultsComponent):
     name: str | None = None
 
 
+class ValidationCounter(BaseDefaultsComponent):
+    __test__: ClassVar[bool] = False
+    validations: ClassVar[int] = 0
+    name: str = "counter"
+    label: str = "${component.type}-${component.name}"
+
+    @pydantic.model_validator(mode="before")
+    @classmethod
+    def count_validation(cls, values: Any) -> Any:
+        cls.validations += 1
+        return values
+
+
+class ComputedFieldSubstitution(BaseDefaultsComponent):
+    __test__: ClassVar[bool] = False
+    name: str = "computed"
+    label: str = "${component.full_name}"
+
+    @pydantic.computed_field
+    @property
+    def full_name(self) -> str:
+        return f"prefix-{self.name}"
+
+
+class AliasSubstitution(BaseDefaultsComponent):
+    __test__: ClassVar[bool] = False
+    model_config: ClassVar[pydantic.ConfigDict] = pydantic.ConfigDict(
+        populate_by_name=True
+    )
+    name: str = "alias"
+    display_name: str = pydantic.Field(default="display", alias="displayName")
+    label: str | None = None
+
+
+class NormalizedSubstitution(BaseDefaultsComponent):
+    __test__: ClassVar[bool] = False
+    name: str = "normalized"
+    topic: str = "TOPIC"
+    label: str = "${component.topic}"
+
+    @pydantic.field_validator("topic")
+    @classmethod
+    def normalize_topic(cls, topic: str) -> str:
+        return topic.lower()
+
+
 @pytest.fixture(autouse=True)
 def env() -> None:
     ENV[PIPELINE_PATH] = str(RESOURCES_PATH / "pipeline.yaml")
@@ -187,6 +236,64 @@ class TestBaseDefaultsComponent:
         assert isinstance(component.nested, Nested)
         assert component.nested == Nested.model_validate({"foo": "foo", "bar": False})
 
+    def test_defaults_resolver_parses_defaults_once(
+        self, mocker: MockerFixture
+    ) -> None:
+        ENV["environment"] = "development"
+        spy_get_defaults_file_paths = mocker.spy(
+            base_defaults_component, "get_defaults_file_paths"
+        )
+        spy_defaults_from_yaml = mocker.spy(
+            base_defaults_component, "defaults_from_yaml"
+        )
+        expected = [Child(), GrandChild(), Child()]
+        spy_get_defaults_file_paths.reset_mock()
+        spy_defaults_from_yaml.reset_mock()
+
+        resolver = DefaultsResolver(
+            RESOURCES_PATH / PIPELINE_YAML, get_config(), "development"
+        )
+        with resolver.activate():
+            assert DefaultsResolver.active() is resolver
+            components = [Child(), GrandChild(), Child()]
+        assert DefaultsResolver.active() is None
+
+        assert components == expected
+        spy_get_defaults_file_paths.assert_called_once()
+        defaults_file_paths = resolver.defaults_file_paths
+        # defaults are loaded once per component type, not per instance
+        # Child: Child, Parent, BaseDefaultsComponent
+        # GrandChild: GrandChild, Child, Parent, BaseDefaultsComponent
+        assert spy_defaults_from_yaml.call_count == (3 + 4) * len(defaults_file_paths)
+
+    def test_validate_once(self) -> None:
+        ValidationCounter.validations = 0
+        component = ValidationCounter(name="foo")
+        assert component.label == "validation-counter-foo"
+        assert ValidationCounter.validations == 1
+
+    def test_substitute_computed_field(self) -> None:
+        component = ComputedFieldSubstitution(name="foo")
+        assert component.label == "prefix-foo"
+
+    @pytest.mark.parametrize(
+        ("label", "expected"),
+        [
+            ("${component.displayName}", "foo"),
+            # placeholders refer to the validated component, i.e. to the alias
+            ("${component.display_name}", "${component.display_name}"),
+        ],
+    )
+    def test_substitute_aliased_field(self, label: str, expected: str) -> None:
+        values: dict[str, Any] = {"display_name": "foo", "label": label}
+        component = AliasSubstitution(**values)
+        assert component.label == expected
+
+    def test_substitute_normalized_field(self) -> None:
+        component = NormalizedSubstitution(topic="Foo")
+        assert component.topic == "foo"
+        assert component.label == "foo"
+
     @pytest.mark.parametrize(
         ("pipeline_path", "environment", "expected_default_paths"),
         [
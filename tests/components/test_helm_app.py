@@ -8,6 +8,7 @@ from typing_extensions import override
 from kpops.component_handlers.helm.helm import Helm
 from kpops.component_handlers.helm.model import (
     HelmConfig,
+    HelmRelease,
     HelmRepoConfig,
     HelmUpgradeInstallFlags,
     RepoAuthFlags,
@@ -79,7 +80,7 @@ class TestHelmApp:
             HelmUpgradeInstallFlags(),
         )
 
-    async def test_should_lazy_load_helm_and_call_repo_add_when_implemented(
+    async def test_should_call_repo_add_on_prepare_when_implemented(
         self,
         helm_mock: MagicMock,
         mocker: MockerFixture,
@@ -103,6 +104,7 @@ class TestHelmApp:
             new_callable=mocker.PropertyMock,
         )
 
+        await helm_app.prepare()
         await helm_app.deploy(dry_run=False)
 
         assert helm_mock.mock_calls == [
@@ -144,6 +146,7 @@ class TestHelmApp:
             namespace="test-namespace",
         )
 
+        await app_with_local_chart.prepare()
         await app_with_local_chart.deploy(dry_run=False)
 
         helm_mock.add_repo.assert_not_called()
@@ -168,7 +171,6 @@ class TestHelmApp:
     ) -> None:
         with pytest.raises(NotImplementedError) as error:
             await helm_app.deploy(True)
-        helm_mock.add_repo.assert_called()
         assert (
             str(error.value)
             == "Please implement the helm_chart property of the kpops.components.base_components.helm_app module."
@@ -235,6 +237,105 @@ class TestHelmApp:
         finally:
             set_config(original_config)
 
+    @pytest.mark.parametrize(
+        ("release", "deployed_values", "upgraded"),
+        [
+            pytest.param(
+                HelmRelease(
+                    name="${pipeline.name}-test-helm-app",
+                    namespace="test-namespace",
+                    revision="1",
+                    status="deployed",
+                    chart="test-chart-1.0.0",
+                    app_version="1.0.0",
+                ),
+                {
+                    "nameOverride": "${pipeline.name}-test-helm-app",
+                    "fullnameOverride": "${pipeline.name}-test-helm-app",
+                    "foo": "test-value",
+                },
+                False,
+                id="unchanged",
+            ),
+            pytest.param(
+                HelmRelease(
+                    name="${pipeline.name}-test-helm-app",
+                    namespace="test-namespace",
+                    revision="1",
+                    status="deployed",
+                    chart="test-chart-1.0.0",
+                    app_version="1.0.0",
+                ),
+                {"foo": "old-value"},
+                True,
+                id="values-changed",
+            ),
+            pytest.param(
+                HelmRelease(
+                    name="${pipeline.name}-test-helm-app",
+                    namespace="test-namespace",
+                    revision="1",
+                    status="deployed",
+                    chart="test-chart-0.9.0",
+                    app_version="0.9.0",
+                ),
+                {},
+                True,
+                id="chart-version-changed",
+            ),
+            pytest.param(
+                HelmRelease(
+                    name="${pipeline.name}-test-helm-app",
+                    namespace="test-namespace",
+                    revision="1",
+                    status="failed",
+                    chart="test-chart-1.0.0",
+                    app_version="1.0.0",
+                ),
+                {},
+                True,
+                id="failed",
+            ),
+            pytest.param(None, None, True, id="not-installed"),
+        ],
+    )
+    async def test_should_skip_upgrade_of_unchanged_release(
+        self,
+        app_values: HelmAppValues,
+        mocker: MockerFixture,
+        helm_mock: MagicMock,
+        release: HelmRelease | None,
+        deployed_values: dict[str, str] | None,
+        upgraded: bool,
+    ) -> None:
+        original_config = get_config()
+        set_config(
+            KpopsConfig(
+                kafka_brokers="broker:9092",
+                helm_config=HelmConfig(skip_unchanged=True),
+            )
+        )
+        mocker.patch.object(
+            HelmApp,
+            "helm_chart",
+            return_value="test/test-chart",
+            new_callable=mocker.PropertyMock,
+        )
+        helm_mock.get_release.return_value = release
+        helm_mock.get_values.return_value = deployed_values
+        try:
+            helm_app = HelmApp(
+                name="test-helm-app",
+                values=app_values,
+                namespace="test-namespace",
+                version="1.0.0",
+            )
+            await helm_app.deploy(dry_run=False)
+        finally:
+            set_config(original_config)
+
+        assert helm_mock.upgrade_install.called is upgraded
+
     async def test_should_call_helm_uninstall_when_destroying_helm_app(
         self,
         helm_app: HelmApp,
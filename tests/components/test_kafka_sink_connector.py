@@ -121,25 +121,22 @@ class TestKafkaSinkConnector(TestKafkaConnector):
         connector: KafkaSinkConnector,
         mocker: MockerFixture,
     ) -> None:
-        mock_create_topic = mocker.patch.object(
-            get_handlers().topic_handler, "create_topic"
+        mock_create_topics = mocker.patch.object(
+            get_handlers().topic_handler, "create_topics"
         )
         mock_create_connector = mocker.patch.object(
             get_handlers().connector_handler, "create_connector"
         )
 
         mock = mocker.AsyncMock()
-        mock.attach_mock(mock_create_topic, "mock_create_topic")
+        mock.attach_mock(mock_create_topics, "mock_create_topics")
         mock.attach_mock(mock_create_connector, "mock_create_connector")
         dry_run = True
 
         await connector.deploy(dry_run=dry_run)
         assert connector.to
         assert mock.mock_calls == [
-            *(
-                mocker.call.mock_create_topic(topic, dry_run=dry_run)
-                for topic in connector.to.kafka_topics
-            ),
+            mocker.call.mock_create_topics(connector.to.kafka_topics, dry_run=dry_run),
             mocker.call.mock_create_connector(
                 connector.config, state=None, dry_run=dry_run
             ),
@@ -205,8 +202,8 @@ class TestKafkaSinkConnector(TestKafkaConnector):
         mocker: MockerFixture,
     ) -> None:
         mock_destroy = mocker.patch.object(connector, "destroy")
-        mock_delete_topic = mocker.patch.object(
-            get_handlers().topic_handler, "delete_topic"
+        mock_delete_topics = mocker.patch.object(
+            get_handlers().topic_handler, "delete_topics"
         )
         mock_reset_connector = mocker.patch.object(
             get_handlers().connector_handler, "reset_connector"
@@ -217,7 +214,7 @@ class TestKafkaSinkConnector(TestKafkaConnector):
 
         mock_reset_connector.assert_called_once_with(connector.config, dry_run=dry_run)
         mock_destroy.assert_called_once_with(dry_run)
-        mock_delete_topic.assert_not_called()
+        mock_delete_topics.assert_not_called()
         dry_run_handler_mock.print_helm_diff.assert_not_called()
 
     async def test_clean_when_dry_run_is_true(
@@ -237,8 +234,8 @@ class TestKafkaSinkConnector(TestKafkaConnector):
         mocker: MockerFixture,
     ) -> None:
         mock_destroy = mocker.patch.object(connector, "destroy")
-        mock_delete_topic = mocker.patch.object(
-            get_handlers().topic_handler, "delete_topic"
+        mock_delete_topics = mocker.patch.object(
+            get_handlers().topic_handler, "delete_topics"
         )
         mock_reset_connector = mocker.patch.object(
             get_handlers().connector_handler, "reset_connector"
@@ -247,7 +244,7 @@ class TestKafkaSinkConnector(TestKafkaConnector):
         mock = mocker.MagicMock()
         mock.attach_mock(mock_reset_connector, "mock_reset_connector")
         mock.attach_mock(mock_destroy, "destroy_connector")
-        mock.attach_mock(mock_delete_topic, "mock_delete_topic")
+        mock.attach_mock(mock_delete_topics, "mock_delete_topics")
 
         dry_run = False
         await connector.clean(dry_run=dry_run)
@@ -256,10 +253,7 @@ class TestKafkaSinkConnector(TestKafkaConnector):
         assert mock.mock_calls == [
             mocker.call.mock_reset_connector(connector.config, dry_run=dry_run),
             mocker.call.destroy_connector(dry_run),
-            *(
-                mocker.call.mock_delete_topic(topic, dry_run=dry_run)
-                for topic in connector.to.kafka_topics
-            ),
+            mocker.call.mock_delete_topics(connector.to.kafka_topics, dry_run=dry_run),
         ]
         dry_run_handler_mock.print_helm_diff.assert_not_called()
 
@@ -292,15 +286,15 @@ class TestKafkaSinkConnector(TestKafkaConnector):
 
         mock_destroy = mocker.patch.object(connector, "destroy")
 
-        mock_delete_topic = mocker.patch.object(
-            get_handlers().topic_handler, "delete_topic"
+        mock_delete_topics = mocker.patch.object(
+            get_handlers().topic_handler, "delete_topics"
         )
         mock_clean_connector = mocker.patch.object(
             get_handlers().connector_handler, "clean_connector"
         )
         mock = mocker.MagicMock()
         mock.attach_mock(mock_destroy, "destroy_connector")
-        mock.attach_mock(mock_delete_topic, "mock_delete_topic")
+        mock.attach_mock(mock_delete_topics, "mock_delete_topics")
         mock.attach_mock(mock_clean_connector, "mock_clean_connector")
         mock.attach_mock(helm_mock, "helm")
 
@@ -312,4 +306,4 @@ class TestKafkaSinkConnector(TestKafkaConnector):
         ]
 
         dry_run_handler_mock.print_helm_diff.assert_not_called()
-        mock_delete_topic.assert_not_called()
+        mock_delete_topics.assert_not_called()
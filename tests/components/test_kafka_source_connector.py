@@ -75,8 +75,8 @@ class TestKafkaSourceConnector(TestKafkaConnector):
         connector: KafkaSourceConnector,
         mocker: MockerFixture,
     ) -> None:
-        mock_create_topic = mocker.patch.object(
-            get_handlers().topic_handler, "create_topic"
+        mock_create_topics = mocker.patch.object(
+            get_handlers().topic_handler, "create_topics"
         )
 
         mock_create_connector = mocker.patch.object(
@@ -84,17 +84,14 @@ class TestKafkaSourceConnector(TestKafkaConnector):
         )
 
         mock = mocker.AsyncMock()
-        mock.attach_mock(mock_create_topic, "mock_create_topic")
+        mock.attach_mock(mock_create_topics, "mock_create_topics")
         mock.attach_mock(mock_create_connector, "mock_create_connector")
         dry_run = True
 
         await connector.deploy(dry_run=dry_run)
         assert connector.to
         assert mock.mock_calls == [
-            *(
-                mocker.call.mock_create_topic(topic, dry_run=dry_run)
-                for topic in connector.to.kafka_topics
-            ),
+            mocker.call.mock_create_topics(connector.to.kafka_topics, dry_run=dry_run),
             mocker.call.mock_create_connector(
                 connector.config, state=None, dry_run=dry_run
             ),
@@ -162,8 +159,8 @@ class TestKafkaSourceConnector(TestKafkaConnector):
         mocker: MockerFixture,
     ) -> None:
         mock_destroy = mocker.patch.object(connector, "destroy")
-        mock_delete_topic = mocker.patch.object(
-            get_handlers().topic_handler, "delete_topic"
+        mock_delete_topics = mocker.patch.object(
+            get_handlers().topic_handler, "delete_topics"
         )
         mock_reset_connector = mocker.patch.object(
             get_handlers().connector_handler, "reset_connector"
@@ -174,7 +171,7 @@ class TestKafkaSourceConnector(TestKafkaConnector):
 
         mock_reset_connector.assert_called_once_with(connector.config, dry_run=dry_run)
         mock_destroy.assert_called_once_with(dry_run)
-        mock_delete_topic.assert_not_called()
+        mock_delete_topics.assert_not_called()
         dry_run_handler_mock.print_helm_diff.assert_not_called()
 
     async def test_clean_when_dry_run_is_true(
@@ -193,8 +190,8 @@ class TestKafkaSourceConnector(TestKafkaConnector):
         mocker: MockerFixture,
     ) -> None:
         mock_destroy = mocker.patch.object(connector, "destroy")
-        mock_delete_topic = mocker.patch.object(
-            get_handlers().topic_handler, "delete_topic"
+        mock_delete_topics = mocker.patch.object(
+            get_handlers().topic_handler, "delete_topics"
         )
         mock_reset_connector = mocker.patch.object(
             get_handlers().connector_handler, "reset_connector"
@@ -203,7 +200,7 @@ class TestKafkaSourceConnector(TestKafkaConnector):
         mock = mocker.MagicMock()
         mock.attach_mock(mock_reset_connector, "mock_reset_connector")
         mock.attach_mock(mock_destroy, "destroy_connector")
-        mock.attach_mock(mock_delete_topic, "mock_delete_topic")
+        mock.attach_mock(mock_delete_topics, "mock_delete_topics")
 
         dry_run = False
         await connector.clean(dry_run)
@@ -212,10 +209,7 @@ class TestKafkaSourceConnector(TestKafkaConnector):
         assert mock.mock_calls == [
             mocker.call.mock_reset_connector(connector.config, dry_run=dry_run),
             mocker.call.destroy_connector(dry_run),
-            *(
-                mocker.call.mock_delete_topic(topic, dry_run=dry_run)
-                for topic in connector.to.kafka_topics
-            ),
+            mocker.call.mock_delete_topics(connector.to.kafka_topics, dry_run=dry_run),
         ]
         dry_run_handler_mock.print_helm_diff.assert_not_called()
 
@@ -232,8 +226,8 @@ class TestKafkaSourceConnector(TestKafkaConnector):
         assert connector.to is None
 
         mock_destroy = mocker.patch.object(connector, "destroy")
-        mock_delete_topic = mocker.patch.object(
-            get_handlers().topic_handler, "delete_topic"
+        mock_delete_topics = mocker.patch.object(
+            get_handlers().topic_handler, "delete_topics"
         )
         mock_reset_connector = mocker.patch.object(
             get_handlers().connector_handler, "reset_connector"
@@ -242,7 +236,7 @@ class TestKafkaSourceConnector(TestKafkaConnector):
         mock = mocker.MagicMock()
         mock.attach_mock(mock_reset_connector, "mock_reset_connector")
         mock.attach_mock(mock_destroy, "destroy_connector")
-        mock.attach_mock(mock_delete_topic, "mock_delete_topic")
+        mock.attach_mock(mock_delete_topics, "mock_delete_topics")
 
         dry_run = False
         await connector.clean(dry_run)
@@ -251,7 +245,7 @@ class TestKafkaSourceConnector(TestKafkaConnector):
             mocker.call.mock_reset_connector(connector.config, dry_run=dry_run),
             mocker.call.destroy_connector(dry_run),
         ]
-        mock_delete_topic.assert_not_called()
+        mock_delete_topics.assert_not_called()
         dry_run_handler_mock.print_helm_diff.assert_not_called()
 
     async def test_clean_without_to_when_dry_run_is_true(
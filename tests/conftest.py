@@ -10,7 +10,7 @@ import pytest
 from kpops.component_handlers import ComponentHandlers
 from kpops.config import KpopsConfig, TopicNameConfig, set_config
 from kpops.utils.environment import ENV, Environment
-from kpops.utils.yaml import load_yaml_file
+from kpops.utils.yaml import yaml_cache_clear
 
 logger = logging.getLogger("faker")
 logger.setLevel(logging.INFO)  # quiet faker locale messages
@@ -48,8 +48,7 @@ def mock_env() -> Iterator[Environment]:
 @pytest.fixture()
 def load_yaml_file_clear_cache() -> Iterator[None]:
     yield
-    if load_yaml_file.cache is not None:
-        load_yaml_file.cache.clear()
+    yaml_cache_clear()
 
 
 @pytest.fixture()
@@ -1,3 +1,5 @@
+from unittest.mock import AsyncMock
+
 import pytest
 from pytest_mock import MockerFixture
 
@@ -8,6 +10,10 @@ from kpops.pipeline import Pipeline
 
 @pytest.mark.usefixtures("mock_env", "config", "handlers")
 class TestDeploy:
+    @pytest.fixture(autouse=True)
+    def mock_prepare(self, mocker: MockerFixture) -> AsyncMock:
+        return mocker.patch.object(HelmApp, "prepare")
+
     async def test_order(self, pipeline: Pipeline, mocker: MockerFixture) -> None:
         producer_app_mock_deploy = mocker.patch.object(ProducerApp, "deploy")
         streams_app_mock_deploy = mocker.patch.object(StreamsApp, "deploy")
@@ -30,3 +36,18 @@ class TestDeploy:
             mocker.call.streams_app_mock_deploy(True),
             mocker.call.helm_app_mock_deploy(True),
         ]
+
+    async def test_prepare_before_deploy(
+        self, pipeline: Pipeline, mock_prepare: AsyncMock, mocker: MockerFixture
+    ) -> None:
+        mock = mocker.AsyncMock()
+        mock.attach_mock(mock_prepare, "prepare")
+        for component_type in (ProducerApp, StreamsApp, HelmApp):
+            mock.attach_mock(mocker.patch.object(component_type, "deploy"), "deploy")
+
+        await pipeline.deploy(dry_run=True, parallel=True)
+
+        assert (
+            mock.mock_calls
+            == [mocker.call.prepare()] * 3 + [mocker.call.deploy(True)] * 3
+        )
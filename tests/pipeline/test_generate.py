@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 import yaml
+from pytest_mock import MockerFixture
 from pytest_snapshot.plugin import Snapshot
 from structlog.testing import capture_logs
 from typer.testing import CliRunner
@@ -15,12 +16,20 @@ import kpops.api as kpops
 from kpops.api.options import FilterType
 from kpops.cli.main import app
 from kpops.component_handlers.kafka_connect.model import ConnectorNewState
+from kpops.components.base_components.base_defaults_component import (
+    DefaultsResolver,
+)
 from kpops.components.base_components.kafka_connector import KafkaSinkConnector
+from kpops.components.base_components.kubernetes_app import KubernetesApp
 from kpops.components.base_components.pipeline_component import PipelineComponent
 from kpops.components.streams_bootstrap.producer.producer_app import ProducerApp
 from kpops.components.streams_bootstrap.streams.streams_app import StreamsApp
 from kpops.const.file_type import PIPELINE_YAML, KpopsFileType
 from kpops.core.exception import ParsingException, ValidationError
+from kpops.manifests.kubernetes import KubernetesManifest, ObjectMeta
+from kpops.pipeline import Pipeline
+from kpops.pipeline.cache import ComponentCache
+from kpops.utils.concurrency import iterate_in_loop
 from kpops.utils.environment import ENV
 
 runner = CliRunner()
@@ -473,6 +482,101 @@ class TestGenerate:
             enriched_pipeline[0]["values"]["kafka"]["bootstrapServers"] == "env_broker"
         )
 
+    def test_component_cache(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        monkeypatch.setenv(name="KPOPS_COMPONENT_CACHE", value=str(tmp_path))
+        pipeline = kpops.generate(RESOURCE_PATH / "first-pipeline" / PIPELINE_YAML)
+        assert len(list(tmp_path.iterdir())) == len(pipeline)
+
+        # environment variables unrelated to the pipeline don't invalidate it
+        monkeypatch.setenv(name="UNRELATED", value="value")
+        with mock.patch.object(
+            PipelineComponent, "_enrich_values", side_effect=AssertionError
+        ):
+            cached_pipeline = kpops.generate(
+                RESOURCE_PATH / "first-pipeline" / PIPELINE_YAML
+            )
+        assert cached_pipeline.to_yaml() == pipeline.to_yaml()
+
+        monkeypatch.setenv(name="KPOPS_KAFKA_BROKERS", value="env_broker")
+        kpops.generate(RESOURCE_PATH / "first-pipeline" / PIPELINE_YAML)
+        assert len(list(tmp_path.iterdir())) == 2 * len(pipeline)
+
+    def test_component_cache_field_default(self) -> None:
+        def create_component_class(default: str) -> type[PipelineComponent]:
+            class CachedComponent(PipelineComponent):
+                label: str = default
+
+            return CachedComponent
+
+        resolver = mock.MagicMock(DefaultsResolver, fingerprint="fingerprint")
+        component_data = {"name": "cached"}
+        key = ComponentCache.key(
+            create_component_class("first"), component_data, resolver
+        )
+        assert (
+            ComponentCache.key(
+                create_component_class("first"), component_data, resolver
+            )
+            == key
+        )
+        # a changed field default invalidates the cached values
+        assert (
+            ComponentCache.key(
+                create_component_class("second"), component_data, resolver
+            )
+            != key
+        )
+
+    def test_component_cache_referenced_env_var(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        monkeypatch.setenv(name="KPOPS_COMPONENT_CACHE", value=str(tmp_path))
+        monkeypatch.setenv(name="NAMESPACE", value="first-namespace")
+        pipeline = kpops.generate(
+            RESOURCE_PATH / "parallel-pipeline" / PIPELINE_YAML,
+            config=RESOURCE_PATH / "parallel-pipeline",
+        )
+        assert len(list(tmp_path.iterdir())) == len(pipeline)
+
+        # the defaults reference the environment variable
+        monkeypatch.setenv(name="NAMESPACE", value="second-namespace")
+        pipeline = kpops.generate(
+            RESOURCE_PATH / "parallel-pipeline" / PIPELINE_YAML,
+            config=RESOURCE_PATH / "parallel-pipeline",
+        )
+        assert len(list(tmp_path.iterdir())) == 2 * len(pipeline)
+        assert all(
+            component.namespace == "second-namespace"
+            for component in pipeline.components
+            if isinstance(component, KubernetesApp)
+        )
+
+    def test_component_cache_indirectly_referenced_env_var(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        monkeypatch.setenv(name="KPOPS_COMPONENT_CACHE", value=str(tmp_path))
+        monkeypatch.setenv(name="NAMESPACE", value="namespace")
+        # the defaults reference the config value, which references BROKER
+        monkeypatch.setenv(name="KPOPS_KAFKA_BROKERS", value="${BROKER}")
+        monkeypatch.setenv(name="BROKER", value="first-broker:9092")
+        pipeline = kpops.generate(
+            RESOURCE_PATH / "parallel-pipeline" / PIPELINE_YAML,
+            config=RESOURCE_PATH / "parallel-pipeline",
+        )
+        assert len(list(tmp_path.iterdir())) == len(pipeline)
+
+        monkeypatch.setenv(name="BROKER", value="second-broker:9092")
+        pipeline = kpops.generate(
+            RESOURCE_PATH / "parallel-pipeline" / PIPELINE_YAML,
+            config=RESOURCE_PATH / "parallel-pipeline",
+        )
+        assert len(list(tmp_path.iterdir())) == 2 * len(pipeline)
+        producer_app = pipeline.components[0]
+        assert isinstance(producer_app, ProducerApp)
+        assert producer_app.values.kafka.bootstrap_servers == "second-broker:9092"
+
     def test_nested_config_env_vars(self, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.setenv(
             name="KPOPS_SCHEMA_REGISTRY__URL", value="http://somename:1234"
@@ -887,6 +991,165 @@ class TestGenerate:
             mock.call("transaction-avro-producer-3"),
         ]
 
+    async def test_parallel_execution_graph_independent_branches(self) -> None:
+        pipeline = kpops.generate(
+            RESOURCE_PATH / "parallel-pipeline-branches" / PIPELINE_YAML,
+            config=RESOURCE_PATH / "parallel-pipeline-branches",
+        )
+
+        called_component = AsyncMock()
+
+        sleep_table_components = {
+            "slow-producer": 1,
+            "slow-processor": 0,
+            "fast-producer": 0,
+            "fast-processor": 0,
+        }
+
+        async def name_runner(component: PipelineComponent) -> None:
+            await asyncio.sleep(sleep_table_components[component.name])
+            await called_component(component.name)
+
+        await pipeline.build_execution_graph(name_runner)
+
+        # the fast branch must not wait for the slow producer
+        assert called_component.mock_calls == [
+            mock.call("fast-producer"),
+            mock.call("fast-processor"),
+            mock.call("slow-producer"),
+            mock.call("slow-processor"),
+        ]
+
+        called_component.reset_mock()
+        await pipeline.build_execution_graph(name_runner, reverse=True)
+
+        assert called_component.mock_calls == [
+            mock.call("slow-processor"),
+            mock.call("fast-processor"),
+            mock.call("fast-producer"),
+            mock.call("slow-producer"),
+        ]
+
+    async def test_parallel_execution_graph_failure(self) -> None:
+        pipeline = kpops.generate(
+            RESOURCE_PATH / "parallel-pipeline-branches" / PIPELINE_YAML,
+            config=RESOURCE_PATH / "parallel-pipeline-branches",
+        )
+
+        called_component = AsyncMock()
+
+        async def name_runner(component: PipelineComponent) -> None:
+            if component.name == "fast-producer":
+                msg = "boom"
+                raise ValueError(msg)
+            await asyncio.sleep(0.1)
+            await called_component(component.name)
+
+        with pytest.raises(ValueError, match="boom"):
+            await pipeline.build_execution_graph(name_runner)
+
+        # components that were already running are awaited, no new ones are started
+        assert called_component.mock_calls == [mock.call("slow-producer")]
+
+    async def test_parallel_execution_max_concurrency(self) -> None:
+        pipeline = kpops.generate(
+            RESOURCE_PATH / "parallel-pipeline" / PIPELINE_YAML,
+            config=RESOURCE_PATH / "parallel-pipeline",
+        )
+
+        running: set[str] = set()
+        max_running = 0
+
+        async def action(component: PipelineComponent) -> None:
+            nonlocal max_running
+            running.add(component.name)
+            max_running = max(max_running, len(running))
+            await asyncio.sleep(0.01)
+            running.remove(component.name)
+
+        await pipeline._run_action(
+            "Deploy", action, parallel=True, reverse=False, max_concurrency=2
+        )
+        assert max_running == 2
+
+    @pytest.mark.parametrize("max_concurrency", [2, None])
+    def test_parallel_manifest_order(
+        self, mocker: MockerFixture, max_concurrency: int | None
+    ) -> None:
+        pipeline = kpops.generate(
+            RESOURCE_PATH / "parallel-pipeline" / PIPELINE_YAML,
+            config=RESOURCE_PATH / "parallel-pipeline",
+        )
+        mocker.patch.object(pipeline, "prepare")
+        names = [component.name for component in pipeline.components]
+
+        running: set[str] = set()
+        max_running = 0
+
+        async def render(
+            component: PipelineComponent,
+        ) -> tuple[KubernetesManifest, ...]:
+            nonlocal max_running
+            running.add(component.name)
+            max_running = max(max_running, len(running))
+            # later components finish first
+            await asyncio.sleep(0.01 * (len(names) - names.index(component.name)))
+            running.remove(component.name)
+            return (
+                KubernetesManifest(
+                    api_version="v1",
+                    kind="Pod",
+                    metadata=ObjectMeta(name=component.name),
+                ),
+            )
+
+        resources = iterate_in_loop(
+            pipeline._render_manifests(
+                render, parallel=True, max_concurrency=max_concurrency
+            )
+        )
+        assert [resource[0].metadata.name for resource in resources] == names
+        assert max_running == (max_concurrency or len(names))
+
+    def test_manifest_streams_pipeline_steps(self, mocker: MockerFixture) -> None:
+        pipeline = kpops.generate(
+            RESOURCE_PATH / "parallel-pipeline" / PIPELINE_YAML,
+            config=RESOURCE_PATH / "parallel-pipeline",
+        )
+        prepare = mocker.patch.object(pipeline, "prepare")
+        rendered: list[str] = []
+
+        async def render(
+            component: PipelineComponent,
+        ) -> tuple[KubernetesManifest, ...]:
+            rendered.append(component.name)
+            return ()
+
+        resources = iterate_in_loop(pipeline._render_manifests(render, parallel=False))
+        next(resources)
+        prepare.assert_awaited_once()
+        assert rendered == [pipeline.components[0].name]
+        assert len(list(resources)) == len(pipeline.components) - 1
+
+    def test_manifest_sync_override(self) -> None:
+        class SyncManifestComponent(PipelineComponent):
+            def manifest_deploy(  # pyright: ignore[reportIncompatibleMethodOverride]
+                self,
+            ) -> tuple[KubernetesManifest, ...]:
+                return (
+                    KubernetesManifest(
+                        api_version="v1",
+                        kind="Pod",
+                        metadata=ObjectMeta(name=self.name),
+                    ),
+                )
+
+        pipeline = Pipeline()
+        pipeline.add(SyncManifestComponent(name="sync"))
+
+        resources = list(pipeline.manifest_deploy())
+        assert [resource[0].metadata.name for resource in resources] == ["sync"]
+
     def test_temp_trim_release_name(self) -> None:
         result = runner.invoke(
             app,
@@ -27,7 +27,7 @@ RESOURCE_PATH = Path(__file__).parent / "resources"
 class TestManifest:
     @pytest.fixture()
     def mock_execute(self, mocker: MockerFixture) -> MagicMock:
-        mock_execute = mocker.patch.object(Helm, "_Helm__execute")
+        mock_execute = mocker.patch.object(Helm, "_Helm__async_execute")
         mock_execute.return_value = ""  # Helm Template
         return mock_execute
 
@@ -35,9 +35,8 @@ class TestManifest:
     def mock_version(self, mocker: MockerFixture) -> MagicMock:
         return mocker.patch.object(
             Helm,
-            "version",
+            "get_version",
             return_value=Version(major=3, minor=12, patch=0),
-            new_callable=mocker.PropertyMock,
         )
 
     @pytest.fixture(autouse=True)
@@ -66,13 +65,14 @@ class TestManifest:
                 "--namespace",
                 "development-namespace",
                 "--values",
-                ANY,
+                "-",
                 "--version",
                 "3.6.1",
                 "--timeout",
                 "5m0s",
                 "--wait",
             ],
+            stdin=ANY,
         )
         assert result.exit_code == 0, result.stdout
 
@@ -100,7 +100,7 @@ class TestManifest:
                 "--namespace",
                 "development-namespace",
                 "--values",
-                ANY,
+                "-",
                 "--version",
                 "3.6.1",
                 "--timeout",
@@ -109,6 +109,7 @@ class TestManifest:
                 "--api-versions",
                 "2.1.1",
             ],
+            stdin=ANY,
         )
         assert result.exit_code == 0, result.stdout
 
@@ -0,0 +1,119 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from kpops.utils.concurrency import ConcurrencyLimiter, RunCache, iterate_in_loop
+
+
+async def run_concurrently(limiter: ConcurrencyLimiter, tasks: int) -> int:
+    running = 0
+    max_running = 0
+
+    async def task() -> None:
+        nonlocal running, max_running
+        async with limiter:
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(task() for _ in range(tasks)))
+    return max_running
+
+
+@pytest.mark.parametrize(("limit", "expected"), [(1, 1), (3, 3), (None, 10)])
+async def test_limit_concurrent_operations(limit: int | None, expected: int) -> None:
+    limiter = ConcurrencyLimiter(limit)
+    assert await run_concurrently(limiter, tasks=10) == expected
+
+
+def test_shared_across_event_loops() -> None:
+    limiter = ConcurrencyLimiter(2)
+    assert asyncio.run(run_concurrently(limiter, tasks=5)) == 2
+    assert asyncio.run(run_concurrently(limiter, tasks=5)) == 2
+
+
+async def test_run_cache_computes_once() -> None:
+    calls = 0
+
+    async def compute() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    cache = RunCache(compute)
+    assert await asyncio.gather(*(cache.get() for _ in range(5))) == [1] * 5
+    assert await cache.get() == 1
+
+    cache.invalidate()
+    assert await cache.get() == 2
+
+
+async def test_run_cache_does_not_cache_failure() -> None:
+    calls = 0
+
+    async def compute() -> int:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            msg = "boom"
+            raise ValueError(msg)
+        return calls
+
+    cache = RunCache(compute)
+    with pytest.raises(ValueError, match="boom"):
+        await cache.get()
+    assert await cache.get() == 2
+
+
+def test_run_cache_per_event_loop() -> None:
+    calls = 0
+
+    async def compute() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    cache = RunCache(compute)
+    assert asyncio.run(cache.get()) == 1
+    assert asyncio.run(cache.get()) == 2
+
+
+def test_iterate_in_loop() -> None:
+    loops: set[asyncio.AbstractEventLoop] = set()
+    closed = False
+
+    async def generate() -> AsyncIterator[int]:
+        nonlocal closed
+        try:
+            for i in range(3):
+                loops.add(asyncio.get_running_loop())
+                yield i
+        finally:
+            closed = True
+
+    iterator = iterate_in_loop(generate())
+    assert next(iterator) == 0
+    assert not closed
+    assert list(iterator) == [1, 2]
+    assert closed
+    assert len(loops) == 1
+
+
+def test_iterate_in_loop_stopped_early() -> None:
+    closed = False
+
+    async def generate() -> AsyncIterator[int]:
+        nonlocal closed
+        try:
+            while True:
+                yield 0
+        finally:
+            closed = True
+
+    iterator = iterate_in_loop(generate())
+    assert next(iterator) == 0
+    iterator.close()
+    assert closed
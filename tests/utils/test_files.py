@@ -0,0 +1,21 @@
+from pathlib import Path
+
+import pytest
+
+from kpops.utils.files import write_atomic
+
+
+def test_write_atomic(tmp_path: Path) -> None:
+    path = tmp_path / "cache" / "file.json"
+    write_atomic(path, "old")
+    write_atomic(path, "new")
+    assert path.read_text() == "new"
+    assert list(path.parent.iterdir()) == [path]
+
+
+def test_write_atomic_cleans_up_on_error(tmp_path: Path) -> None:
+    path = tmp_path / "directory"
+    path.mkdir()
+    with pytest.raises(OSError):
+        write_atomic(path, "content")
+    assert list(tmp_path.iterdir()) == [path]
@@ -1,11 +1,14 @@
 from typing import Any
 
 import pytest
+from pydantic import AliasChoices, BaseModel, Field
 
 from kpops.utils.pydantic import (
+    CamelCaseConfigModel,
     SerializeAsOptional,
     SerializeAsOptionalModel,
     exclude_by_value,
+    include_defaults,
     to_dash,
     to_dot,
     to_snake,
@@ -169,3 +172,74 @@ def test_serialize_as_optional() -> None:
         "optional_list": ["el"],
         "optional_dict": {"foo": "bar"},
     }
+
+
+class NestedModel(CamelCaseConfigModel):
+    image_tag: str = "latest"
+    labels: dict[str, str] = {}
+
+
+class Model(BaseModel):
+    name: str
+    prefix: str = "${pipeline.name}-"
+    from_: str | None = Field(
+        default=None,
+        serialization_alias="from",
+        validation_alias=AliasChoices("from", "from_"),
+    )
+    nested: NestedModel | None = None
+    required_nested: NestedModel
+    excluded: bool = Field(default=True, exclude=True)
+
+
+@pytest.mark.parametrize(
+    ("model_data", "expected"),
+    [
+        pytest.param(
+            {"name": "foo", "required_nested": {}},
+            {
+                "name": "foo",
+                "prefix": "${pipeline.name}-",
+                "from": None,
+                "nested": None,
+                "required_nested": {"imageTag": "latest", "labels": {}},
+            },
+            id="defaults",
+        ),
+        pytest.param(
+            {
+                "name": "foo",
+                "prefix": "",
+                "from_": "bar",
+                "nested": {"image_tag": "1.0.0"},
+                "required_nested": {"labels": {"app": "foo"}},
+            },
+            {
+                "name": "foo",
+                "prefix": "",
+                "from_": "bar",
+                "nested": {"image_tag": "1.0.0", "labels": {}},
+                "required_nested": {"imageTag": "latest", "labels": {"app": "foo"}},
+            },
+            id="aliases",
+        ),
+    ],
+)
+def test_include_defaults(model_data: dict[str, Any], expected: dict[str, Any]) -> None:
+    assert include_defaults(Model, model_data) == expected
+    assert Model.model_validate(model_data) == Model.model_validate(expected)
+
+
+def test_include_defaults_skips_missing_required_fields() -> None:
+    assert include_defaults(Model, {"name": "foo"}) == {
+        "name": "foo",
+        "prefix": "${pipeline.name}-",
+        "from": None,
+        "nested": None,
+    }
+
+
+def test_include_defaults_copies_defaults() -> None:
+    model_data = include_defaults(NestedModel, {})
+    model_data["labels"]["app"] = "foo"
+    assert include_defaults(NestedModel, {}) == {"imageTag": "latest", "labels": {}}
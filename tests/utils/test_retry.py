@@ -0,0 +1,45 @@
+from unittest.mock import MagicMock
+
+from pytest_mock import MockerFixture
+
+from kpops.config import RetryConfig
+from kpops.utils.retry import backoff_delays
+
+
+def test_backoff_delays_max_attempts() -> None:
+    delays = list(backoff_delays(RetryConfig(max_attempts=5, deadline=None)))
+    assert len(delays) == 4
+
+
+def test_backoff_delays_exponential_with_cap(mocker: MockerFixture) -> None:
+    # always pick the maximum delay
+    mocker.patch("kpops.utils.retry.random.uniform", side_effect=lambda _, cap: cap)
+    config = RetryConfig(max_attempts=6, backoff=1, max_backoff=5, deadline=None)
+    assert list(backoff_delays(config)) == [1, 2, 4, 5, 5]
+
+
+def test_backoff_delays_deadline(mocker: MockerFixture) -> None:
+    mocker.patch("kpops.utils.retry.random.uniform", side_effect=lambda _, cap: cap)
+    monotonic: MagicMock = mocker.patch("kpops.utils.retry.time.monotonic")
+    monotonic.return_value = 0
+    config = RetryConfig(max_attempts=10, backoff=1, max_backoff=10, deadline=6)
+
+    delays = backoff_delays(config)
+    assert next(delays) == 1
+    monotonic.return_value = 1
+    assert next(delays) == 2
+    monotonic.return_value = 3
+    # the next retry would start after the deadline
+    assert next(delays, None) is None
+
+
+def test_backoff_delays_deadline_from_call(mocker: MockerFixture) -> None:
+    mocker.patch("kpops.utils.retry.random.uniform", side_effect=lambda _, cap: cap)
+    monotonic: MagicMock = mocker.patch("kpops.utils.retry.time.monotonic")
+    monotonic.return_value = 0
+    config = RetryConfig(max_attempts=10, backoff=1, max_backoff=10, deadline=6)
+
+    delays = backoff_delays(config)
+    # the first attempt took most of the deadline
+    monotonic.return_value = 5.5
+    assert next(delays, None) is None
@@ -4,7 +4,7 @@ from typing import Any
 
 import pytest
 
-from kpops.utils.yaml import print_yaml, substitute_nested
+from kpops.utils.yaml import Substitution, print_yaml, substitute_nested
 
 
 @pytest.mark.parametrize(
@@ -27,6 +27,12 @@ from kpops.utils.yaml import print_yaml, substitute_nested
             "0, 0, 0, 0",
             id="chained-references",
         ),
+        pytest.param(
+            "${a.b}, ${c}, $${a.b}",
+            {"a.b": "${c}-b", "c": "${d.e}", "d.e": "e"},
+            "e-b, e, e-b",
+            id="dotted-names",
+        ),
     ],
 )
 def test_substitute_nested(
@@ -35,6 +41,58 @@ def test_substitute_nested(
     assert substitute_nested(input, **substitution) == expected
 
 
+@pytest.mark.parametrize(
+    ("substitution", "cycle"),
+    [
+        pytest.param({"a": "${a}"}, "a -> a", id="self-reference"),
+        pytest.param(
+            {"a": "${b}", "b": "${c}", "c": "${a}"}, "a -> b -> c -> a", id="cycle"
+        ),
+        pytest.param(
+            {"a": "${b}", "b": "${b_${c}}", "c": "d", "b_d": "${a}"},
+            "a -> b -> b_d -> a",
+            id="nested-placeholder",
+        ),
+    ],
+)
+def test_substitution_cycle(substitution: dict[str, str], cycle: str) -> None:
+    with pytest.raises(ValueError, match=f"infinite loop.*: {cycle}$"):
+        Substitution(substitution)
+
+
+def test_substitution_extend() -> None:
+    parent = Substitution(
+        {
+            "pipeline.name": "pipeline",
+            "topic": "${pipeline.name}-${component.name}",
+            "prefix": "${pipeline.name}-",
+        }
+    )
+    assert parent.substitute("${topic}") == "pipeline-${component.name}"
+
+    child = Substitution({"component.name": "foo"}, parent)
+    assert child.substitute("${topic}, ${prefix}") == "pipeline-foo, pipeline-"
+    assert (
+        Substitution({"component.name": "bar"}, parent).substitute("${topic}")
+        == "pipeline-bar"
+    )
+
+    references: set[str] = set()
+    child.substitute("${topic}", references)
+    assert references == {"topic", "pipeline.name", "component.name"}
+
+    # redefine a variable of the parent
+    child = Substitution({"pipeline.name": "other", "component.name": "foo"}, parent)
+    assert child.substitute("${topic}, ${prefix}") == "other-foo, other-"
+
+    # parent is unchanged
+    assert parent.variables == {
+        "pipeline.name": "pipeline",
+        "topic": "pipeline-${component.name}",
+        "prefix": "pipeline-",
+    }
+
+
 @pytest.mark.parametrize(
     ("data", "expected_stdout"),
     [